@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+
+import argparse
+import importlib
+import itertools
+import json
+import os
+import sqlite3
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import pandas as pd
+
+###times every EDA chart function across a grid of date spans, frequencies,
+###centers and filters against a fixed database, run from the repository root:
+###    python -m benchmarks.bench_eda --db benchmarks/data/PaceDashboard.db --save-baseline
+###    python -m benchmarks.bench_eda --db benchmarks/data/PaceDashboard.db
+### each case is run with cold caches, the median time of --repeat runs is
+### reported and the peak memory of one more run under tracemalloc. With a
+### baseline the run exits with 1 if any case is slower, or peaks higher,
+### than the baseline by more than the thresholds. Baselines are machine and
+### database specific, so they are not committed.
+
+spans = {"6m": 6, "2y": 24, "5y": 60}
+freqs = ["MS", "QS"]
+centers = ["all", "Providence"]
+utl_types = ["acute", "er_only", "skilled"]
+# filter column and amount, the first filter dropdown of the utilization EDA
+utl_filters = [(None, "5"), ("dow", "all"), ("facility", "5")]
+utl_graphs = {
+    "update_visit_graph": ["admission_date", "discharge_date"],
+    "update_los_graph": [None],
+    "update_readmit_graph": [None],
+}
+
+
+def argparser():
+    """
+    Adds arguments to the benchmark
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--db", metavar="DB_PATH", help="PaceDashboard.db to benchmark against")
+    parser.add_argument("--agg-db", metavar="DB_PATH", help="agg.db to benchmark against")
+    parser.add_argument("--end-date", metavar="YYYY-MM-DD", help="defaults to the last enrollment date")
+    parser.add_argument("--spans", nargs="+", default=list(spans), choices=list(spans))
+    parser.add_argument("--repeat", metavar="REPEAT", type=int, default=3)
+    parser.add_argument("--only", metavar="TEXT", help="only run cases whose name contains TEXT")
+    parser.add_argument("--baseline", metavar="PATH", default="benchmarks/eda_baseline.json")
+    parser.add_argument("--save-baseline", action="store_true", help="write the results as the baseline")
+    parser.add_argument(
+        "--time-threshold", metavar="PERCENT", type=float, default=25, help="allowed slowdown"
+    )
+    parser.add_argument(
+        "--memory-threshold", metavar="PERCENT", type=float, default=25, help="allowed peak growth"
+    )
+    parser.add_argument(
+        "--min-seconds",
+        metavar="SECONDS",
+        type=float,
+        default=0.01,
+        help="cases faster than this in both runs are not compared on time",
+    )
+    return parser
+
+
+def last_enrollment_date(db_path):
+    """
+    Returns the most recent enrollment date, the grid's end date for a database
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT MAX(enrollment_date) FROM enrollment").fetchone()[0][:10]
+    finally:
+        conn.close()
+
+
+def date_range(end_date, months):
+    """
+    Returns the start and end date of a span in the MM/DD/YYYY format
+    the date inputs use
+    """
+    end = pd.Timestamp(end_date) + pd.offsets.MonthEnd(0)
+    start = end - pd.DateOffset(months=months) + pd.Timedelta(days=1)
+    return start.strftime("%m/%d/%Y"), end.strftime("%m/%d/%Y")
+
+
+def cases(end_date, span_names):
+    """
+    Builds the parameter grid of every chart function
+
+    Returns:
+        list: tuples of case name and a function that takes no arguments
+    """
+    helpers = importlib.import_module("src.pacedash.helper_functions")
+    enrollment = importlib.import_module("src.pacedash.enrollment_eda_utils")
+    demographics = importlib.import_module("src.pacedash.demographics_eda_utils")
+    incidents = importlib.import_module("src.pacedash.incidents_eda_utils")
+    utilization = importlib.import_module("src.pacedash.utilization_eda_utils")
+
+    grid = []
+
+    def add(name, func, *args):
+        grid.append((name, lambda: func(*args)))
+
+    for span, freq, center in itertools.product(span_names, freqs, centers):
+        start, end = date_range(end_date, spans[span])
+        # the utilization and incidents callbacks snap the dates to the period
+        snapped = helpers.update_dates(start, end, freq)
+        params = f"{span},{freq},{center}"
+
+        for name, func in enrollment.graph_choice.items():
+            if func is not None:
+                add(f"enrollment.{name}[{params}]", func, start, end, freq, center)
+
+        if freq == freqs[0]:
+            # demographics charts do not take a frequency
+            for name, func in demographics.chart_functions.items():
+                add(f"demographics.{name}[{span},{center}]", func, start, end, center)
+
+        for incident, cols in incidents.drop_downs.items():
+            for remove_outliers in (False, True):
+                add(
+                    f"incidents.update_trending_graph[{incident},{params},outliers={not remove_outliers}]",
+                    incidents.update_trending_graph,
+                    incident,
+                    *snapped,
+                    freq,
+                    "pmpm",
+                    center,
+                    remove_outliers,
+                )
+            add(
+                f"incidents.update_graph[{incident},{cols[0]},{params}]",
+                incidents.update_graph,
+                incident,
+                *snapped,
+                freq,
+                cols[0],
+                None,
+                "5",
+                center,
+                False,
+            )
+
+        for utl_type, (filter_col, amnt) in itertools.product(utl_types, utl_filters):
+            for graph, date_types in utl_graphs.items():
+                for date_type in date_types:
+                    args = [utl_type] + ([date_type] if date_type else []) + [filter_col, amnt]
+                    label = ",".join(str(arg) for arg in args)
+                    add(
+                        f"utilization.{graph}[{label},{params}]",
+                        getattr(utilization, graph),
+                        *snapped,
+                        *args,
+                        freq,
+                        center,
+                        "bar",
+                        None,
+                        None,
+                    )
+    return grid
+
+
+def measure(func, repeat, clear_caches):
+    """
+    Runs a case with cold caches
+
+    Returns:
+        dict: median seconds and peak bytes allocated
+    """
+    seconds = []
+    for _ in range(repeat):
+        clear_caches()
+        start = time.perf_counter()
+        func()
+        seconds.append(time.perf_counter() - start)
+
+    clear_caches()
+    tracemalloc.start()
+    try:
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {"seconds": round(statistics.median(seconds), 5), "peak_bytes": peak}
+
+
+def compare(results, baseline, args):
+    """
+    Compares results to the baseline
+
+    Returns:
+        list: lines describing each regression
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None or "error" in base:
+            continue
+        if "error" in result:
+            regressions.append(f"{name}: {result['error']}")
+            continue
+        slowest = max(result["seconds"], base["seconds"])
+        if slowest >= args.min_seconds and result["seconds"] > base["seconds"] * (
+            1 + args.time_threshold / 100
+        ):
+            regressions.append(
+                f"{name}: {base['seconds']:.4f}s -> {result['seconds']:.4f}s "
+                f"(+{result['seconds'] / base['seconds'] - 1:.0%})"
+            )
+        if result["peak_bytes"] > base["peak_bytes"] * (1 + args.memory_threshold / 100):
+            regressions.append(
+                f"{name}: peak {base['peak_bytes'] / 1e6:.1f}MB -> {result['peak_bytes'] / 1e6:.1f}MB "
+                f"(+{result['peak_bytes'] / base['peak_bytes'] - 1:.0%})"
+            )
+    return regressions
+
+
+def main():
+    """
+    Runs every case, prints the timings and compares them to the baseline
+    """
+    args = argparser().parse_args()
+    # settings.py reads the database paths when the package is imported
+    if args.db:
+        os.environ["PACEDASH_DB"] = args.db
+    if args.agg_db:
+        os.environ["PACEDASH_AGG_DB"] = args.agg_db
+
+    settings = importlib.import_module("src.pacedash.settings")
+    clear_caches = importlib.import_module("src.pacedash.cache_utils").clear_caches
+    end_date = args.end_date or last_enrollment_date(settings.db_filepath)
+
+    results = {}
+    for name, func in cases(end_date, args.spans):
+        if args.only and args.only not in name:
+            continue
+        try:
+            results[name] = measure(func, args.repeat, clear_caches)
+        except Exception as e:
+            results[name] = {"error": f"{type(e).__name__}: {e}"}
+        result = results[name]
+        if "error" in result:
+            print(f"{'ERROR':>10}  {'':>9}  {name}  {result['error']}")
+        else:
+            print(f"{result['seconds'] * 1000:>8.1f}ms  {result['peak_bytes'] / 1e6:>7.1f}MB  {name}")
+
+    run = {"db": settings.db_filepath, "end_date": end_date, "cases": results}
+    baseline_path = Path(args.baseline)
+    if args.save_baseline:
+        baseline_path.write_text(json.dumps(run, indent=2))
+        print(f"Saved {len(results)} cases to {baseline_path}")
+        return
+
+    if not baseline_path.exists():
+        print(f"No baseline at {baseline_path}, run with --save-baseline first")
+        return
+
+    baseline = json.loads(baseline_path.read_text())
+    if baseline.get("end_date") != end_date:
+        print(f"Baseline end date {baseline.get('end_date')} does not match {end_date}")
+    regressions = compare(results, baseline["cases"], args)
+    missing = len([name for name in results if name not in baseline["cases"]])
+    print(f"{len(results)} cases, {missing} not in the baseline, {len(regressions)} regressions")
+    for line in regressions:
+        print(f"  {line}")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
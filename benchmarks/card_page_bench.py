@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+
+import argparse
+import importlib
+import json
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import plotly
+
+from src.pacedash.helper_functions import card_periods, card_value, card_values
+from src.pacedash.cache_utils import clear_caches
+
+###compares filling an indicator page's cards one callback per card
+###against the single batched callback, run from the repository root:
+###    python -m benchmarks.card_page_bench --page enrollment
+### time to interactive is the time until the last card's response body
+### is ready, per card requests are sent 6 at a time like a browser would
+### most card values come from paceutils, which opens its own connection
+### for each query in both modes, so the difference is mostly the periods,
+### requests and payloads saved rather than connection reuse
+
+
+def argparser():
+    """
+    Adds arguments to the benchmark
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--page",
+        metavar="PAGE",
+        default="enrollment",
+        choices=[
+            "enrollment",
+            "demographics",
+            "inpatient",
+            "incidents",
+            "nursing_facilities",
+            "operations",
+        ],
+    )
+    parser.add_argument("--time-range", metavar="TIME_RANGE", default="month_td")
+    parser.add_argument("--repeat", metavar="REPEAT", type=int, default=5)
+    parser.add_argument("--browser-connections", metavar="N", type=int, default=6)
+    return parser
+
+
+def serialize(value):
+    """
+    Serializes a callback return value the same way dash does
+
+    Args:
+        value: callback return value
+
+    Returns:
+        int: length of the response body
+    """
+    return len(json.dumps({"response": {"props": {"children": value}}}, cls=plotly.utils.PlotlyJSONEncoder))
+
+
+def per_card_request(time_range, card):
+    """
+    Fills one card the way the old per card callbacks did, resolving
+    the period and checking out connections on every request
+    """
+    if callable(card):
+        return serialize(card(card_periods(time_range)[0]))
+    return serialize(card_value(time_range, **card))
+
+
+def per_card(page, time_range, connections):
+    """
+    Fills every card with one request per card
+
+    Returns:
+        tuple: seconds until the last card is ready, bytes sent
+    """
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=connections) as pool:
+        sizes = list(
+            pool.map(lambda card: per_card_request(time_range, card), page.cards.values())
+        )
+    return time.perf_counter() - start, sum(sizes)
+
+
+def batched(page, time_range, connections):
+    """
+    Fills every card with the page's single batched callback
+
+    Returns:
+        tuple: seconds until the cards are ready, bytes sent
+    """
+    start = time.perf_counter()
+    size = serialize(page.card_rows(card_values(time_range, page.cards)))
+    return time.perf_counter() - start, size
+
+
+def run(mode, page, args):
+    """
+    Times a mode with cold caches and with warm caches
+
+    Returns:
+        dict: median cold seconds, median warm seconds, response bytes
+    """
+    cold, warm = [], []
+    for _ in range(args.repeat):
+        clear_caches()
+        seconds, size = mode(page, args.time_range, args.browser_connections)
+        cold.append(seconds)
+        seconds, size = mode(page, args.time_range, args.browser_connections)
+        warm.append(seconds)
+    return {
+        "cold_seconds": round(statistics.median(cold), 4),
+        "warm_seconds": round(statistics.median(warm), 4),
+        "bytes": size,
+    }
+
+
+def main():
+    """
+    Prints the per card and batched timings for a page
+    """
+    args = argparser().parse_args()
+    page = importlib.import_module(f"src.pacedash.pages.{args.page}")
+
+    results = {
+        "page": args.page,
+        "cards": len(page.cards),
+        "time_range": args.time_range,
+        "per_card": run(per_card, page, args),
+        "batched": run(batched, page, args),
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import statistics
+import time
+
+import numpy as np
+import pandas as pd
+import plotly
+
+from src.pacedash import figure_utils
+from src.pacedash.helper_functions import (
+    build_bar_layout,
+    build_scatter_layout,
+    create_bar_graph,
+    create_line_graph,
+    sparkline,
+)
+from src.pacedash.figure_utils import figure_trace, figure_layout
+
+###compares building figures with plotly.graph_objs (validated) against
+###the plain dict figure builder, run from the repository root:
+###    python -m benchmarks.figure_bench --points 36
+### each chart is built and serialized the way dash sends it
+
+
+def argparser():
+    """
+    Adds arguments to the benchmark
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--points", metavar="N", type=int, default=36)
+    parser.add_argument("--traces", metavar="N", type=int, default=6)
+    parser.add_argument("--repeat", metavar="REPEAT", type=int, default=200)
+    return parser
+
+
+def plot_df(points):
+    """
+    Creates a two column dataframe of months and values like the agg tables
+    """
+    return pd.DataFrame(
+        {
+            "month": pd.date_range("2017-01-01", periods=points, freq="MS"),
+            "value": np.random.RandomState(0).randint(50, 250, points),
+        }
+    )
+
+
+def multi_trace(df, traces, trace_type):
+    """
+    Creates a figure with several traces, like the utilization EDA
+    """
+    x = df["month"].astype(str)
+    return dict(
+        data=[
+            figure_trace(
+                trace_type,
+                x=x,
+                y=df["value"] + i,
+                name=f"Trace {i}",
+                hoverinfo="x+y",
+                marker=dict(color="#00B760"),
+            )
+            for i in range(traces)
+        ],
+        layout=build_bar_layout("Utilization Visits", legend=dict(orientation="h")),
+    )
+
+
+def charts(args):
+    """
+    Returns the chart builders to compare, each takes no arguments
+    """
+    df = plot_df(args.points)
+    return {
+        "line_graph": lambda: create_line_graph(df.copy(), "Census", "Month", "Census"),
+        "bar_graph": lambda: create_bar_graph(df.copy(), "Census", "Quarter", "Census"),
+        "sparkline": lambda: sparkline(df),
+        "bar_layout": lambda: build_bar_layout("Title", x_ticks=df["month"].astype(str)),
+        "scatter_layout": lambda: build_scatter_layout("Title", 10, 200),
+        "multi_scatter": lambda: multi_trace(df, args.traces, "scatter"),
+        "multi_bar": lambda: multi_trace(df, args.traces, "bar"),
+        "histogram": lambda: dict(
+            data=[figure_trace("histogram", x=df["value"], opacity=0.75)],
+            layout=figure_layout(title=""),
+        ),
+    }
+
+
+def time_chart(build, repeat):
+    """
+    Returns the median seconds to build and serialize a chart
+    """
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        json.dumps(build(), cls=plotly.utils.PlotlyJSONEncoder)
+        seconds.append(time.perf_counter() - start)
+    return statistics.median(seconds)
+
+
+def main():
+    """
+    Prints the validated and plain dict timings for each chart
+    """
+    args = argparser().parse_args()
+    results = {}
+    for name, build in charts(args).items():
+        figure_utils.validate_figures = True
+        validated = time_chart(build, args.repeat)
+        figure_utils.validate_figures = False
+        plain = time_chart(build, args.repeat)
+        results[name] = {
+            "graph_objs_ms": round(validated * 1000, 3),
+            "dict_ms": round(plain * 1000, 3),
+            "speedup": round(validated / plain, 1),
+        }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,434 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import random
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from datetime import date, timedelta
+from http.cookiejar import CookieJar
+
+###replays user sessions against a running dashboard, run from the
+###repository root:
+###    python -m benchmarks.load_test --url http://127.0.0.1:8041 --users 20 --duration 120
+### or let it start run_cherry.py for each thread count and compare them:
+###    python -m benchmarks.load_test --start-server --threads 50 100 250 --users 40
+### a session logs in, visits the indicator pages switching time ranges
+### and drives the utilization and incidents EDA dropdowns, posting the
+### same /_dash-update-component payloads the browser does, built from the
+### app's /_dash-dependencies. Throughput, latency percentiles and the
+### error rate are reported overall and per callback output.
+
+indicator_pages = {
+    "/enrollment": "enrollment-cards.children",
+    "/demographics": "demographics-cards.children",
+    "/incidents": "incidents-cards.children",
+    "/inpatient": "inpatient-cards.children",
+    "/nursing-facility": "nfs-cards.children",
+    "/teams": "team-table.children",
+}
+time_ranges = ["month_td", "last_month", "quarter_td", "last_quarter"]
+route_outputs = ["dash-container.children", "navbar.children", "logout.children"]
+
+utl_choices = {
+    "data-source.value": ["acute", "psych", "er_only", "custodial", "respite", "skilled"],
+    "graph-one-stat.value": ["admission_date", "discharge_date", "alos", "30-day"],
+    "graph-two-stat.value": ["admission_date", "discharge_date", "alos", "30-day"],
+    "utl-filter.value": [None, "facility", "dow", "w_six_months"],
+    "utl-filter-amnt.value": ["5", "10", "all"],
+    "freq-radio.value": ["MS", "QS"],
+    "center-drop.value": ["all", "Providence", "Westerly", "Woonsocket"],
+    "graph_type.value": ["bar", "line"],
+}
+utl_outputs = [
+    "utl-filter.options",
+    "filter-values.options",
+    "additional-filter.options",
+    "utl-graph-one.figure",
+    "utl-graph-two.figure",
+]
+
+incident_choices = {
+    "incident-drop.value": ["falls", "med_errors", "burns", "infections", "wounds"],
+    "graph-one-drop.value": [None, "location", "severity", "contributing_factors"],
+    "graph-one-radio.value": ["5", "10"],
+    "freq-radio.value": ["MS", "QS"],
+    "center-drop.value": ["all", "Providence", "Westerly", "Woonsocket"],
+    "outlier-radio.value": [False, True],
+}
+incident_outputs = ["graph-one-drop.options", "incident-options.options", "graph-one.figure"]
+
+
+def argparser():
+    """
+    Adds arguments to the load test
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", metavar="URL", default="http://127.0.0.1:8041")
+    parser.add_argument("--username", metavar="USER", default="loadtest")
+    parser.add_argument("--password", metavar="PASSWORD", default="loadtest")
+    parser.add_argument("--users", metavar="N", type=int, default=10, help="concurrent sessions")
+    parser.add_argument("--duration", metavar="SECONDS", type=float, default=60)
+    parser.add_argument("--ramp", metavar="SECONDS", type=float, default=5, help="time to start every user")
+    parser.add_argument(
+        "--think", metavar="SECONDS", type=float, default=1.0, help="most time a user waits between steps"
+    )
+    parser.add_argument("--eda-steps", metavar="N", type=int, default=4, help="dropdown changes per EDA page")
+    parser.add_argument("--timeout", metavar="SECONDS", type=float, default=60)
+    parser.add_argument("--seed", metavar="SEED", type=int, default=0)
+    parser.add_argument("--json", metavar="PATH", help="also write the results to a file")
+    parser.add_argument(
+        "--start-server", action="store_true", help="start run_cherry.py for each --threads value"
+    )
+    parser.add_argument("--threads", metavar="N", type=int, nargs="+", default=[250])
+    parser.add_argument("--queue-size", metavar="N", type=int, default=50)
+    return parser
+
+
+class Recorder:
+    """
+    Collects the latency and outcome of every request
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = []
+        self.sessions = 0
+        self.login_failures = 0
+
+    def add(self, label, seconds, ok, size):
+        with self.lock:
+            self.requests.append((label, seconds, ok, size))
+
+    def login_failed(self):
+        with self.lock:
+            self.login_failures += 1
+
+    def session_done(self):
+        with self.lock:
+            self.sessions += 1
+
+
+def percentiles(seconds):
+    """
+    Returns latency percentiles in milliseconds
+    """
+    seconds = sorted(seconds)
+
+    def pick(p):
+        return round(seconds[min(int(len(seconds) * p), len(seconds) - 1)] * 1000, 1)
+
+    return {
+        "p50_ms": pick(0.5),
+        "p90_ms": pick(0.9),
+        "p95_ms": pick(0.95),
+        "p99_ms": pick(0.99),
+        "max_ms": round(seconds[-1] * 1000, 1),
+        "mean_ms": round(statistics.mean(seconds) * 1000, 1),
+    }
+
+
+def summary(recorder, elapsed):
+    """
+    Summarizes the recorded requests
+
+    Returns:
+        dict: overall and per output throughput, latency and error rate
+    """
+    def stats(rows):
+        errors = sum(1 for row in rows if not row[2])
+        return dict(
+            requests=len(rows),
+            errors=errors,
+            error_rate=round(errors / len(rows), 4),
+            throughput_rps=round(len(rows) / elapsed, 2),
+            kb_per_request=round(statistics.mean(row[3] for row in rows) / 1000, 1),
+            **percentiles([row[1] for row in rows]),
+        )
+
+    rows = recorder.requests
+    if not rows:
+        return {"requests": 0}
+    by_label = {}
+    for row in rows:
+        by_label.setdefault(row[0], []).append(row)
+    return {
+        "seconds": round(elapsed, 1),
+        "sessions": recorder.sessions,
+        "login_failures": recorder.login_failures,
+        "overall": stats(rows),
+        "callbacks": {
+            label: stats(label_rows)
+            for label, label_rows in sorted(by_label.items(), key=lambda item: -len(item[1]))
+        },
+    }
+
+
+class Session:
+    """
+    One simulated user with its own cookies and component values
+
+    Args:
+        base_url(str): dashboard address
+        dependencies(dict): callback output to its inputs and state
+        recorder(Recorder): where request timings are kept
+        args: parsed arguments
+        rng(random.Random): random choices of this user
+    """
+
+    def __init__(self, base_url, dependencies, recorder, args, rng):
+        self.base_url = base_url
+        self.dependencies = dependencies
+        self.recorder = recorder
+        self.args = args
+        self.rng = rng
+        self.opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(CookieJar()))
+        today = date.today()
+        self.values = {
+            "start_date.value": (today - timedelta(days=365)).strftime("%m/%d/%Y"),
+            "end_date.value": today.strftime("%m/%d/%Y"),
+            "time_range.value": "month_td",
+            "interval-component.n_intervals": 0,
+        }
+
+    def request(self, label, path, body=None):
+        """
+        Sends one request and records its latency
+
+        Returns:
+            bytes: response body, None if the request failed
+        """
+        headers = {"Accept-Encoding": "gzip"}
+        data = None
+        if body is not None:
+            data = json.dumps(body).encode()
+            headers["Content-Type"] = "application/json"
+        req = urllib.request.Request(self.base_url + path, data=data, headers=headers)
+        start = time.perf_counter()
+        try:
+            with self.opener.open(req, timeout=self.args.timeout) as response:
+                content = response.read()
+            ok = True
+        except urllib.error.HTTPError as e:
+            content = e.read()
+            ok = False
+        except OSError:
+            content = b""
+            ok = False
+        self.recorder.add(label, time.perf_counter() - start, ok, len(content))
+        return content if ok else None
+
+    def callback(self, output):
+        """
+        Posts the payload the browser sends for a callback output,
+        a 204 from PreventUpdate counts as a success
+        """
+        dependency = self.dependencies.get(output)
+        if dependency is None:
+            return None
+
+        def props(items):
+            return [
+                {
+                    "id": item["id"],
+                    "property": item["property"],
+                    "value": self.values.get(f"{item['id']}.{item['property']}"),
+                }
+                for item in items
+            ]
+
+        body = {
+            "output": output,
+            "inputs": props(dependency["inputs"]),
+            "state": props(dependency["state"]),
+        }
+        return self.request(output, "/_dash-update-component", body)
+
+    def think(self):
+        time.sleep(self.rng.uniform(0, self.args.think))
+
+    def visit(self, pathname):
+        self.values["url.pathname"] = pathname
+        for output in route_outputs:
+            self.callback(output)
+
+    def login(self):
+        self.request("GET /", "/")
+        self.request("GET /_dash-layout", "/_dash-layout")
+        self.request("GET /_dash-dependencies", "/_dash-dependencies")
+        self.visit("/login")
+        self.values.update(
+            {
+                "uname-box.value": self.args.username,
+                "pwd-box.value": self.args.password,
+                "login-button.n_clicks": 1,
+                "pwd-box.n_submit": None,
+            }
+        )
+        content = self.callback("url_login.pathname")
+        if content is None or b"/enrollment" not in content:
+            self.recorder.login_failed()
+        self.callback("output-state.children")
+
+    def indicator_pages(self):
+        for pathname, cards in self.rng.sample(list(indicator_pages.items()), len(indicator_pages)):
+            self.visit(pathname)
+            for time_range in ["month_td"] + self.rng.sample(time_ranges[1:], 2):
+                self.values["time_range.value"] = time_range
+                self.callback(cards)
+                self.think()
+
+    def eda_page(self, pathname, choices, outputs):
+        self.visit(pathname)
+        for _ in range(self.args.eda_steps):
+            prop = self.rng.choice(list(choices))
+            self.values[prop] = self.rng.choice(choices[prop])
+            for output in outputs:
+                self.callback(output)
+            self.think()
+
+    def run(self):
+        """
+        Runs one full session
+        """
+        self.login()
+        self.indicator_pages()
+        self.eda_page("/utilization-eda", utl_choices, utl_outputs)
+        self.eda_page("/incidents-eda", incident_choices, incident_outputs)
+        self.request("GET /logout", "/logout")
+        self.recorder.session_done()
+
+
+def load_dependencies(base_url, timeout):
+    """
+    Reads the registered callbacks of the app
+
+    Returns:
+        dict: output to its inputs and state
+    """
+    with urllib.request.urlopen(base_url + "/_dash-dependencies", timeout=timeout) as response:
+        dependencies = json.loads(response.read())
+    return {dependency["output"]: dependency for dependency in dependencies}
+
+
+def run_load(args):
+    """
+    Runs sessions from --users threads until --duration has passed
+
+    Returns:
+        dict: summary of the requests
+    """
+    dependencies = load_dependencies(args.url, args.timeout)
+    expected = (
+        list(indicator_pages.values()) + route_outputs + utl_outputs + incident_outputs
+        + ["url_login.pathname"]
+    )
+    missing = [output for output in expected if output not in dependencies]
+    if missing:
+        print(f"Callbacks not registered, skipped: {', '.join(missing)}")
+
+    recorder = Recorder()
+    stop_at = time.perf_counter() + args.duration
+
+    def user(index):
+        time.sleep(args.ramp * index / max(args.users, 1))
+        rng = random.Random(args.seed * 1000 + index)
+        while time.perf_counter() < stop_at:
+            Session(args.url, dependencies, recorder, args, rng).run()
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=user, args=(i,), daemon=True) for i in range(args.users)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return summary(recorder, time.perf_counter() - start)
+
+
+def wait_for_server(url, timeout=120):
+    """
+    Waits until the server answers, the app imports every page at startup
+    """
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(url + "/_dash-dependencies", timeout=5).close()
+            return
+        except OSError:
+            time.sleep(1)
+    raise TimeoutError(f"{url} did not start within {timeout} seconds")
+
+
+def print_summary(results):
+    """
+    Prints the overall numbers and the slowest callbacks
+    """
+    overall = results.get("overall")
+    if overall is None:
+        print("No requests were made")
+        return
+    print(
+        f"{results['sessions']} sessions, {overall['requests']} requests in {results['seconds']}s, "
+        f"{overall['throughput_rps']} req/s, {overall['error_rate']:.1%} errors, "
+        f"p50 {overall['p50_ms']}ms p95 {overall['p95_ms']}ms p99 {overall['p99_ms']}ms"
+    )
+    if results["login_failures"]:
+        print(f"{results['login_failures']} logins failed, check --username and --password")
+    callbacks = sorted(results["callbacks"].items(), key=lambda item: -item[1]["p95_ms"])
+    for label, stats in callbacks[:15]:
+        print(
+            f"  {stats['p95_ms']:>9}ms p95 {stats['p50_ms']:>9}ms p50 "
+            f"{stats['requests']:>6} req {stats['errors']:>4} err  {label}"
+        )
+
+
+def main():
+    """
+    Runs the load test against a running server, or against run_cherry.py
+    started with each thread count
+    """
+    args = argparser().parse_args()
+    args.url = args.url.rstrip("/")
+    runs = {}
+
+    if not args.start_server:
+        runs["server"] = run_load(args)
+        print_summary(runs["server"])
+    else:
+        port = args.url.rsplit(":", 1)[-1]
+        for threads in args.threads:
+            server = subprocess.Popen(
+                [
+                    sys.executable,
+                    "run_cherry.py",
+                    "--host",
+                    "127.0.0.1",
+                    "--port",
+                    port,
+                    "--threads",
+                    str(threads),
+                    "--queue-size",
+                    str(args.queue_size),
+                ]
+            )
+            try:
+                wait_for_server(args.url)
+                print(f"threads={threads} queue_size={args.queue_size}")
+                runs[f"threads={threads}"] = run_load(args)
+                print_summary(runs[f"threads={threads}"])
+            finally:
+                server.terminate()
+                server.wait()
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(runs, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
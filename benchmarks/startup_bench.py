@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+
+import argparse
+import importlib
+import json
+import time
+
+###measures dashboard startup, run from the repository root:
+###    python -m benchmarks.startup_bench
+### reports the time to import the app, the time each page module took
+### to import (registering its callbacks) and the time each page's layout
+### takes to build, which is now paid on the page's first visit instead
+### of at startup
+
+
+def argparser():
+    """
+    Adds arguments to the benchmark
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--top", metavar="N", type=int, default=0, help="only show the N slowest pages")
+    return parser
+
+
+def main():
+    """
+    Prints startup and per page timings
+    """
+    args = argparser().parse_args()
+
+    start = time.perf_counter()
+    importlib.import_module("src.pacedash.app")
+    app_seconds = time.perf_counter() - start
+
+    index = importlib.import_module("src.pacedash.index")
+
+    layout_seconds = {}
+    for name, module in index.pages.items():
+        start = time.perf_counter()
+        module.build_layout()
+        layout_seconds[name] = time.perf_counter() - start
+
+    pages = sorted(
+        index.page_names, key=lambda name: index.page_import_seconds[name], reverse=True
+    )
+    if args.top:
+        pages = pages[: args.top]
+
+    results = {
+        "app_import_seconds": round(app_seconds, 4),
+        "page_import_seconds_total": round(sum(index.page_import_seconds.values()), 4),
+        "deferred_layout_seconds_total": round(sum(layout_seconds.values()), 4),
+        "pages": [
+            {
+                "page": name,
+                "import_seconds": round(index.page_import_seconds[name], 4),
+                "layout_seconds": round(layout_seconds[name], 4),
+            }
+            for name in pages
+        ],
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,487 @@
+#!/usr/bin/env python3
+
+import argparse
+import re
+import sqlite3
+import time
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+###creates seeded, schema compatible PaceDashboard.db and agg.db files for
+###scale testing, run from the repository root:
+###    python -m benchmarks.synthetic_db --participants 100000 --years 8
+### point the dashboard at them with the PACEDASH_DB and PACEDASH_AGG_DB
+### environment variables, see settings.py
+### the tables and columns are the ones the dashboard's own queries use,
+### including the team comparison queries in team_utils.py
+
+centers = ["Providence", "Westerly", "Woonsocket"]
+center_weights = [0.6, 0.2, 0.2]
+teams = ["Central", "East", "South", "North", "Westerly", "Woonsocket"]
+
+# visits per participant year and mean length of stay in days
+visit_tables = {
+    "acute": (0.6, 5),
+    "psych": (0.08, 12),
+    "er_only": (0.9, 0),
+    "custodial": (0.05, 150),
+    "respite": (0.1, 7),
+    "skilled": (0.15, 21),
+}
+
+# incidents per participant year
+incident_tables = {
+    "falls": 1.2,
+    "med_errors": 0.3,
+    "burns": 0.02,
+    "infections": 0.8,
+    "wounds": 0.4,
+}
+
+# text columns of each incident table, grouped on by the incidents EDA
+incident_cols = {
+    "falls": [
+        "location",
+        "location_details",
+        "activity_at_time_of_fall",
+        "assistance_at_time_of_fall",
+        "footwear",
+        "severity",
+        "following_treatment",
+        "contributing_factors",
+        "actions_taken",
+    ],
+    "med_errors": [
+        "location",
+        "severity",
+        "responsibility",
+        "error_type",
+        "contributing_factors",
+        "actions_taken",
+    ],
+    "burns": ["location", "burn_location", "burn_degree", "contributing_factors", "actions_taken"],
+    "infections": [
+        "infection_type",
+        "medication_prescribed",
+        "where_infection_was_acquired",
+        "infection_treated_by",
+    ],
+    "wounds": ["living_situation", "living_details", "day_center", "wound_type"],
+}
+
+# 0/1 columns of each incident table
+incident_flags = {
+    "falls": [
+        "clutter",
+        "disrepair",
+        "dme_not_in_use",
+        "found_on_floor",
+        "furniture",
+        "gait_device_non_compliance",
+        "needed_to_use_restroom",
+        "oxygentubing",
+        "poor_lighting",
+        "rugs",
+        "seatbelt_unbuckled",
+        "seatbelt_unbuckled_by_participant",
+        "transfer_without_assistance",
+        "uneven_pavement",
+        "wet_floor",
+        "body_pain",
+        "chest_pain",
+        "dizziness",
+        "fainted",
+        "headache",
+        "incontinence",
+        "increased_confusion",
+        "loss_of_balance",
+        "poor_vision",
+        "shortness_of_breath",
+        "weakness",
+        "dementia_factors",
+    ],
+    "wounds": ["pressure_ulcer", "burn"],
+}
+
+# dementia (F00-F03) and behavioral health (F2x) codes are what the
+# demographics EDA looks for, the rest are common chronic conditions
+icd10_codes = [
+    "F00", "F01.50", "F02.80", "F03.90", "F20.9", "F25.0", "F29",
+    "I10", "E11.9", "N18.3", "I50.9", "J44.9", "M17.0", "E78.5",
+    "I25.10", "G47.33", "K21.9", "M81.0", "E03.9", "H40.9",
+]
+
+races = ["White", "Black or African American", "Hispanic or Latino", "Asian", "Other Race"]
+languages = ["English", "Spanish", "Portuguese", "Cape Verdean Creole", "Khmer"]
+disenroll_types = ["Deceased", "Voluntary", "Involuntary"]
+disenroll_reasons = [
+    "Moved out of service area",
+    "Dissatisfied with care",
+    "Family decision",
+    "Nursing home placement",
+    "Other",
+]
+weekdays = np.array(["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"])
+
+
+def argparser():
+    """
+    Adds arguments to the generator
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--participants", metavar="N", type=int, default=2_000)
+    parser.add_argument("--years", metavar="YEARS", type=int, default=5)
+    parser.add_argument("--end-date", metavar="YYYY-MM-DD", default=str(date.today()))
+    parser.add_argument("--seed", metavar="SEED", type=int, default=0)
+    parser.add_argument(
+        "--visit-rate", metavar="X", type=float, default=1.0, help="multiplies every visit rate"
+    )
+    parser.add_argument(
+        "--incident-rate", metavar="X", type=float, default=1.0, help="multiplies every incident rate"
+    )
+    parser.add_argument("--dx-per-ppt", metavar="N", type=float, default=4.0)
+    parser.add_argument("--out-dir", metavar="DIR", default="benchmarks/data")
+    parser.add_argument("--chunk", metavar="N", type=int, default=100_000, help="participants per batch")
+    parser.add_argument(
+        "--no-prepare",
+        action="store_true",
+        help="skip the utilization cube and indexes a refresh would build",
+    )
+    return parser
+
+
+def day_strings(days, with_time=None):
+    """
+    Converts day numbers since the epoch to date strings
+
+    Args:
+        days: numpy array of day numbers
+        with_time: numpy array of fractions of a day, adds the time
+
+    Returns:
+        numpy array of str
+    """
+    if with_time is None:
+        return days.astype("datetime64[D]").astype(str)
+    seconds = (days * 86400 + (with_time * 86400).astype(int)).astype("datetime64[s]")
+    return np.char.replace(seconds.astype(str), "T", " ")
+
+
+def insert(conn, table, columns):
+    """
+    Creates the table if needed and inserts the columns
+
+    Args:
+        conn: sqlite3 connection
+        table(str): table name
+        columns(dict): column name to numpy array, all the same length
+    """
+    names = list(columns)
+    types = [
+        "INTEGER" if columns[name].dtype.kind in "biu" else "REAL" if columns[name].dtype.kind == "f" else "TEXT"
+        for name in names
+    ]
+    conn.execute(
+        f"CREATE TABLE IF NOT EXISTS {table} "
+        f"({', '.join(f'{name} {col_type}' for name, col_type in zip(names, types))})"
+    )
+    values = [columns[name].tolist() for name in names]
+    # missing values are stored as NULL
+    values = [
+        [None if value in ("nan", "NaT", "") or value != value else value for value in col]
+        if columns[name].dtype.kind in "fUO"
+        else col
+        for name, col in zip(names, values)
+    ]
+    conn.executemany(
+        f"INSERT INTO {table} VALUES ({', '.join('?' * len(names))})", zip(*values)
+    )
+
+
+class Participants:
+    """
+    One batch of participants and their enrollment spans
+
+    Args:
+        rs: numpy RandomState
+        first_id(int): member_id of the first participant
+        size(int): number of participants
+        start(int): first day of the history, days since the epoch
+        end(int): last day of the history, days since the epoch
+    """
+
+    def __init__(self, rs, first_id, size, start, end):
+        self.member_id = np.arange(first_id, first_id + size)
+        # a share of participants enrolled before the history starts
+        self.enrollment = rs.randint(start - 730, end, size)
+        stay = rs.exponential(4 * 365, size).astype(int) + 30
+        self.disenrolled = self.enrollment + stay <= end
+        self.disenrollment = np.where(self.disenrolled, self.enrollment + stay, end)
+        self.center = rs.choice(centers, size, p=center_weights)
+
+    def years(self):
+        return (self.disenrollment - self.enrollment) / 365
+
+
+
+
+def participant_tables(conn, rs, ppts, dx_per_ppt):
+    """
+    Inserts the enrollment, centers, demographics, teams and dx rows
+    of a batch of participants
+    """
+    size = len(ppts.member_id)
+    disenroll_type = np.where(
+        ppts.disenrolled, rs.choice(disenroll_types, size, p=[0.6, 0.35, 0.05]), ""
+    )
+    insert(
+        conn,
+        "enrollment",
+        {
+            "member_id": ppts.member_id,
+            "enrollment_date": day_strings(ppts.enrollment),
+            "disenrollment_date": np.where(ppts.disenrolled, day_strings(ppts.disenrollment), ""),
+            "disenroll_type": disenroll_type,
+            "disenroll_reason": np.where(
+                disenroll_type == "Voluntary", rs.choice(disenroll_reasons, size), ""
+            ),
+            "center": ppts.center,
+        },
+    )
+    insert(conn, "centers", {"member_id": ppts.member_id, "center": ppts.center})
+    insert(
+        conn,
+        "demographics",
+        {
+            "member_id": ppts.member_id,
+            "dob": day_strings(ppts.enrollment - rs.randint(55 * 365, 95 * 365, size)),
+            "gender": rs.choice(["M", "F"], size, p=[0.3, 0.7]),
+            "race": rs.choice(races, size, p=[0.5, 0.15, 0.25, 0.05, 0.05]),
+            "language": rs.choice(languages, size, p=[0.7, 0.2, 0.05, 0.03, 0.02]),
+        },
+    )
+    insert(conn, "teams", {"member_id": ppts.member_id, "team": rs.choice(teams, size)})
+
+    counts = rs.poisson(dx_per_ppt, size)
+    insert(
+        conn,
+        "dx",
+        {
+            "member_id": np.repeat(ppts.member_id, counts),
+            "icd10": rs.choice(icd10_codes, counts.sum()),
+        },
+    )
+
+
+def events(rs, ppts, rate):
+    """
+    Draws event counts and days for a batch of participants
+
+    Args:
+        rs: numpy RandomState
+        ppts(Participants): batch of participants
+        rate(float): events per participant year
+
+    Returns:
+        tuple: index of the participant of each event, day of each event,
+            both sorted by participant and day
+    """
+    counts = rs.poisson(rate * ppts.years())
+    owner = np.repeat(np.arange(len(counts)), counts)
+    span = ppts.disenrollment[owner] - ppts.enrollment[owner]
+    days = ppts.enrollment[owner] + (rs.random_sample(len(owner)) * span).astype(int)
+    order = np.lexsort((days, owner))
+    return owner[order], days[order]
+
+
+def visit_table(conn, rs, ppts, table, rate, mean_los):
+    """
+    Inserts the visits of a batch of participants into a utilization table
+    """
+    owner, admission = events(rs, ppts, rate)
+    size = len(owner)
+    los = rs.poisson(mean_los, size) + (1 if mean_los else 0)
+    discharge = admission + los
+
+    previous = np.empty(size, dtype=float)
+    previous[:] = np.nan
+    same_member = np.r_[False, owner[1:] == owner[:-1]]
+    previous[same_member] = (admission[1:] - discharge[:-1])[same_member[1:]]
+
+    admit_reasons = {
+        "custodial": ["Custodial"],
+        "respite": ["Respite"],
+        "skilled": ["Skilled"],
+    }.get(table, ["Fall", "Pneumonia", "CHF", "UTI", "Sepsis", "COPD", "Other"])
+    columns = {
+        "member_id": ppts.member_id[owner],
+        "admission_date": day_strings(admission),
+        "discharge_date": day_strings(discharge),
+        "facility": rs.choice([f"Facility {i}" for i in range(1, 13)], size),
+        "admit_reason": rs.choice(admit_reasons, size),
+        "discharge_disposition": rs.choice(
+            ["Home", "Skilled Nursing", "Deceased", "Hospice", "Other"],
+            size,
+            p=[0.6, 0.2, 0.05, 0.05, 0.1],
+        ),
+        "dow": weekdays[(admission + 3) % 7],
+        "w_six_months": (admission - ppts.enrollment[owner] <= 182).astype(int),
+        "los": los,
+        "days_since_last_admission": previous,
+    }
+    if table == "acute":
+        columns["er"] = (rs.random_sample(size) < 0.7).astype(int)
+    insert(conn, table, columns)
+
+
+def incident_table(conn, rs, ppts, table, rate, first_id):
+    """
+    Inserts the incidents of a batch of participants
+
+    Returns:
+        int: number of incidents inserted
+    """
+    owner, days = events(rs, ppts, rate)
+    size = len(owner)
+    columns = {
+        "incident_id": np.arange(first_id, first_id + size),
+        "member_id": ppts.member_id[owner],
+        "date_time_occurred": day_strings(days, rs.random_sample(size)),
+    }
+    for col in incident_cols[table]:
+        columns[col] = rs.choice([f"{col.replace('_', ' ').title()} {i}" for i in range(1, 7)], size)
+    for col in incident_flags.get(table, []):
+        columns[col] = (rs.random_sample(size) < 0.2).astype(int)
+    insert(conn, table, columns)
+    return size
+
+
+def agg_columns(pages_dir):
+    """
+    Finds the agg tables and columns the cards, graph pages and
+    team table read, from the page modules
+
+    Args:
+        pages_dir(Path): directory of the page modules
+
+    Returns:
+        dict: agg table name to the list of its columns
+    """
+    tables = {}
+    for path in sorted(pages_dir.glob("*.py")):
+        source = path.read_text()
+        for block in source.split("dict(")[1:]:
+            table = re.search(r'agg_table="(\w+)"', block)
+            col = re.search(r'agg_col="(\w+)"', block)
+            if table and col:
+                tables.setdefault(table.group(1), set()).add(col.group(1))
+        # team table indicators are "team_<table>-<col>" values
+        for table, col in re.findall(r'"(team_\w+)-(\w+)"', source):
+            tables.setdefault(table, set()).add(col)
+    return {table: sorted(cols) for table, cols in tables.items()}
+
+
+def agg_value(rs, col, participants, size):
+    """
+    Draws values for one agg column, counts scale with the participants
+    and everything else is a rate or percent
+    """
+    count_words = ("census", "admissions", "discharges", "visits", "days", "enrolled", "ppts", "inquiries")
+    if any(word in col for word in count_words):
+        base = participants * rs.uniform(0.01, 0.6)
+        return np.round(base * (1 + rs.normal(0, 0.05, size).cumsum() / 10)).clip(0)
+    return np.round(rs.uniform(5, 60) + rs.normal(0, 2, size).cumsum() / 3, 2).clip(0)
+
+
+def agg_tables(conn, rs, tables, participants, start, end):
+    """
+    Creates a monthly table and a quarterly _q table for every agg table,
+    team tables have a row for each team
+    """
+    periods = {
+        "": pd.date_range(start, end, freq="MS"),
+        "_q": pd.date_range(start, end, freq="QS"),
+    }
+    for table, cols in tables.items():
+        for suffix, months in periods.items():
+            conn.execute(f"DROP TABLE IF EXISTS {table}{suffix}")
+            groups = teams if table.startswith("team") else [None]
+            for team in groups:
+                columns = {"month": months.strftime("%Y-%m-%d").to_numpy()}
+                if team is not None:
+                    columns["team"] = np.array([team] * len(months))
+                scale = participants / len(groups)
+                for col in cols:
+                    columns[col] = agg_value(rs, col, scale, len(months))
+                insert(conn, f"{table}{suffix}", columns)
+
+
+def main():
+    """
+    Writes PaceDashboard.db and agg.db to the output directory
+    """
+    args = argparser().parse_args()
+    rs = np.random.RandomState(args.seed)
+    out_dir = Path(args.out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    db_path, agg_path = out_dir / "PaceDashboard.db", out_dir / "agg.db"
+    for path in (db_path, agg_path):
+        if path.exists():
+            path.unlink()
+
+    end = pd.Timestamp(args.end_date)
+    start = end - pd.DateOffset(years=args.years)
+    start_day = (start - pd.Timestamp(0)).days
+    end_day = (end - pd.Timestamp(0)).days
+
+    total_start = time.perf_counter()
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("PRAGMA journal_mode = OFF")
+    conn.execute("PRAGMA synchronous = OFF")
+    incident_ids = dict.fromkeys(incident_tables, 1)
+    try:
+        for first in range(0, args.participants, args.chunk):
+            size = min(args.chunk, args.participants - first)
+            ppts = Participants(rs, first + 1, size, start_day, end_day)
+            participant_tables(conn, rs, ppts, args.dx_per_ppt)
+            for table, (rate, mean_los) in visit_tables.items():
+                visit_table(conn, rs, ppts, table, rate * args.visit_rate, mean_los)
+            for table, rate in incident_tables.items():
+                incident_ids[table] += incident_table(
+                    conn, rs, ppts, table, rate * args.incident_rate, incident_ids[table]
+                )
+            conn.commit()
+            print(f"{first + size} of {args.participants} participants")
+        counts = {
+            table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in ["enrollment", "dx", *visit_tables, *incident_tables]
+        }
+    finally:
+        conn.close()
+
+    agg_conn = sqlite3.connect(str(agg_path))
+    try:
+        tables = agg_columns(Path(__file__).resolve().parent.parent / "src/pacedash/pages")
+        agg_tables(agg_conn, rs, tables, args.participants, start, end)
+        agg_conn.commit()
+    finally:
+        agg_conn.close()
+
+    if not args.no_prepare:
+        from src.pacedash.cube_utils import build_utilization_cube
+        from src.pacedash.index_utils import ensure_indexes
+
+        build_utilization_cube(str(db_path))
+        print(f"Created {len(ensure_indexes(str(db_path)))} indexes")
+
+    print(f"Wrote {db_path} and {agg_path} in {time.perf_counter() - total_start:.1f}s")
+    for table, count in counts.items():
+        print(f"{table:<12}{count:>12,}")
+    print(f"{len(tables)} agg tables")
+
+
+if __name__ == "__main__":
+    main()
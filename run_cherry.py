@@ -1,17 +1,35 @@
 #!/usr/bin/env python3
 
+import argparse
 from cheroot import wsgi
 from src.pacedash.app import server as application
 
 ###used to run the dashboard on a windows server instance
 ### uses cheroot to open the dashboard on port 8041
+### thread and queue sizes can be set from the command line,
+### benchmarks/load_test.py compares them under load
+
+
+def argparser():
+    """
+    Adds arguments to the server
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", metavar="HOST", default="0.0.0.0")
+    parser.add_argument("--port", metavar="PORT", type=int, default=8041)
+    parser.add_argument("--threads", metavar="N", type=int, default=250)
+    parser.add_argument("--queue-size", metavar="N", type=int, default=50)
+    return parser
+
+
 if __name__ == "__main__":
+    args = argparser().parse_args()
     server = wsgi.Server(
-        ("0.0.0.0", 8041),
+        (args.host, args.port),
         application,
-        numthreads=250,
+        numthreads=args.threads,
         server_name="internal.pace.dashboard",
-        request_queue_size=50,
+        request_queue_size=args.queue_size,
     )
     try:
         print("Server started")
@@ -1,5 +1,6 @@
 from flask import Flask
 from dash import Dash
+from .settings import compress_responses
 
 
 def create_app(config_object=f"{__package__}.settings"):
@@ -24,7 +25,9 @@ def create_dash(server):
     """
     metas = [{"name": "viewport", "content": "width=device-width, initial-scale=1"}]
 
-    app = Dash(__name__, server=server, meta_tags=metas)
+    # with compress_responses set, responses are compressed by
+    # compression_utils.GzipMiddleware instead of dash's flask-compress
+    app = Dash(__name__, server=server, meta_tags=metas, compress=not compress_responses)
 
     app.title = server.config["TITLE"]
     app.config.routes_pathname_prefix = server.config["ROUTES_PATHNAME_PREFIX"]
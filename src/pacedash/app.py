@@ -1,8 +1,24 @@
+import sqlite3
 from flask_login import LoginManager, UserMixin
 from . import create_app, create_dash
 from .layouts import main_layout_header
 from .users_mgt import db, User as base
 from .run_db_update import update_db, update_files
+from .db_utils import load_snapshots
+from .download_utils import register_download_routes
+from .warmup_utils import warm_caches
+from .compression_utils import GzipMiddleware
+from .metrics_utils import instrument_callbacks, register_metrics_routes
+from .index_utils import ensure_indexes
+from .profiler_utils import profile_external_connections
+from .settings import (
+    db_filepath,
+    db_ensure_indexes,
+    warm_caches_on_start,
+    compress_responses,
+    metrics_enabled,
+    profile_external_queries,
+)
 
 # update dashboard database upon start
 # update_db()
@@ -10,16 +26,38 @@ from .run_db_update import update_db, update_files
 # update dashboard files upon start
 # update_files()
 
+# index the date range and member_id columns dashboard queries filter on
+if db_ensure_indexes:
+    try:
+        ensure_indexes(db_filepath)
+    except sqlite3.OperationalError as e:
+        print(f"Could not create indexes: {e}")
+
+# profile the queries paceutils runs on its own connections
+if profile_external_queries:
+    profile_external_connections()
+
+# load the databases into memory if db_in_memory is set in settings
+load_snapshots()
+
 # The Flask instance
 server = create_app()
 
 # The Dash instance
 app = create_dash(server)
 
+# time every callback the pages register
+if metrics_enabled:
+    instrument_callbacks(app)
+
 app.config.suppress_callback_exceptions = True
 
 server = app.server
 
+# gzip callback, layout and asset responses
+if compress_responses:
+    server.wsgi_app = GzipMiddleware(server.wsgi_app)
+
 db.init_app(server)
 
 # Setup the LoginManager for the server
@@ -43,6 +81,17 @@ with server.app_context():
     # load the rest of our Dash app
     from . import index
 
+    # csv downloads linked from the teams and graph pages
+    register_download_routes(server)
+
+    # callback timings on /metrics
+    if metrics_enabled:
+        register_metrics_routes(server)
+
     # configure the Dash instance's layout
     app.layout = main_layout_header()
 
+# fill the caches in the background so the first users do not wait
+if warm_caches_on_start:
+    warm_caches()
+
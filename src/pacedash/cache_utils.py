@@ -0,0 +1,176 @@
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from .settings import db_filepath, agg_filepath
+
+# every cache created, so they can all be cleared after a data refresh
+_caches = weakref.WeakSet()
+
+
+def data_version():
+    """
+    Returns a value that changes whenever one of the data files is replaced
+
+    Returns:
+        tuple: inode, size and modified time of PaceDashboard.db and agg.db,
+            None for a file that does not exist
+    """
+    version = []
+    for filepath in (db_filepath, agg_filepath):
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            version.append(None)
+        else:
+            version.append((stat.st_ino, stat.st_size, stat.st_mtime_ns))
+    return tuple(version)
+
+
+class _Pending:
+    """
+    Result of a computation that other threads are waiting on
+    """
+
+    def __init__(self, generation):
+        self.event = threading.Event()
+        self.generation = generation
+        self.value = None
+        self.error = None
+
+
+class DataCache:
+    """
+    Thread-safe LRU cache for values computed from the dashboard databases.
+
+    Entries are dropped when the data files change (see data_version), when
+    the cache holds more than maxsize entries, or after ttl seconds.
+    Threads that ask for a key that is already being computed wait for
+    that result instead of computing it again. A computation that was
+    running when the cache was cleared does not store its result, and is
+    not shared with threads that ask after the clear.
+
+    Args:
+        maxsize(int): maximum number of entries
+        ttl(float): seconds an entry is kept, None keeps entries until
+            the data changes or they are evicted
+    """
+
+    def __init__(self, maxsize=128, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._version = None
+        # bumped whenever the entries are dropped, results of computations
+        # started before that are stale
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        _caches.add(self)
+
+    def _check_version(self):
+        version = data_version()
+        if version != self._version:
+            self._entries.clear()
+            self._generation += 1
+            self._version = version
+
+    def get_or_compute(self, key, func, *args, **kwargs):
+        """
+        Returns the cached value for key, calling func(*args, **kwargs)
+        to compute it if needed
+
+        Args:
+            key: hashable key identifying the value
+            func: function that computes the value
+
+        Returns:
+            cached or newly computed value
+        """
+        with self._lock:
+            self._check_version()
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, stored = entry
+                if self.ttl is None or time.monotonic() - stored < self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+
+            pending = self._pending.get(key)
+            owner = pending is None or pending.generation != self._generation
+            if owner:
+                pending = self._pending[key] = _Pending(self._generation)
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if not owner:
+            pending.event.wait()
+            if pending.error is not None:
+                raise pending.error
+            return pending.value
+
+        try:
+            pending.value = func(*args, **kwargs)
+        except Exception as error:
+            pending.error = error
+            raise
+        else:
+            with self._lock:
+                if pending.generation == self._generation:
+                    self._entries[key] = (pending.value, time.monotonic())
+                    self._entries.move_to_end(key)
+                    while len(self._entries) > self.maxsize:
+                        self._entries.popitem(last=False)
+            return pending.value
+        finally:
+            with self._lock:
+                if self._pending.get(key) is pending:
+                    del self._pending[key]
+            pending.event.set()
+
+    def discard(self, key):
+        """
+        Removes one entry from the cache if it is there
+
+        Args:
+            key: hashable key identifying the value
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """
+        Removes every entry from the cache
+        """
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def stats(self):
+        """
+        Returns the size and hit counts of the cache
+
+        Returns:
+            dict: entries, maxsize, hits and misses
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+def clear_caches():
+    """
+    Clears every DataCache, used after the databases are refreshed
+    """
+    for cache in list(_caches):
+        cache.clear()
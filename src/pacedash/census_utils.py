@@ -0,0 +1,140 @@
+import numpy as np
+import pandas as pd
+
+# Census engine
+# A participant is active on date d when enrollment_date <= d and
+# disenrollment_date >= d (or they have not disenrolled).
+# Sorting both date columns once lets the number of active participants
+# for every date be found with two binary searches:
+#     active(d) = #(enrollment_date <= d) - #(disenrollment_date < d)
+# which replaces building boolean masks over the whole frame for each date.
+
+
+class Census:
+    """
+    Sorted enrollment spans that answer census questions for many dates at once
+
+    Args:
+        df: pandas dataframe with enrollment and disenrollment dates
+
+        enroll_col: name of the enrollment date column
+
+        disenroll_col: name of the disenrollment date column
+
+        distinct: Default None, if a column name is provided rows that repeat
+            the same value and enrollment span (i.e. one row per dx) are
+            only counted once
+    """
+
+    def __init__(
+        self,
+        df,
+        enroll_col="enrollment_date",
+        disenroll_col="disenrollment_date",
+        distinct=None,
+    ):
+        if distinct is not None:
+            df = df.drop_duplicates([distinct, enroll_col, disenroll_col])
+
+        enroll = pd.to_datetime(df[enroll_col]).values
+        disenroll = pd.to_datetime(df[disenroll_col]).values
+
+        # rows without an enrollment date are never counted and rows that
+        # disenroll before enrolling are never active on a single date,
+        # leaving both out keeps the sorted counts from going negative
+        valid = ~np.isnat(enroll) & ~(disenroll < enroll)
+
+        self.enroll = np.sort(enroll[valid])
+        self.disenroll = np.sort(disenroll[valid & ~np.isnat(disenroll)])
+
+    def active_on(self, dates):
+        """
+        Returns the number of participants active on each date
+
+        Args:
+            dates: list-like of dates
+
+        Returns:
+            numpy array: census count for each date
+        """
+        dates = pd.DatetimeIndex(dates).values
+        enrolled = np.searchsorted(self.enroll, dates, side="right")
+        disenrolled = np.searchsorted(self.disenroll, dates, side="left")
+        return enrolled - disenrolled
+
+    def member_months(self, starts, ends):
+        """
+        Returns the member months in each period, counted as the census
+        on the first of each month that starts within the period
+
+        Args:
+            starts: list-like of period start dates
+
+            ends: list-like of period end dates
+
+        Returns:
+            numpy array: member months for each period
+        """
+        starts = pd.DatetimeIndex(starts)
+        ends = pd.DatetimeIndex(ends)
+        if starts.empty:
+            return np.array([], dtype=int)
+
+        # census on every month start covering all periods, summed per
+        # period using the cumulative census
+        first_month = starts.min() - pd.offsets.MonthBegin(1)
+        month_starts = pd.date_range(first_month, ends.max(), freq="MS")
+        cumulative = np.concatenate([[0], np.cumsum(self.active_on(month_starts))])
+
+        first = np.searchsorted(month_starts.values, starts.values, side="left")
+        last = np.searchsorted(month_starts.values, ends.values, side="right")
+        return cumulative[np.maximum(last, first)] - cumulative[first]
+
+
+def census_on_dates(df, dates, distinct=None):
+    """
+    Returns the census on each of the provided dates
+
+    Args:
+        df: pandas dataframe containing enrollment details
+
+        dates: list-like of dates to calculate the census on
+
+        distinct: column that identifies a participant when the
+            dataframe can hold more than one row per enrollment
+
+    Returns:
+        numpy array: census count for each date
+    """
+    return Census(df, distinct=distinct).active_on(dates)
+
+
+def census_by_group(df, dates, group_col, distinct=None):
+    """
+    Returns the census on each of the provided dates for each value
+    in group_col, i.e. per center or per demographic group
+
+    Args:
+        df: pandas dataframe containing enrollment details
+
+        dates: list-like of dates to calculate the census on
+
+        group_col: column to break the census out by
+
+        distinct: column that identifies a participant when the
+            dataframe can hold more than one row per enrollment
+
+    Returns:
+        df: dataframe indexed by date with a census column for each
+            group, in the order the groups appear in df
+    """
+    dates = pd.DatetimeIndex(dates)
+    groups = pd.unique(df[group_col])
+    counts = [
+        Census(df[df[group_col] == group], distinct=distinct).active_on(dates)
+        for group in groups
+    ]
+    if not counts:
+        return pd.DataFrame(index=dates)
+
+    return pd.DataFrame(np.column_stack(counts), index=dates, columns=list(groups))
@@ -0,0 +1,187 @@
+import gzip
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from .settings import (
+    compress_min_size,
+    compress_level,
+    compress_content_types,
+    compress_cache_size,
+    log_compression,
+)
+
+# Response compression
+# Callback responses are JSON figures and tables that compress to a fraction
+# of their size. The middleware gzips buffered responses of an allowed
+# content type once they are larger than compress_min_size. Static assets,
+# the layout and the callback list are the same bytes on every request, so
+# compressed GET bodies are cached by path and a hash of the body and reused.
+# Streamed responses, like the CSV downloads, are passed through as they are.
+
+
+class GzipMiddleware:
+    """
+    WSGI middleware that gzips responses for clients that accept it
+
+    Args:
+        app: WSGI application to wrap
+        min_size(int): smallest body in bytes that is compressed
+        content_types(list): content types that are compressed
+        level(int): gzip compression level
+        cache_size(int): number of compressed bodies kept
+    """
+
+    def __init__(
+        self,
+        app,
+        min_size=compress_min_size,
+        content_types=compress_content_types,
+        level=compress_level,
+        cache_size=compress_cache_size,
+    ):
+        self.app = app
+        self.min_size = min_size
+        self.content_types = set(content_types)
+        self.level = level
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            "responses": 0,
+            "compressed": 0,
+            "cache_hits": 0,
+            "bytes_in": 0,
+            "bytes_out": 0,
+            "cpu_seconds": 0.0,
+        }
+
+    def __call__(self, environ, start_response):
+        if "gzip" not in environ.get("HTTP_ACCEPT_ENCODING", "").lower():
+            return self.app(environ, start_response)
+
+        captured = {}
+
+        def capture(status, headers, exc_info=None):
+            captured["status"] = status
+            captured["headers"] = headers
+            captured["exc_info"] = exc_info
+            return lambda data: captured.setdefault("written", []).append(data)
+
+        app_iter = self.app(environ, capture)
+        status, headers = captured["status"], captured["headers"]
+
+        if not self.should_compress(status, headers):
+            write = start_response(status, headers, captured["exc_info"])
+            for data in captured.get("written", []):
+                write(data)
+            return app_iter
+
+        try:
+            body = b"".join(captured.get("written", []) + list(app_iter))
+        finally:
+            if hasattr(app_iter, "close"):
+                app_iter.close()
+
+        if len(body) < self.min_size:
+            start_response(status, headers, captured["exc_info"])
+            return [body]
+
+        compressed = self.compress(
+            environ.get("PATH_INFO", ""), body, environ.get("REQUEST_METHOD") == "GET"
+        )
+        vary = [value for name, value in headers if name.lower() == "vary"]
+        headers = [
+            (name, value)
+            for name, value in headers
+            if name.lower() not in ("content-length", "vary")
+        ]
+        headers.extend(
+            [
+                ("Content-Encoding", "gzip"),
+                ("Content-Length", str(len(compressed))),
+                ("Vary", ", ".join(vary + ["Accept-Encoding"])),
+            ]
+        )
+        start_response(status, headers, captured["exc_info"])
+        return [compressed]
+
+    def should_compress(self, status, headers):
+        """
+        Checks if a response can be compressed, it must be a buffered 200
+        response of an allowed content type that is not already encoded
+
+        Args:
+            status(str): WSGI status line
+            headers(list): WSGI response headers
+
+        Returns:
+            bool: True if the response should be compressed
+        """
+        if not status.startswith("200"):
+            return False
+        header_dict = {name.lower(): value for name, value in headers}
+        if "content-encoding" in header_dict or "content-length" not in header_dict:
+            return False
+        content_type = header_dict.get("content-type", "").split(";")[0].strip()
+        return content_type in self.content_types
+
+    def compress(self, path, body, cache=True):
+        """
+        Returns the gzipped body, from the cache if the same path
+        returned the same body before
+
+        Args:
+            path(str): request path
+            body(bytes): uncompressed response body
+            cache(bool): if False the body is compressed without
+                looking in or adding to the cache, used for callback
+                responses that rarely repeat
+
+        Returns:
+            bytes: gzipped body
+        """
+        key = (path, hashlib.sha1(body).hexdigest())
+        with self._lock:
+            self._stats["responses"] += 1
+            compressed = self._cache.get(key) if cache else None
+            if compressed is not None:
+                self._cache.move_to_end(key)
+                self._stats["cache_hits"] += 1
+                self._stats["bytes_in"] += len(body)
+                self._stats["bytes_out"] += len(compressed)
+                return compressed
+
+        start = time.thread_time()
+        compressed = gzip.compress(body, compresslevel=self.level)
+        cpu_seconds = time.thread_time() - start
+
+        with self._lock:
+            if cache:
+                self._cache[key] = compressed
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+            self._stats["compressed"] += 1
+            self._stats["bytes_in"] += len(body)
+            self._stats["bytes_out"] += len(compressed)
+            self._stats["cpu_seconds"] += cpu_seconds
+
+        if log_compression:
+            print(
+                f"gzip {path} {len(body)} -> {len(compressed)} bytes "
+                f"({len(compressed) / len(body):.0%}) in {cpu_seconds * 1000:.1f}ms"
+            )
+        return compressed
+
+    def stats(self):
+        """
+        Returns the compression counts of the middleware
+
+        Returns:
+            dict: responses compressed or served from the cache, bytes
+                before and after compression and CPU seconds spent
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["cache_entries"] = len(self._cache)
+        return stats
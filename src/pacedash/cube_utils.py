@@ -0,0 +1,133 @@
+import argparse
+import sqlite3
+from .db_utils import table_column_names
+
+# Utilization cube
+# The utilization EDA groups raw visit rows by month or quarter and by one
+# or two of a small set of columns. Rolling the visit tables up by month and
+# every one of those columns once, when the database is refreshed, lets the
+# EDA answer from a table whose size depends on the number of distinct
+# groups instead of the number of visits.
+
+# tables rolled up into the cube, ER visits that are part of an inpatient
+# stay (utl_type er) are not included and are read from the raw tables
+cube_tables = ["acute", "psych", "er_only", "custodial", "respite", "skilled"]
+
+cube_date_cols = ["admission_date", "discharge_date"]
+
+cube_dims = ["facility", "admit_reason", "discharge_disposition", "dow", "w_six_months"]
+
+
+def cube_select_sql(table, date_col, available, by_center):
+    """
+    Creates the SELECT statement that rolls up one table by month of
+    date_col and the cube dimensions
+
+    Args:
+        table(str): utilization table
+        date_col(str): date column the months come from
+        available(list): columns of the table
+        by_center(bool): if True rows are broken out by PACE center,
+            otherwise the center column is 'all'
+
+    Returns:
+        str: SQL statement
+    """
+    dims = [f"{table}.{dim}" if dim in available else "NULL" for dim in cube_dims]
+    los_sum = f"SUM({table}.los)" if "los" in available else "NULL"
+    los_n = f"COUNT({table}.los)" if "los" in available else "0"
+    if "days_since_last_admission" in available:
+        readmits = f"SUM(CASE WHEN {table}.days_since_last_admission <= 30 THEN 1 ELSE 0 END)"
+    else:
+        readmits = "0"
+
+    if by_center:
+        center = "centers.center"
+        join_sql = f"JOIN centers ON {table}.member_id = centers.member_id"
+    else:
+        center = "'all'"
+        join_sql = ""
+
+    group_by = ["month", center] + [dim for dim in dims if dim != "NULL"]
+
+    return f"""
+        SELECT '{table}', '{date_col}', date({table}.{date_col}, 'start of month') AS month,
+        {center}, {', '.join(dims)},
+        COUNT(*), {los_sum}, {los_n}, {readmits}
+        FROM {table}
+        {join_sql}
+        WHERE {table}.{date_col} IS NOT NULL
+        GROUP BY {', '.join(group_by)}
+        """
+
+
+def build_utilization_cube(filepath):
+    """
+    Creates the utilization_cube table in a copy of the dashboard database.
+    Called on the new copy of the database before it replaces the one
+    the dashboard reads.
+
+    Args:
+        filepath(str): path to the SQLite database
+    """
+    conn = sqlite3.connect(filepath)
+    try:
+        conn.execute("DROP TABLE IF EXISTS utilization_cube")
+        conn.execute(
+            f"""
+            CREATE TABLE utilization_cube (
+                utl_type TEXT,
+                date_type TEXT,
+                month TEXT,
+                center TEXT,
+                {', '.join(cube_dims)},
+                visits INTEGER,
+                los_sum REAL,
+                los_n INTEGER,
+                readmits INTEGER
+            )
+            """
+        )
+
+        has_centers = bool(table_column_names(conn, "centers"))
+        for table in cube_tables:
+            available = table_column_names(conn, table)
+            if not available:
+                continue
+            for date_col in cube_date_cols:
+                if date_col not in available:
+                    continue
+                conn.execute(
+                    "INSERT INTO utilization_cube "
+                    + cube_select_sql(table, date_col, available, False)
+                )
+                if has_centers and "member_id" in available:
+                    conn.execute(
+                        "INSERT INTO utilization_cube "
+                        + cube_select_sql(table, date_col, available, True)
+                    )
+
+        conn.execute(
+            """
+            CREATE INDEX utilization_cube_lookup
+            ON utilization_cube (utl_type, date_type, center, month)
+            """
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def main():
+    """
+    Builds the cube in an existing database
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("filepath", metavar="DB_PATH")
+    args = parser.parse_args()
+    build_utilization_cube(args.filepath)
+    print("Built utilization cube")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,375 @@
+import itertools
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from queue import LifoQueue, Empty
+from .profiler_utils import connection_factory
+from .settings import (
+    db_filepath,
+    agg_filepath,
+    db_pool_size,
+    db_pool_timeout,
+    db_mmap_size,
+    db_cache_size,
+    db_in_memory,
+)
+
+
+# seconds each thread has spent inside ConnectionPool.connection() blocks,
+# read before and after a callback to find the time it spent on queries
+query_time = threading.local()
+
+
+def thread_db_seconds():
+    """
+    Returns the seconds the current thread has spent using
+    pooled connections
+
+    Returns:
+        float: running total for the thread
+    """
+    return getattr(query_time, "seconds", 0.0)
+
+
+def read_only_uri(filepath):
+    """
+    Creates a SQLite URI that opens the database file read-only
+
+    Args:
+        filepath(str): path to the SQLite database
+
+    Returns:
+        str: file URI with mode=ro
+    """
+    return f"{Path(filepath).absolute().as_uri()}?mode=ro"
+
+
+def table_column_names(conn, table):
+    """
+    Returns the column names of a table
+
+    Args:
+        conn: sqlite3 connection
+        table(str): name of the table
+
+    Returns:
+        list: column names, empty if the table does not exist
+    """
+    return [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of read-only SQLite connections.
+
+    Connections are opened lazily up to the pool size and handed out
+    most recently used first, so a small number of warm connections
+    serve most requests. When every connection is checked out callers
+    wait up to the pool timeout for one to be returned.
+
+    Args:
+        database(str): path to the SQLite database
+        size(int): maximum number of open connections
+        timeout(float): seconds to wait for a free connection
+        uri(bool): if True database is already a SQLite URI and
+            is opened as-is
+    """
+
+    def __init__(self, database, size=db_pool_size, timeout=db_pool_timeout, uri=False):
+        self.size = size
+        self.timeout = timeout
+        self._idle = LifoQueue(maxsize=size)
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._open = 0
+        self._checkouts = 0
+        self._waits = 0
+        self._wait_time = 0.0
+        self._timeouts = 0
+        self._in_use = 0
+        self._local = threading.local()
+        self._database, self._uri = self._source(database, uri)
+
+    @staticmethod
+    def _source(database, uri):
+        if uri:
+            return database, True
+        return read_only_uri(database), True
+
+    def _connect(self):
+        """
+        Opens a new connection and applies the read tuned PRAGMAs
+        """
+        conn = sqlite3.connect(
+            self._database,
+            uri=self._uri,
+            check_same_thread=False,
+            factory=connection_factory(),
+        )
+        conn.execute("PRAGMA query_only = ON")
+        conn.execute(f"PRAGMA mmap_size = {int(db_mmap_size)}")
+        conn.execute(f"PRAGMA cache_size = {int(db_cache_size)}")
+        return conn
+
+    def _checkout(self):
+        """
+        Returns an idle connection, opens a new one if the pool is not
+        full, or waits for one to be returned
+        """
+        waited = False
+        start = time.perf_counter()
+        try:
+            while True:
+                try:
+                    generation, conn = self._idle.get(timeout=0.05 if waited else 0)
+                except Empty:
+                    pass
+                else:
+                    if generation == self._generation:
+                        return generation, conn
+                    self._release(generation, conn)
+                    continue
+
+                with self._lock:
+                    open_new = self._open < self.size
+                    if open_new:
+                        self._open += 1
+                        generation = self._generation
+
+                if open_new:
+                    try:
+                        return generation, self._connect()
+                    except Exception:
+                        with self._lock:
+                            self._open -= 1
+                        raise
+
+                if not waited:
+                    waited = True
+                    with self._lock:
+                        self._waits += 1
+                elif time.perf_counter() - start > self.timeout:
+                    with self._lock:
+                        self._timeouts += 1
+                    raise TimeoutError(
+                        f"No database connection available after {self.timeout} seconds"
+                    )
+        finally:
+            if waited:
+                with self._lock:
+                    self._wait_time += time.perf_counter() - start
+
+    def _release(self, generation, conn):
+        with self._lock:
+            stale = generation != self._generation
+            if stale:
+                self._open -= 1
+        if stale:
+            conn.close()
+        else:
+            self._idle.put((generation, conn))
+
+    @contextmanager
+    def connection(self):
+        """
+        Checks a connection out of the pool for the length of the with block
+
+        Yields:
+            sqlite3.Connection: read-only connection to the database
+        """
+        start = time.perf_counter()
+        try:
+            session = getattr(self._local, "conn", None)
+            if session is not None:
+                yield session
+                return
+
+            with self._pooled() as conn:
+                yield conn
+        finally:
+            query_time.seconds = thread_db_seconds() + time.perf_counter() - start
+
+    @contextmanager
+    def _pooled(self):
+        generation, conn = self._checkout()
+        with self._lock:
+            self._checkouts += 1
+            self._in_use += 1
+        try:
+            yield conn
+        finally:
+            with self._lock:
+                self._in_use -= 1
+            self._release(generation, conn)
+
+    @contextmanager
+    def session(self):
+        """
+        Holds one connection for the length of the with block, every
+        connection() call made by the same thread inside the block reuses
+        it instead of going back to the pool
+
+        Yields:
+            sqlite3.Connection: read-only connection to the database
+        """
+        if getattr(self._local, "conn", None) is not None:
+            yield self._local.conn
+            return
+
+        with self._pooled() as conn:
+            self._local.conn = conn
+            try:
+                yield conn
+            finally:
+                self._local.conn = None
+
+    def swap(self, database, uri=False):
+        """
+        Points the pool at a new database. Idle connections are closed now,
+        connections that are checked out are closed when they are returned.
+
+        Args:
+            database(str): path to the SQLite database or a SQLite URI
+            uri(bool): if True database is a SQLite URI
+        """
+        with self._lock:
+            self._database, self._uri = self._source(database, uri)
+            self._generation += 1
+        self._drain()
+
+    def reset(self):
+        """
+        Closes every pooled connection so the next checkout reopens the
+        database, used after the database file has been replaced
+        """
+        with self._lock:
+            self._generation += 1
+        self._drain()
+
+    def _drain(self):
+        for _ in range(self._idle.qsize()):
+            try:
+                generation, conn = self._idle.get_nowait()
+            except Empty:
+                return
+            self._release(generation, conn)
+
+    def stats(self):
+        """
+        Returns counters that can be used to size the pool
+
+        Returns:
+            dict: pool size, open, idle and in use connections, total
+                checkouts, checkouts that had to wait, time spent
+                waiting and checkouts that timed out
+        """
+        with self._lock:
+            return {
+                "size": self.size,
+                "open": self._open,
+                "idle": self._idle.qsize(),
+                "in_use": self._in_use,
+                "checkouts": self._checkouts,
+                "waits": self._waits,
+                "wait_seconds": round(self._wait_time, 6),
+                "timeouts": self._timeouts,
+            }
+
+
+class MemorySnapshot:
+    """
+    Copy of a database file held in a shared in-memory SQLite database.
+
+    Each load copies the file with the SQLite backup API into a new, uniquely
+    named in-memory database and only then points the pool at it, so
+    requests read either the old snapshot or the complete new one. The
+    previous snapshot is freed once the last connection to it is closed.
+    Only connections taken from the pool read the snapshot, the paceutils
+    objects in helper_functions still read the database file.
+
+    Args:
+        name(str): short name used in the in-memory database URI
+        filepath(str): path to the SQLite database file to copy
+        pool(ConnectionPool): pool that should read from the snapshot
+    """
+
+    _counter = itertools.count()
+
+    def __init__(self, name, filepath, pool):
+        self.name = name
+        self.filepath = filepath
+        self.pool = pool
+        self._anchor = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        """
+        Builds a new snapshot from the database file and swaps it into the pool
+
+        Returns:
+            str: URI of the new in-memory database
+        """
+        uri = f"file:pacedash_{self.name}_{next(self._counter)}?mode=memory&cache=shared"
+        # the anchor connection keeps the in-memory database alive
+        anchor = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        source = sqlite3.connect(read_only_uri(self.filepath), uri=True)
+        try:
+            source.backup(anchor)
+        except Exception:
+            anchor.close()
+            raise
+        finally:
+            source.close()
+
+        with self._lock:
+            previous, self._anchor = self._anchor, anchor
+            self.pool.swap(uri, uri=True)
+        if previous is not None:
+            previous.close()
+        return uri
+
+    def close(self):
+        """
+        Points the pool back at the database file and frees the snapshot
+        """
+        with self._lock:
+            previous, self._anchor = self._anchor, None
+            self.pool.swap(self.filepath)
+        if previous is not None:
+            previous.close()
+
+
+# pools shared by every data access function in the dashboard
+db_pool = ConnectionPool(db_filepath)
+agg_pool = ConnectionPool(agg_filepath)
+
+snapshots = [
+    MemorySnapshot("db", db_filepath, db_pool),
+    MemorySnapshot("agg", agg_filepath, agg_pool),
+]
+
+
+def load_snapshots():
+    """
+    Loads both databases into memory when db_in_memory is set in settings.py,
+    otherwise closes pooled connections so they reopen the database files.
+    Called at startup and after the database files are refreshed.
+    """
+    if db_in_memory:
+        for snapshot in snapshots:
+            snapshot.load()
+    else:
+        db_pool.reset()
+        agg_pool.reset()
+
+
+def pool_stats():
+    """
+    Returns the stats of both database pools
+
+    Returns:
+        dict: pool name to the stats dictionary of the pool
+    """
+    return {"db": db_pool.stats(), "agg": agg_pool.stats()}
@@ -1,19 +1,18 @@
-import plotly.graph_objs as go
 import squarify
 import pandas as pd
 import numpy as np
-import sqlite3
 from .helper_functions import (
     calc_min_y,
     create_daterange,
     sql_return_df,
-    db_filepath,
     create_center_sql,
     build_scatter_layout,
     build_bar_layout
 )
 from .settings import color_palette
+from .figure_utils import figure_trace, figure_layout
 from .enrollment_eda_utils import census_count_df
+from .census_utils import census_on_dates, census_by_group
 import textwrap
 
 demographic_attribute_options = [
@@ -53,10 +52,10 @@ graph_types = {
     "chronic": [{"label": "Trend", "value": "chronic_trend"}],
 }
 
-def demographic_df(start_date, end_date, center, cols, date_cols=None):
+def demographic_query(start_date, end_date, center, cols):
     """
-    Creates pandas dataframe of demographic table during given
-    date range and with specified columns
+    Creates the query demographic_df runs, also explained by
+    index_utils to check its query plan
 
     Args:
         start_date: First date to include in resulting dataframe
@@ -67,11 +66,8 @@ def demographic_df(start_date, end_date, center, cols, date_cols=None):
         
         cols: List of column names to be included in the SQL query
 
-        date_cols: names of columns to be parsed using pandas datetime
-
     Returns:
-        df: dataframe of demographic table during given
-            date range and with specified columns
+        tuple: query and parameters
     """
     params = [pd.to_datetime(start_date).date(),
             pd.to_datetime(end_date).date()]
@@ -88,7 +84,29 @@ def demographic_df(start_date, end_date, center, cols, date_cols=None):
     AND e.enrollment_date <= ?
     {center_sql};
     """
+    return query, params
+
+def demographic_df(start_date, end_date, center, cols, date_cols=None):
+    """
+    Creates pandas dataframe of demographic table during given
+    date range and with specified columns
+
+    Args:
+        start_date: First date to include in resulting dataframe
 
+        end_date: Last date to include in resulting dataframe
+        
+        center: Name of PACE center
+        
+        cols: List of column names to be included in the SQL query
+
+        date_cols: names of columns to be parsed using pandas datetime
+
+    Returns:
+        df: dataframe of demographic table during given
+            date range and with specified columns
+    """
+    query, params = demographic_query(start_date, end_date, center, cols)
     return sql_return_df(query, params, date_cols)
 
 #GRAPHS
@@ -169,7 +187,8 @@ def create_square_graph(value_dict, df_shape, plot_title):
         )
 
     fig_data = [
-        go.Scatter(
+        figure_trace(
+            "scatter",
             x=[r["x"] + (r["dx"] / 2) for r in rects],
             y=[r["y"] + (r["dy"] / 2) for r in rects],
             text=[
@@ -235,51 +254,26 @@ def percent_trend_graph(df, mask, plot_title, color, start_date,
      Returns:
          dict: containing plotly figure data and layout information
     """
-    #two helper functions
-    def percent_count(df, *masks):
-        """
-        When the dataframe contains all participants and needs to be
-        filtered for demographic group and enrollment this
-        count function is used
-        """
-        enroll_mask, disenroll_mask, mask = masks
-        return round((
-            df[enroll_mask & disenroll_mask & mask].shape[0]
-            / df[enroll_mask & disenroll_mask].shape[0]
-        ) * 100, 2)
-    
-    def raw_count(df, *masks):
-        """
-        When the dataframe has already been filter for the
-        selected demographic group this count function is used
-        """
-        enroll_mask, disenroll_mask, _ = masks
-        return len(df[enroll_mask & disenroll_mask]["member_id"].unique())
-    
-    #start of percent graph creation
+    dates = create_daterange(start_date, end_date, "M")
+
     if use_raw_count:
-        count_func = raw_count
+        # df has already been filtered for the demographic group,
+        # count each participant once
+        counts = census_on_dates(df, dates, distinct="member_id")
     else:
-        count_func = percent_count
-
-    count_dict = {}
-
-    for single_date in create_daterange(start_date, end_date, "M"):
-        enroll_mask = df.enrollment_date <= single_date
-        disenroll_mask = (df.disenrollment_date >= single_date) | (
-            df.disenrollment_date.isnull()
+        counts = np.round(
+            (census_on_dates(df[mask], dates) / census_on_dates(df, dates)) * 100, 2
         )
-        count_dict[single_date] = count_func(df, enroll_mask, disenroll_mask, mask)
 
-    plot_df = pd.DataFrame.from_dict(count_dict, orient="index", columns=["Percent"]).reset_index()
-    plot_df.rename(columns = {'index':'Freq'}, inplace=True)
+    plot_df = pd.DataFrame({"Freq": dates, "Percent": counts})
 
     if use_raw_count:
         pmpm_df = census_count_df(center, start_date, end_date, "MS")
         plot_df["Percent"] = round((plot_df["Percent"] / pmpm_df["Census"]) * 100, 2)
 
     fig_data = [
-        go.Scatter(
+        figure_trace(
+            "scatter",
             x=plot_df["Freq"],
             y=plot_df["Percent"],
             mode="lines",
@@ -311,24 +305,6 @@ def demographic_line_plot(demographic, plot_title, center, start_date, end_date)
      Returns:
          dict: containing plotly figure data and layout information
     """
-    #helper function
-    def monthly_count(df, demographic, enroll_mask, disenroll_mask):
-        """
-        Create a dictionary for each month containing the percent
-        of each demographic group in the month
-        """
-        month_count = {}
-
-        for demo in df[demographic].unique():
-            mask = df[demographic] == demo
-            month_count[demo] = round((
-                df[enroll_mask & disenroll_mask & mask].shape[0] /
-                df[enroll_mask & disenroll_mask].shape[0]
-            ) * 100,2)
-
-        return month_count
-    
-    #start of line plot creation
     df = demographic_df(
         start_date,
         end_date,
@@ -336,22 +312,17 @@ def demographic_line_plot(demographic, plot_title, center, start_date, end_date)
         [f"d.{demographic}", "e.enrollment_date", "e.disenrollment_date"],
         ["enrollment_date", "disenrollment_date"])
 
-    count_dict = {}
-
-    for single_date in create_daterange(start_date, end_date, "MS"):
-        
-        enroll_mask = df.enrollment_date <= single_date
-        disenroll_mask = (df.disenrollment_date >= single_date) | (
-            df.disenrollment_date.isnull()
-        )
+    dates = create_daterange(start_date, end_date, "MS")
 
-        count_dict[single_date] = monthly_count(df, demographic, enroll_mask, disenroll_mask)
-    
-    plot_df = pd.DataFrame.from_dict(count_dict, orient="index").reset_index()
-    plot_df.rename(columns={"index": "Quarter"}, inplace=True)
+    # percent of each demographic group in each month
+    group_census = census_by_group(df, dates, demographic)
+    total_census = census_on_dates(df, dates)
+    plot_df = (group_census.div(total_census, axis=0) * 100).round(2)
+    plot_df = plot_df.rename_axis("Quarter").reset_index()
     
     fig_data = [
-        go.Scatter(
+        figure_trace(
+            "scatter",
             x=plot_df["Quarter"],
             y=plot_df[col],
             text=[str(round(val, 2)) + "%" for val in plot_df[col]],
@@ -399,7 +370,7 @@ def demographic_line_plot(demographic, plot_title, center, start_date, end_date)
          for col in df_max[:3].index
     ])
 
-    fig_layout = go.Layout(
+    fig_layout = figure_layout(
         margin={"pad": 5, "l": 35, "r": 50, "t": 55, "b": 65},
         xaxis= {"title": '', "showgrid": False, "showline": False},
         yaxis={
@@ -434,7 +405,7 @@ def age_hist(start_date, end_date, center):
 
     df["age"] = (pd.to_datetime(end_date).to_period("M") - df["dob"].dt.to_period("M")).apply(lambda x: int(x.freqstr[:-1]) // 12)
 
-    fig_data = [go.Histogram(x=df["age"], marker=dict(color=color_palette[0]), opacity=0.75)]
+    fig_data = [figure_trace("histogram", x=df["age"], marker=dict(color=color_palette[0]), opacity=0.75)]
 
     fig_layout = build_bar_layout("Participant Age", x_title='Age (Years)', y_title='Number of Ppts')
 
@@ -516,7 +487,8 @@ def avg_age_line(start_date, end_date, center):
     plot_df.rename(columns={"index": "Freq"}, inplace=True)
 
     fig_data = [
-        go.Scatter(
+        figure_trace(
+            "scatter",
             x=plot_df["Freq"],
             y=plot_df["Mean"],
             mode="lines",
@@ -571,7 +543,8 @@ def gender_hist(start_date, end_date, center):
     ]
 
     fig_data = [
-        go.Bar(
+        figure_trace(
+            "bar",
             y=y,
             x=women_bins,
             orientation="h",
@@ -580,7 +553,8 @@ def gender_hist(start_date, end_date, center):
             hoverinfo="x+text+name",
             marker=dict(color="#F6AA9B"),
         ),
-        go.Bar(
+        figure_trace(
+            "bar",
             y=y,
             x=[-1 * val for val in men_bins],
             orientation="h",
@@ -590,11 +564,11 @@ def gender_hist(start_date, end_date, center):
             marker=dict(color="#6EA4BF"),
         ),
     ]
-    fig_layout = go.Layout(
+    fig_layout = figure_layout(
         margin={"pad": 5, "l": 35, "r": 50, "t": 55, "b": 65},
         title="",
-        yaxis=go.layout.YAxis(title="Age", range=[50, 105]),
-        xaxis=go.layout.XAxis(
+        yaxis=dict(title="Age", range=[50, 105]),
+        xaxis=dict(
             range=[-100, 100],
             tickvals=[-100, -75, -25, 0, 25, 75, 100],
             ticktext=[100, 75, 25, 0, 25, 75, 100],
@@ -640,7 +614,8 @@ def gender_pie(start_date, end_date, center):
     pie_colors = ["#5789BA", "#DA5870"]
 
     fig_data = [
-        go.Pie(
+        figure_trace(
+            "pie",
             labels=labels,
             values=values,
             hoverinfo="none",
@@ -650,7 +625,7 @@ def gender_pie(start_date, end_date, center):
         )
     ]
 
-    fig_layout = go.Layout(
+    fig_layout = figure_layout(
         showlegend=False,
         title="",
         annotations=[
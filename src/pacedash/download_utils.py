@@ -0,0 +1,180 @@
+import re
+from urllib.parse import urlencode
+import pandas as pd
+from flask import Response, abort, request, stream_with_context
+from flask_login import login_required
+from .helper_functions import agg, sql_fetchall, time_range_dict
+from .db_utils import agg_pool
+from .team_utils import create_comparison_table
+from .settings import csv_chunk_rows
+from .utils import get_url
+
+# CSV downloads
+# Download links point at these routes instead of holding the whole CSV
+# as a data URI, the CSV is only built when the link is clicked and is
+# streamed to the browser a chunk of rows at a time.
+
+# table and column names come from the page url and are passed on to
+# queries as identifiers, so only plain names are accepted
+identifier_pattern = re.compile(r"^[A-Za-z0-9_]+$")
+
+freq_options = ["MS", "QS"]
+
+
+def graph_csv_url(pathname, start_date, end_date, freq):
+    """
+    Creates the download url for the data of a default graph page
+
+    Args:
+        pathname(str): url of page, in the format /agg_table-col
+        start_date(str): start date of period used to filter graph
+        end_date(str): end date of period used to filter graph
+        freq: frequency grouping of graph data, MS or QS
+
+    Returns:
+        str: url of the csv, empty if the pathname is not a graph page
+    """
+    try:
+        table, col = pathname.split("-")
+    except (AttributeError, ValueError):
+        return ""
+    query = urlencode(
+        {"path": pathname, "start_date": start_date, "end_date": end_date, "freq": freq}
+    )
+    return f"{get_url('download/graph.csv')}?{query}"
+
+
+def team_csv_url(time_range):
+    """
+    Creates the download url for the team comparison table
+
+    Args:
+        time_range(str): key of time_range_dict
+
+    Returns:
+        str: url of the csv
+    """
+    return f"{get_url('download/teams.csv')}?{urlencode({'time_range': time_range})}"
+
+
+def csv_chunks(df, chunk_rows=csv_chunk_rows):
+    """
+    Yields a dataframe as csv text, a byte order mark and the header
+    first and then chunk_rows rows at a time
+
+    Args:
+        df: pandas dataframe
+        chunk_rows(int): number of rows in each chunk
+
+    Returns:
+        generator: str chunks of the csv
+    """
+    yield "\ufeff" + df.head(0).to_csv(index=False)
+    for start in range(0, df.shape[0], chunk_rows):
+        yield df.iloc[start : start + chunk_rows].to_csv(index=False, header=False)
+
+
+def csv_response(df, filename):
+    """
+    Creates a streamed csv download response
+
+    Args:
+        df: pandas dataframe
+        filename(str): name the browser saves the file as
+
+    Returns:
+        Response: flask response
+    """
+    return Response(
+        stream_with_context(csv_chunks(df)),
+        mimetype="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+def agg_table_exists(table):
+    """
+    Checks that the aggregate database has a table
+
+    Args:
+        table(str): name of the table
+
+    Returns:
+        bool: True if the table exists
+    """
+    return bool(
+        sql_fetchall(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name = ?",
+            [table],
+            pool=agg_pool,
+        )
+    )
+
+
+def graph_data(pathname, start_date, end_date, freq):
+    """
+    Returns the data used to create a default graph page
+
+    Args:
+        pathname(str): url of page, in the format /agg_table-col
+        start_date(str): start date of period used to filter graph
+        end_date(str): end date of period used to filter graph
+        freq: frequency grouping of graph data, MS or QS
+
+    Returns:
+        DataFrame: data of the graph, None if the arguments are not valid
+    """
+    try:
+        table, col = pathname.split("-")
+        params = (
+            pd.to_datetime(start_date).strftime("%Y-%m-%d"),
+            pd.to_datetime(end_date).strftime("%Y-%m-%d"),
+        )
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+    table = table[1:]
+    if freq not in freq_options:
+        return None
+    if not (identifier_pattern.match(table) and identifier_pattern.match(col)):
+        return None
+
+    if freq == "QS":
+        table = f"{table}_q"
+    if not agg_table_exists(table):
+        return None
+
+    if table[:4] == "team":
+        return agg.team_plot_df(table, col, params)
+    return agg.get_plot_df(table, col, params)
+
+
+def register_download_routes(server):
+    """
+    Adds the csv download routes to the flask server, both
+    require the user to be logged in
+
+    Args:
+        server: flask server of the dash app
+    """
+
+    @server.route(get_url("download/graph.csv"))
+    @login_required
+    def download_graph_csv():
+        args = request.args
+        dff = graph_data(
+            args.get("path"), args.get("start_date"), args.get("end_date"), args.get("freq")
+        )
+        if dff is None:
+            abort(400)
+        return csv_response(dff, "data.csv")
+
+    @server.route(get_url("download/teams.csv"))
+    @login_required
+    def download_teams_csv():
+        time_range = request.args.get("time_range")
+        if time_range not in time_range_dict:
+            abort(400)
+        params = time_range_dict[time_range][0]()
+        dff = create_comparison_table(params, return_df=True)
+        return csv_response(dff, "team_comparison.csv")
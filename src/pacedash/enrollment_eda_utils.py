@@ -1,17 +1,16 @@
 import pandas as pd
-import sqlite3
-import plotly.graph_objs as go
 import textwrap
 from .helper_functions import (
     create_daterange,
     sql_return_df,
+    sql_fetchone,
     build_scatter_layout,
     build_bar_layout,
-    db_filepath,
     create_center_sql,
-    enrollment
 )
 from .settings import color_palette
+from .figure_utils import figure_trace
+from .census_utils import Census
 
 
 # helpers/utils
@@ -30,18 +29,13 @@ def get_census(center_sql=""):
         int: number of participants at this time,
             filtered by center if center_sql is provided
     """
-    conn = sqlite3.connect(db_filepath)
-    c = conn.cursor()
-
     census_query = f"""SELECT COUNT(DISTINCT(enrollment.member_id))
     FROM enrollment
     WHERE enrollment_date <= date('now')
     AND disenrollment_date IS NULL
     {center_sql};    
     """
-    census = c.execute(census_query).fetchone()[0]
-    conn.close()
-    return census
+    return sql_fetchone(census_query)[0]
 
 
 def enrollment_df(center, cols):
@@ -74,6 +68,29 @@ def enrollment_df(center, cols):
 
     return sql_return_df(query, params, ["enrollment_date", "disenrollment_date"])
 
+
+def member_months(periods, center="all"):
+    """
+    Returns the member months for each period from a single
+    query of the enrollment table
+
+    Args:
+        periods: list of (start date, end date) tuples
+
+        center: Name of PACE center
+
+    Returns:
+        numpy array: member months for each period, census on the
+            first of each month in the period
+    """
+    df = enrollment_df(
+        center, ["enrollment.member_id", "enrollment_date", "disenrollment_date"]
+    )
+    starts = [start for start, _ in periods]
+    ends = [end for _, end in periods]
+    return Census(df).member_months(starts, ends)
+
+
 def disenroll_reasons_df(center):
     """
     Creates pandas dataframe of enrollment table 
@@ -99,59 +116,6 @@ def disenroll_reasons_df(center):
     return sql_return_df(query, params, ["disenrollment_date"])
 
 
-def monthly_census_count(df, month_date, *quarter_pmpm):
-    """
-    Returns the census as of the given month_date
-   
-    Args:
-        df: pandas dataframe containing enrollment details
-
-        month_date: Date to calculate the census on, will be either
-            the start or end of a month
-
-        *quarter_pmpm: Used in quarter census function
-
-    Return:
-        int: census count
-    """
-    enroll_mask = df.enrollment_date <= month_date
-    disenroll_mask = (df.disenrollment_date >= month_date) | (
-        df.disenrollment_date.isnull()
-    )
-
-    return df[enroll_mask & disenroll_mask].shape[0]
-
-
-def quarterly_census_count(df, quarter_start, quarter_pmpm=False):
-    """
-    Returns the census as of the given month_date
-   
-    Args:
-        df: pandas dataframe containing enrollment details
-
-        quarter_start: start of the quarter
-
-        quarter_pmpm: Default to False, if True
-            the quarter census is the total of the census
-            from the first of each month in the quarter
-
-    Return:
-        int: census count
-    """
-    quarter_end = quarter_start + pd.offsets.MonthEnd(3)
-    if quarter_pmpm:
-        total_quarter_count = 0
-        for month_start in create_daterange(quarter_start, quarter_end, "MS"):
-            total_quarter_count += monthly_census_count(df, month_start)
-
-        return total_quarter_count
-
-    enroll_mask = df.enrollment_date <= quarter_end
-    disneroll_during = df.disenrollment_date >= quarter_start
-    currently_enrolled = df.disenrollment_date.isnull()
-    return df[(disneroll_during | currently_enrolled) & enroll_mask].shape[0]
-
-
 # PACE RI counts census as of the first of the month and
 # this dict changes the monthly/quarterly radio
 # dict allows keeping the m/q radio simple
@@ -227,9 +191,6 @@ def census_count_df(
         "QS": (quarter_dict_key, 3),
     }
 
-    df = enrollment_df(center, cols=["enrollment.member_id", "enrollment_date", "disenrollment_date"])
-    census_dict = {}
-
     dict_key, offset = counter_func_dict[freq]
     update = True
     if as_of_first:
@@ -237,9 +198,15 @@ def census_count_df(
         end_date = pd.to_datetime(end_date) + pd.offsets.MonthEnd(1)
         update = False
 
-    for freq_start in create_daterange(start_date, end_date, freq, update=update):
-        freq_end = freq_start + pd.offsets.MonthEnd(offset)
-        census_dict[dict_key(freq_start)] = enrollment.member_months((freq_start.strftime("%Y-%m-%d"), freq_end.strftime("%Y-%m-%d")))
+    freq_starts = create_daterange(start_date, end_date, freq, update=update)
+    periods = [
+        (freq_start, freq_start + pd.offsets.MonthEnd(offset))
+        for freq_start in freq_starts
+    ]
+
+    census_dict = {}
+    for freq_start, month_count in zip(freq_starts, member_months(periods, center)):
+        census_dict[dict_key(freq_start)] = month_count
 
     count_df = pd.DataFrame.from_dict(census_dict, orient="index").reset_index()
     count_df.rename(columns={"index": "Freq", 0: "Census"}, inplace=True)
@@ -272,7 +239,8 @@ def census_trend(start_date, end_date, freq, center):
     if freq == "QS":
         eot = "Quarter"  # end of title
         fig_data = [
-            go.Bar(
+            figure_trace(
+                "bar",
                 x=plot_df["Freq"].astype(str),
                 y=plot_df["Census"],
                 marker={"color": color_palette[0]},
@@ -282,7 +250,8 @@ def census_trend(start_date, end_date, freq, center):
     else:
         eot = "Month"  # end of title
         fig_data = [
-            go.Scatter(
+            figure_trace(
+                "scatter",
                 x=plot_df["Freq"].astype(str),
                 y=plot_df["Census"],
                 mode="lines",
@@ -369,7 +338,8 @@ def enrollment_changes(start_date, end_date, freq, center):
 
     return {
         "data": [
-            go.Bar(
+            figure_trace(
+                "bar",
                 x=plot_df["Freq"],
                 y=plot_df["enrollments"],
                 text=plot_df["enrollments"],
@@ -377,7 +347,8 @@ def enrollment_changes(start_date, end_date, freq, center):
                 name="Enrollments",
                 marker={"color": color_palette[0]},
             ),
-            go.Bar(
+            figure_trace(
+                "bar",
                 x=plot_df["Freq"],
                 y=plot_df["disenrollments"],
                 base=[-y for y in plot_df["disenrollments"]],
@@ -386,7 +357,8 @@ def enrollment_changes(start_date, end_date, freq, center):
                 name="Disenrollments",
                 marker={"color": color_palette[2]},
             ),
-            go.Bar(
+            figure_trace(
+                "bar",
                 x=plot_df["Freq"],
                 y=plot_df["deaths"],
                 base=[-y for y in plot_df["deaths"]],
@@ -395,7 +367,8 @@ def enrollment_changes(start_date, end_date, freq, center):
                 name="Deaths",
                 marker={"color": color_palette[3]},
             ),
-            go.Scatter(
+            figure_trace(
+                "scatter",
                 x=plot_df["Freq"],
                 y=plot_df["net"],
                 text=plot_df["net"],
@@ -469,21 +442,24 @@ def time_to_disenroll(start_date, end_date, freq, center):
         eot = "Month"  # end of title
 
     fig_data = [
-        go.Scatter(
+        figure_trace(
+            "scatter",
             x=plot_df["Freq"],
             y=plot_df["all"],
             mode="lines",
             name="All",
             line={"width": 7, "color": color_palette[0]},
         ),
-        go.Scatter(
+        figure_trace(
+            "scatter",
             x=plot_df["Freq"],
             y=plot_df["voluntary"],
             mode="lines",
             name="Voluntary",
             line={"width": 7, "color": color_palette[2]},
         ),
-        go.Scatter(
+        figure_trace(
+            "scatter",
             x=plot_df["Freq"],
             y=plot_df["deceased"],
             mode="lines",
@@ -553,7 +529,8 @@ def disenroll_reasons(start_date, end_date, freq, center):
         legend = dict(orientation="h", y=-0.15)
 
     fig_data = [
-        go.Bar(
+        figure_trace(
+            "bar",
             x=plot_df["Quarter"].astype(str),
             y=plot_df[col],
             text=[f"{val} {col}" if val != 0 else None for val in plot_df[col]],
@@ -0,0 +1,298 @@
+import json
+import threading
+from functools import wraps
+import numpy as np
+import pandas as pd
+import plotly
+import plotly.graph_objs as go
+from .settings import (
+    validate_figures,
+    figure_decimals,
+    figure_max_points,
+    report_figure_sizes,
+)
+
+# Figure builder
+# plotly.graph_objs validates every property of every trace and layout it
+# builds, which is a large share of the time a graph callback takes. The
+# figures the dashboard draws are fixed in code, so traces and layouts are
+# built as the plain dicts plotly would serialize them to. Setting
+# validate_figures in settings.py (or figure_utils.validate_figures while
+# debugging) builds graph_objs instead, so a bad property raises an error.
+
+
+def data_array(values):
+    """
+    Converts an array-like trace property to a JSON-ready value
+
+    Args:
+        values: pandas Series or Index, numpy array or list
+
+    Returns:
+        numpy array of numbers, or list of str for dates and text
+    """
+    if isinstance(values, (pd.Series, pd.Index)):
+        if pd.api.types.is_datetime64_any_dtype(values):
+            values = pd.Series(values)
+            date_format = "%Y-%m-%d"
+            if (values.dropna().dt.normalize() != values.dropna()).any():
+                date_format = "%Y-%m-%d %H:%M:%S"
+            return [None if pd.isnull(value) else value.strftime(date_format) for value in values]
+        values = values.to_numpy()
+    if isinstance(values, np.ndarray):
+        if values.dtype.kind == "M":
+            return data_array(pd.Series(values))
+        if values.dtype.kind in "biuf":
+            return values
+        return values.tolist()
+    return values
+
+
+def figure_trace(trace_type, **props):
+    """
+    Creates a trace of a figure
+
+    Args:
+        trace_type(str): plotly trace type, i.e. scatter, bar or pie
+        props: trace properties, the same as the graph_objs class takes
+
+    Returns:
+        dict: trace, or the graph_objs trace when validate_figures is set
+    """
+    if validate_figures:
+        return getattr(go, trace_type.capitalize())(**props)
+
+    trace = {"type": trace_type}
+    for prop, value in props.items():
+        if isinstance(value, (pd.Series, pd.Index, np.ndarray)):
+            value = data_array(value)
+        trace[prop] = value
+    return trace
+
+
+def figure_layout(**props):
+    """
+    Creates the layout of a figure
+
+    Args:
+        props: layout properties, the same as go.Layout takes
+
+    Returns:
+        dict: layout, or go.Layout when validate_figures is set
+    """
+    if validate_figures:
+        return go.Layout(**props)
+    return props
+
+
+# Figure output
+# Chart callbacks pass their figure through slim_figure before it is sent:
+# numbers are rounded to figure_decimals, long line series are decimated to
+# figure_max_points with largest triangle three buckets (LTTB), which keeps
+# the peaks and dips a reader would see, and per-point text that is never
+# shown is dropped.
+
+# serialized figure size of each chart callback when report_figure_sizes is set
+figure_payloads = {}
+_payloads_lock = threading.Lock()
+
+
+def lttb_indices(y, threshold):
+    """
+    Picks the points of a series to keep with largest triangle three buckets
+
+    Args:
+        y: numpy array of values, x is taken to be evenly spaced
+        threshold(int): number of points to keep
+
+    Returns:
+        numpy array: sorted indices of the points to keep
+    """
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = np.arange(n, dtype=float)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    indices = np.empty(threshold, dtype=int)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        # average of the next bucket, the last point for the final bucket
+        if bucket + 2 < len(edges):
+            next_start, next_end = edges[bucket + 1], edges[bucket + 2]
+            next_x = x[next_start:next_end].mean()
+            next_y = y[next_start:next_end].mean()
+        else:
+            next_x, next_y = x[-1], y[-1]
+
+        areas = np.abs(
+            (x[previous] - next_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (next_y - y[previous])
+        )
+        previous = start + int(areas.argmax())
+        indices[bucket + 1] = previous
+    return indices
+
+
+def shows_text(trace):
+    """
+    Checks if a trace's per-point text can be seen on the chart
+
+    Args:
+        trace(dict): figure trace
+
+    Returns:
+        bool: False if the text is only sent and never shown
+    """
+    hoverinfo = trace.get("hoverinfo") or "all"
+    if hoverinfo == "all" or "text" in hoverinfo.split("+"):
+        return True
+    if "%{text}" in str(trace.get("hovertemplate", "")):
+        return True
+    if trace.get("type") == "scatter":
+        return "text" in trace.get("mode", "")
+    if trace.get("type") == "bar":
+        return trace.get("textposition", "none") != "none"
+    return True
+
+
+def round_values(values, decimals):
+    """
+    Rounds an array of numbers, other values are returned as they are
+
+    Args:
+        values: trace property
+        decimals(int): number of decimal places
+
+    Returns:
+        rounded numpy array or the original values
+    """
+    if isinstance(values, (list, tuple)) and values and all(
+        isinstance(value, float) for value in values
+    ):
+        values = np.array(values)
+    if isinstance(values, np.ndarray) and values.dtype.kind == "f":
+        return np.round(values, decimals)
+    return values
+
+
+def slim_trace(trace, decimals=None, max_points=None):
+    """
+    Rounds, decimates and drops unshown text from one trace
+
+    Args:
+        trace(dict): figure trace
+        decimals(int): decimal places values are rounded to
+        max_points(int): most points kept in a line trace
+
+    Returns:
+        dict: slimmed copy of the trace
+    """
+    decimals = figure_decimals if decimals is None else decimals
+    max_points = figure_max_points if max_points is None else max_points
+    if hasattr(trace, "to_plotly_json"):
+        trace = trace.to_plotly_json()
+    trace = dict(trace)
+
+    if "text" in trace and not isinstance(trace["text"], str) and not shows_text(trace):
+        del trace["text"]
+
+    y = trace.get("y")
+    is_line = trace.get("type", "scatter") == "scatter" and "lines" in trace.get("mode", "lines")
+    if is_line and y is not None and not isinstance(y, str) and len(y) > max_points:
+        y = np.asarray(y)
+        if y.dtype.kind in "biuf" and not np.isnan(y.astype(float)).any():
+            keep = lttb_indices(y.astype(float), max_points)
+            for prop in ("x", "y", "text", "hovertext", "customdata"):
+                values = trace.get(prop)
+                if values is not None and not isinstance(values, str) and len(values) == len(y):
+                    trace[prop] = np.asarray(values)[keep]
+
+    for prop in ("x", "y", "z", "values"):
+        if prop in trace:
+            trace[prop] = round_values(trace[prop], decimals)
+    return trace
+
+
+def slim_figure(figure, decimals=None, max_points=None):
+    """
+    Slims every trace of a figure
+
+    Args:
+        figure(dict): figure with data and layout, or a plotly Figure
+        decimals(int): decimal places values are rounded to,
+            defaults to figure_decimals
+        max_points(int): most points kept in a line trace,
+            defaults to figure_max_points
+
+    Returns:
+        dict: figure with slimmed traces
+    """
+    if figure is None:
+        return figure
+    if hasattr(figure, "to_plotly_json"):
+        figure = figure.to_plotly_json()
+    figure = dict(figure)
+    figure["data"] = [
+        slim_trace(trace, decimals, max_points) for trace in figure.get("data", [])
+    ]
+    return figure
+
+
+def figure_size(figure):
+    """
+    Returns the number of bytes a figure serializes to
+
+    Args:
+        figure: figure dict or plotly Figure
+
+    Returns:
+        int: length of the JSON encoded figure
+    """
+    return len(json.dumps(figure, cls=plotly.utils.PlotlyJSONEncoder))
+
+
+def slim_figure_output(func):
+    """
+    Decorator for chart callbacks that return a figure, slims the figure
+    and records the bytes saved when report_figure_sizes is set
+
+    Args:
+        func(func): callback that returns a figure
+
+    Returns:
+        func: wrapped callback
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        figure = func(*args, **kwargs)
+        slimmed = slim_figure(figure)
+        if report_figure_sizes and figure is not None:
+            before, after = figure_size(figure), figure_size(slimmed)
+            with _payloads_lock:
+                payload = figure_payloads.setdefault(
+                    func.__name__, {"calls": 0, "bytes_before": 0, "bytes_after": 0}
+                )
+                payload["calls"] += 1
+                payload["bytes_before"] += before
+                payload["bytes_after"] += after
+            print(f"{func.__name__} figure {before} -> {after} bytes")
+        return slimmed
+
+    return wrapper
+
+
+def figure_payload_stats():
+    """
+    Returns the figure sizes recorded for each chart callback
+
+    Returns:
+        dict: callback name to calls and total bytes before and after slimming
+    """
+    with _payloads_lock:
+        return {name: dict(payload) for name, payload in figure_payloads.items()}
@@ -1,10 +1,12 @@
-import sqlite3
 import calendar
-import plotly.graph_objs as go
 from plotly.subplots import make_subplots
 import pandas as pd
 import paceutils
-from .settings import color_palette, db_filepath, agg_filepath
+from .settings import color_palette, db_filepath, agg_filepath, card_cache_size, graph_cache_size
+from .figure_utils import figure_trace, figure_layout
+from .db_utils import db_pool, agg_pool
+from .cache_utils import DataCache
+from .sparkline_utils import stored_sparkline, sparkline_figure
 
 helpers = paceutils.Helpers(db_filepath)
 enrollment = paceutils.Enrollment(db_filepath)
@@ -25,6 +27,12 @@ time_range_dict = {
     "quarter_td": (helpers.quarter_to_date, helpers.prev_quarter_dates),
 }
 
+#cache of computed card values and sparklines
+card_cache = DataCache(maxsize=card_cache_size)
+
+#cache of the agg dataframes plotted on the default graph page
+graph_cache = DataCache(maxsize=graph_cache_size)
+
 def arrow_direction(prev_val, current_val):
     """
     Returns font icon arrow based on 
@@ -111,28 +119,22 @@ def indicator_color(threshold=None, current_value=0, polarity="above"):
         return below_threshold(threshold, current_value)
     return "#030027"
     
-def card_value(time_range, value_function, agg_table, agg_col, card_layout, additional_args=None, threshold_value=None, polarity="above"):
+def card_data(value_function, params, prev_params, agg_table, agg_col, sparkline_params, additional_args=None):
     """
-    Returns a bootstrap card with values defined in the design of the dashboard.
+    Calculates the values shown on a card
 
     Args:
-        time_range(str): time range value from time radio button
-        value_function(func): function to use to calculate the indicator - most come from
-            the paceutils module
+        value_function(func): function to use to calculate the indicator
+        params(tuple): start date and end date of the current period
+        prev_params(tuple): start date and end date of the previous period
         agg_table: table in the agg database to use to build the dataframe for the sparkline
         agg_col: column in the table to use to build the dataframe for the sparkline
-        card_layout(func): function that creates the row, col and card bootstrap elements
+        sparkline_params(tuple): start date and end date of the sparkline
         additional_args(list): list of additional arguments for the value_function
-        threshold_value(int/float):  threshold value for indicator
-        polarity(str): above means the indicator should be above the threshold,
-            below means the indicator should be below
-    
+
     Returns:
-        list: list of bootstrap components that create a card
+        tuple: current value, arrow direction and sparkline figure
     """
-    params = time_range_dict[time_range][0]()
-    prev_params = time_range_dict[time_range][1](params)
-
     if additional_args is None:
         prev_value = value_function(prev_params)
         current_value = value_function(params)
@@ -141,9 +143,73 @@ def card_value(time_range, value_function, agg_table, agg_col, card_layout, addi
         current_value = value_function(params, *additional_args)
 
     arrow = arrow_direction(prev_value, current_value)
-    
-    plot_df = agg.get_plot_df(agg_table, agg_col, params=helpers.last_year())
-    figure = sparkline(plot_df)
+
+    figure = stored_sparkline(agg_table, agg_col, sparkline_params)
+    if figure is None:
+        plot_df = agg.get_plot_df(agg_table, agg_col, params=sparkline_params)
+        figure = sparkline(plot_df)
+
+    return current_value, arrow, figure
+
+
+def card_periods(time_range):
+    """
+    Returns the periods used by the cards for a time range button value
+
+    Args:
+        time_range(str): time range value from time radio button
+
+    Returns:
+        tuple: current period, previous period and sparkline period, each
+            a tuple of start date and end date
+    """
+    params = time_range_dict[time_range][0]()
+    prev_params = time_range_dict[time_range][1](params)
+    return params, prev_params, helpers.last_year()
+
+
+def card_content(periods, value_function, agg_table, agg_col, card_layout, additional_args=None, threshold_value=None, polarity="above"):
+    """
+    Returns a bootstrap card for periods that have already been resolved.
+
+    Args:
+        periods(tuple): current, previous and sparkline periods from card_periods
+        value_function(func): function to use to calculate the indicator
+        agg_table: table in the agg database to use to build the dataframe for the sparkline
+        agg_col: column in the table to use to build the dataframe for the sparkline
+        card_layout(func): function that creates the row, col and card bootstrap elements
+        additional_args(list): list of additional arguments for the value_function
+        threshold_value(int/float):  threshold value for indicator
+        polarity(str): above means the indicator should be above the threshold,
+            below means the indicator should be below
+
+    Returns:
+        list: list of bootstrap components that create a card
+    """
+    params, prev_params, sparkline_params = periods
+
+    # values only change when the period or the data files change
+    cache_key = (
+        value_function,
+        tuple(params),
+        tuple(prev_params),
+        tuple(additional_args or ()),
+        agg_table,
+        agg_col,
+        tuple(sparkline_params),
+    )
+    current_value, arrow, figure = card_cache.get_or_compute(
+        cache_key,
+        card_data,
+        value_function,
+        params,
+        prev_params,
+        agg_table,
+        agg_col,
+        sparkline_params,
+        additional_args,
+    )
+
     if threshold_value is not None:
         color = indicator_color(threshold_value, current_value, polarity)
         return card_layout(
@@ -154,6 +220,99 @@ def card_value(time_range, value_function, agg_table, agg_col, card_layout, addi
         )
 
 
+def graph_plot_df(table, col, params):
+    """
+    Returns the dataframe plotted on the default graph page for a column
+    of an agg table, team tables are broken out by team
+
+    Args:
+        table(str): table in the agg database, ending in _q for quarters
+        col(str): column in the table
+        params(tuple): start date and end date in format 'YYYY-MM-DD'
+
+    Returns:
+        DataFrame: copy of the cached dataframe, the graph functions
+            add columns to it
+    """
+    plot_func = agg.team_plot_df if table[:4] == "team" else agg.get_plot_df
+    df = graph_cache.get_or_compute((table, col, tuple(params)), plot_func, table, col, params)
+    return df.copy()
+
+
+def card_value(time_range, value_function, agg_table, agg_col, card_layout, additional_args=None, threshold_value=None, polarity="above"):
+    """
+    Returns a bootstrap card with values defined in the design of the dashboard.
+
+    Args:
+        time_range(str): time range value from time radio button
+        value_function(func): function to use to calculate the indicator - most come from
+            the paceutils module
+        agg_table: table in the agg database to use to build the dataframe for the sparkline
+        agg_col: column in the table to use to build the dataframe for the sparkline
+        card_layout(func): function that creates the row, col and card bootstrap elements
+        additional_args(list): list of additional arguments for the value_function
+        threshold_value(int/float):  threshold value for indicator
+        polarity(str): above means the indicator should be above the threshold,
+            below means the indicator should be below
+    
+    Returns:
+        list: list of bootstrap components that create a card
+    """
+    return card_content(
+        card_periods(time_range),
+        value_function,
+        agg_table,
+        agg_col,
+        card_layout,
+        additional_args,
+        threshold_value,
+        polarity,
+    )
+
+
+def card_values(time_range, cards):
+    """
+    Returns the contents of every card on a page so a page can fill all
+    of its cards with one callback. The periods are resolved once and
+    queries that go through db_pool or agg_pool (sql_return_df,
+    sql_fetchall, stored sparklines) share one connection from each pool.
+    Card functions from paceutils open their own connections as before.
+
+    Args:
+        time_range(str): time range value from time radio button
+        cards(dict): card value id to either a dict of card_value keyword
+            arguments (without time_range) or a function that takes the
+            current period and returns the card contents
+
+    Returns:
+        dict: card value id to the contents of the card
+    """
+    periods = card_periods(time_range)
+    values = {}
+    with db_pool.session(), agg_pool.session():
+        for card_id, card in cards.items():
+            if callable(card):
+                values[card_id] = card(periods[0])
+            else:
+                values[card_id] = card_content(periods, **card)
+    return values
+
+
+def default_dates():
+    """
+    Returns the dates the start and end date inputs are set to,
+    a year before today and today
+
+    Returns:
+        tuple: start date and end date in format 'MM/DD/YYYY'
+    """
+    today = pd.to_datetime("today")
+    return (
+        (today - pd.DateOffset(years=1)).strftime("%m/%d/%Y"),
+        today.strftime("%m/%d/%Y"),
+    )
+
+
 def create_daterange(start_date, end_date, freq, update=True):
     """
     Create a range of dates for given start date, end date and frequency
@@ -255,12 +414,57 @@ def sql_return_df(query, params, date_cols):
     Returns:
         df: dataframe
     """
-    conn = sqlite3.connect(db_filepath)
-    df = pd.read_sql(query, conn, params=params, parse_dates=date_cols)
-    conn.close()
+    with db_pool.connection() as conn:
+        df = pd.read_sql(query, conn, params=params, parse_dates=date_cols)
     return df
 
 
+def sql_fetchall(query, params=None, pool=db_pool):
+    """
+    Returns all rows of the provided SQL query
+
+    Args:
+        query: Valid SQL query
+
+        params: parameter for parameterized SQL query
+
+        pool: connection pool of the database to query,
+            defaults to the dashboard database
+
+    Returns:
+        list: list of row tuples
+    """
+    with pool.connection() as conn:
+        cursor = conn.cursor()
+        try:
+            return cursor.execute(query, params or []).fetchall()
+        finally:
+            cursor.close()
+
+
+def sql_fetchone(query, params=None, pool=db_pool):
+    """
+    Returns the first row of the provided SQL query
+
+    Args:
+        query: Valid SQL query
+
+        params: parameter for parameterized SQL query
+
+        pool: connection pool of the database to query,
+            defaults to the dashboard database
+
+    Returns:
+        tuple: first row of the results, None if there are no rows
+    """
+    with pool.connection() as conn:
+        cursor = conn.cursor()
+        try:
+            return cursor.execute(query, params or []).fetchone()
+        finally:
+            cursor.close()
+
+
 def create_center_sql(center, params):
     """
     Create SQL need to filter query by center
@@ -356,7 +560,7 @@ def build_bar_layout(
         }
     else:
         x_axis = {"title": x_title, "showgrid": False, "showline": False}
-    return go.Layout(
+    return figure_layout(
         margin=margin,
         barmode=bar_mode,
         xaxis=x_axis,
@@ -442,7 +646,7 @@ def build_scatter_layout(
     else:
         x_axis = {"title": x_title, "showgrid": False, "showline": False}
 
-    return go.Layout(
+    return figure_layout(
         margin=margin,
         xaxis=x_axis,
         yaxis={
@@ -485,7 +689,8 @@ def create_line_graph(plot_df, title="", x_title="", y_title=""):
 
     """
     fig_data = [
-        go.Scatter(
+        figure_trace(
+            "scatter",
             x=plot_df.iloc[:, 0].astype(str),
             y=plot_df.iloc[:, 1],
             text=plot_df.iloc[:, 1],
@@ -524,7 +729,8 @@ def create_bar_graph(plot_df, title="", x_title="", y_title=""):
     """
     plot_df["quarter"] = pd.PeriodIndex(pd.to_datetime(plot_df.iloc[:, 0]), freq="Q")
     fig_data = [
-        go.Bar(
+        figure_trace(
+            "bar",
             x=plot_df["quarter"].astype(str),
             y=plot_df.iloc[:, 1],
             text=plot_df.iloc[:, 1],
@@ -572,28 +778,32 @@ def create_team_line_graph(plot_df, plot_type="scatter", title_suffix=""):
 
     if plot_type == "bar":
         plot_df["quarter"] = pd.PeriodIndex(pd.to_datetime(plot_df["month"]), freq="Q")
-        central = go.Bar(
+        central = figure_trace(
+            "bar",
             x=plot_df["quarter"].astype(str),
             y=plot_df["Central"],
             text=plot_df["Central"],
             marker={"color": team_colors["Central"]},
             hoverinfo="x+y",
         )
-        south = go.Bar(
+        south = figure_trace(
+            "bar",
             x=plot_df["quarter"].astype(str),
             y=plot_df["South"],
             text=plot_df["South"],
             marker={"color": team_colors["South"]},
             hoverinfo="x+y",
         )
-        east = go.Bar(
+        east = figure_trace(
+            "bar",
             x=plot_df["quarter"].astype(str),
             y=plot_df["East"],
             text=plot_df["East"],
             marker={"color": team_colors["East"]},
             hoverinfo="x+y",
         )
-        north = go.Bar(
+        north = figure_trace(
+            "bar",
             x=plot_df["quarter"].astype(str),
             y=plot_df["North"],
             text=plot_df["North"],
@@ -602,28 +812,32 @@ def create_team_line_graph(plot_df, plot_type="scatter", title_suffix=""):
         )
 
     if plot_type == "scatter":
-        central = go.Scatter(
+        central = figure_trace(
+            "scatter",
             x=plot_df["month"],
             y=plot_df["Central"],
             mode="lines",
             line={"width": 7, "color": team_colors["Central"]},
             hoverinfo="x+y",
         )
-        south = go.Scatter(
+        south = figure_trace(
+            "scatter",
             x=plot_df["month"],
             y=plot_df["South"],
             mode="lines",
             line={"width": 7, "color": team_colors["South"]},
             hoverinfo="x+y",
         )
-        east = go.Scatter(
+        east = figure_trace(
+            "scatter",
             x=plot_df["month"],
             y=plot_df["East"],
             mode="lines",
             line={"width": 7, "color": team_colors["East"]},
             hoverinfo="x+y",
         )
-        north = go.Scatter(
+        north = figure_trace(
+            "scatter",
             x=plot_df["month"],
             y=plot_df["North"],
             mode="lines",
@@ -699,32 +913,4 @@ def sparkline(plot_df):
     Returns:
         dict: dictionary to pass to ploty graph figure
     """
-
-    figure = {
-        "data": [
-            go.Scatter(
-                x=plot_df.iloc[:, 0],
-                y=plot_df.iloc[:, 1],
-                mode="lines",
-                text=plot_df.iloc[:, 1],
-                line={"width": 3, "color": "#262626"},
-                hoverinfo="none",
-            )
-        ],
-        "layout": go.Layout(
-            margin={"pad": 0, "l": 10, "r": 10, "t": 10, "b": 10},
-            xaxis={
-                "showgrid": False,
-                "showline": False,
-                "zeroline": False,
-                "showticklabels": False,
-            },
-            yaxis={"showgrid": False, "zeroline": False, "showticklabels": False},
-            showlegend=False,
-            autosize=True,
-            paper_bgcolor="rgba(0,0,0,0)",
-            plot_bgcolor="rgba(0,0,0,0)",
-        ),
-    }
-    
-    return figure
+    return sparkline_figure(plot_df.iloc[:, 0], plot_df.iloc[:, 1])
@@ -2,16 +2,16 @@ import textwrap
 from titlecase import titlecase
 import pandas as pd
 import numpy as np
-import plotly.graph_objs as go
 from .helper_functions import (
     create_center_sql,
     create_join_sql,
     sql_return_df,
+    sql_fetchall,
     build_bar_layout,
     build_scatter_layout,
-    helpers
 )
 from .settings import color_palette
+from .figure_utils import figure_trace
 from .enrollment_eda_utils import census_count_df
 
 
@@ -427,13 +427,14 @@ def get_total_incidents(incident, start_date, end_date, freq, center):
     """}
     
 
-    totals = [val[0] for val in helpers.fetchall_query(query_dict[freq], params)]
+    totals = [val[0] for val in sql_fetchall(query_dict[freq], params)]
     
     return totals
 
-def incidents_df(start_date, end_date, incident, center, freq):
+def incidents_query(start_date, end_date, incident, center):
     """
-    Creates pandas dataframe from SQL table of selected incident
+    Creates the query incidents_df runs, also explained by
+    index_utils to check its query plan
 
     Args:
         start_date: First date to include in resulting dataframe
@@ -444,23 +445,42 @@ def incidents_df(start_date, end_date, incident, center, freq):
 
         center: Name of PACE center
 
-        freq: M or Q, determines if results should be grouped by
-            month or quarter
-
     Returns:
-        df: pandas dataframe with all columns of SQL table
-            of selected incident with a date column for
-            grouping the df by month or quarter
+        tuple: query and parameters
     """
     params = [pd.to_datetime(start_date).date(), pd.to_datetime(end_date).date()]
     center_sql, params = create_center_sql(center, params)
- 
+
     query = f"""
     SELECT DISTINCT i.* FROM {incident} i
     JOIN centers on i.member_id=centers.member_id
     WHERE i.date_time_occurred BETWEEN ? AND ?
     {center_sql};
     """
+    return query, params
+
+def incidents_df(start_date, end_date, incident, center, freq):
+    """
+    Creates pandas dataframe from SQL table of selected incident
+
+    Args:
+        start_date: First date to include in resulting dataframe
+
+        end_date: Last date to include in resulting dataframe
+
+        incident: incident table to run query on
+
+        center: Name of PACE center
+
+        freq: M or Q, determines if results should be grouped by
+            month or quarter
+
+    Returns:
+        df: pandas dataframe with all columns of SQL table
+            of selected incident with a date column for
+            grouping the df by month or quarter
+    """
+    query, params = incidents_query(start_date, end_date, incident, center)
     df = sql_return_df(query, params, ["date_time_occurred"])
     df["date"] = df["date_time_occurred"].dt.to_period(freq[0])
 
@@ -508,7 +528,7 @@ def repeat_ppts(incident, start_date, end_date, center):
         GROUP BY {incident}.member_id
         HAVING COUNT(*) > 1;
         """
-    ppts_w_multiple = helpers.fetchall_query(repeat_incidents_query, params)
+    ppts_w_multiple = sql_fetchall(repeat_incidents_query, params)
     
     return ppts_w_multiple   
 
@@ -600,7 +620,8 @@ def update_graph(
         plot_df = plot_df[["date"] + incident_details]
 
     fig_data = [
-            go.Bar(
+            figure_trace(
+                "bar",
                 x=plot_df["date"].astype(str),
                 y=(plot_df[col] / totals) * 100,
                 text=[
@@ -677,7 +698,8 @@ def update_trending_graph(incident, start_date, end_date, freq, measure, center,
 
     if freq == 'Q':
         fig_data = [
-            go.Bar(
+            figure_trace(
+                "bar",
                 x=plot_df["date"].astype(str),
                 y=plot_df["count"],
                 marker={"color": color_palette[0]},
@@ -686,7 +708,8 @@ def update_trending_graph(incident, start_date, end_date, freq, measure, center,
         ]
     else:        
         fig_data = [
-            go.Scatter(
+            figure_trace(
+                "scatter",
                 x=plot_df["date"].astype(str),
                 y=plot_df["count"],
                 mode="lines",
@@ -745,7 +768,7 @@ def incident_details_options(start_date, end_date, selected_incident, selected_c
         {center_sql};
         """
 
-        incident_options = [val[0] for val in helpers.fetchall_query(query, params)]
+        incident_options = [val[0] for val in sql_fetchall(query, params)]
         
     if len(incident_options) > int(amount):
         return [
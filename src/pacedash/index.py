@@ -1,61 +1,101 @@
 import datetime
+import importlib
+import threading
+import time
 from flask import current_app as server
 from dash.dependencies import Output, Input
 from dash.exceptions import PreventUpdate
 import dash_html_components as html
 from flask_login import logout_user, current_user
-import pandas as pd
 from .app import app
-from .pages import (
-    create_pw,
-    default_graph_page,
-    demographics,
-    demographics_eda,
-    enrollment,
-    enrollment_eda,
-    incidents,
-    incidents_eda,
-    inpatient,
-    login,
-    login_fd,
-    logout,
-    nursing_facilities,
-    operations,
-    ppt_map,
-    teams,
-    town_table,
-    utilization_eda,
-)
 from .components import Navbar
 from .settings import log_path
+from .helper_functions import default_dates
 from .utils import get_url
 
+# Page modules
+# Every page is imported at startup so its callbacks are registered before
+# the first request, but a page's layout is only built the first time the
+# page is visited and is then reused. The seconds each import took are kept
+# in page_import_seconds.
+
+page_names = [
+    "create_pw",
+    "default_graph_page",
+    "demographics",
+    "demographics_eda",
+    "enrollment",
+    "enrollment_eda",
+    "incidents",
+    "incidents_eda",
+    "inpatient",
+    "login",
+    "login_fd",
+    "logout",
+    "nursing_facilities",
+    "operations",
+    "ppt_map",
+    "teams",
+    "town_table",
+    "utilization_eda",
+]
+
+pages = {}
+page_import_seconds = {}
+for name in page_names:
+    start = time.perf_counter()
+    pages[name] = importlib.import_module(f".pages.{name}", __package__)
+    page_import_seconds[name] = time.perf_counter() - start
+
+_layouts = {}
+_layouts_lock = threading.Lock()
+
+
+def page_layout(name):
+    """
+    Returns the layout of a page, building it on the first visit
+
+    Args:
+        name(str): page module name from page_names
+
+    Returns:
+        Dash Component: layout of the page
+    """
+    layout = _layouts.get(name)
+    if layout is None:
+        with _layouts_lock:
+            layout = _layouts.get(name)
+            if layout is None:
+                layout = _layouts[name] = pages[name].build_layout()
+    return layout
+
+
 # The router
-# Ordered iterable of routes: tuples of (route, layout), where 'route' is a
+# Ordered iterable of routes: tuples of (route, page), where 'route' is a
 # string corresponding to path of the route (will be prefixed with Dash's
-# 'routes_pathname_prefix' and 'layout' is a Dash Component.
+# 'routes_pathname_prefix' and 'page' is the name of the page module.
 
 urls = (
-    ("", enrollment.layout),
-    ("login", login.layout),
-    ("logout", logout.layout),
-    ("create_password", create_pw.layout),
-    ("enrollment", enrollment.layout),
-    ("demographics", demographics.layout),
-    ("incidents", incidents.layout),
-    ("utilization", inpatient.layout),
-    ("inpatient", inpatient.layout),
-    ("nursing-facility", nursing_facilities.layout),
-    ("teams", teams.layout),
-    ("enrollment-eda", enrollment_eda.layout),
-    ("demographics-eda", demographics_eda.layout),
-    ("incidents-eda", incidents_eda.layout),
-    ("utilization-eda", utilization_eda.layout),
-    ("map", ppt_map.layout),
-    ("town_count", town_table.layout),
+    ("", "enrollment"),
+    ("login", "login"),
+    ("logout", "logout"),
+    ("create_password", "create_pw"),
+    ("enrollment", "enrollment"),
+    ("demographics", "demographics"),
+    ("incidents", "incidents"),
+    ("utilization", "inpatient"),
+    ("inpatient", "inpatient"),
+    ("nursing-facility", "nursing_facilities"),
+    ("teams", "teams"),
+    ("enrollment-eda", "enrollment_eda"),
+    ("demographics-eda", "demographics_eda"),
+    ("incidents-eda", "incidents_eda"),
+    ("utilization-eda", "utilization_eda"),
+    ("map", "ppt_map"),
+    ("town_count", "town_table"),
 )
 
-routes = {get_url(route): layout for route, layout in urls}
+routes = {get_url(route): page for route, page in urls}
 
 # creates list of paths that need to be password protected
 protected_paths = [
@@ -74,14 +114,14 @@ protected_paths = [
 def router(pathname):
     """routes pathname to correct layout"""
     if current_user.is_authenticated:
-        default_layout = default_graph_page.layout
+        default_page = "default_graph_page"
     else:
-        default_layout = login_fd.layout
+        default_page = "login_fd"
     if pathname in protected_paths:
         if current_user.is_authenticated:
-            return routes.get(pathname, default_layout)
+            return page_layout(routes.get(pathname, default_page))
 
-        return login_fd.layout
+        return page_layout("login_fd")
     if pathname == "/logout":
         if current_user.is_authenticated:
 
@@ -90,11 +130,11 @@ def router(pathname):
             log_file.close()
 
             logout_user()
-            return routes.get(pathname, default_layout)
+            return page_layout(routes.get(pathname, default_page))
 
-        return routes.get(pathname, default_layout)
+        return page_layout(routes.get(pathname, default_page))
 
-    return routes.get(pathname, default_layout)
+    return page_layout(routes.get(pathname, default_page))
 
 
 # logout button
@@ -133,7 +173,7 @@ def update_start_date(n):
     Used to update the start date value to a 
     year before today's date every 12 hours
     """
-    return (pd.to_datetime("today") - pd.DateOffset(years=1)).strftime("%m/%d/%Y")
+    return default_dates()[0]
 
 
 @app.callback(Output("end_date", "value"), [Input("interval-component", "n_intervals")])
@@ -142,7 +182,7 @@ def update_end_date(n):
     Used to update the end date value to today's date
     every 12 hours
     """
-    return pd.to_datetime("today").strftime("%m/%d/%Y")
+    return default_dates()[1]
 
 
 # The Navbar
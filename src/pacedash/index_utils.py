@@ -0,0 +1,235 @@
+import argparse
+import sqlite3
+from functools import partial
+from pathlib import Path
+from .db_utils import read_only_uri, table_column_names
+from .profiler_utils import explain, plan_has_full_scan
+from .cube_utils import cube_tables, cube_date_cols
+from .utilization_eda_utils import utilization_frame_query, cube_frame_query
+from .incidents_eda_utils import incidents_query, drop_downs
+from .demographics_eda_utils import demographic_query
+from .team_utils import (
+    team_query,
+    info_from_sql,
+    info_columns,
+    utilization_from_sql,
+    utilization_columns,
+    incidents_from_sql,
+    incident_columns,
+)
+
+# Index provisioning
+# Dashboard queries limit rows with BETWEEN ? AND ? on a date column and
+# most join centers on member_id to filter by PACE center. Each date column
+# is indexed together with member_id, which covers both the range lookup and
+# the join, and the tables joined on member_id are indexed by it with the
+# columns read from them, so those joins never read the tables themselves.
+# explain_report runs EXPLAIN QUERY PLAN on the queries the pages build.
+
+indexed_date_cols = [
+    "admission_date",
+    "discharge_date",
+    "date_time_occurred",
+    "enrollment_date",
+    "disenrollment_date",
+]
+
+# tables joined on member_id and the columns of their index
+member_indexes = {
+    "centers": ["member_id", "center"],
+    "teams": ["member_id", "team"],
+    "demographics": ["member_id"],
+}
+
+# parameters the query builders are explained with
+sample_dates = ("2019-01-01", "2019-12-31")
+sample_centers = ["all", "Providence"]
+
+
+def table_names(conn):
+    """
+    Returns the tables in the database
+
+    Args:
+        conn: sqlite3 connection
+
+    Returns:
+        list: table names
+    """
+    return [
+        row[0]
+        for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+        )
+    ]
+
+
+def planned_indexes(conn):
+    """
+    Returns the indexes the dashboard's query shapes need
+
+    Args:
+        conn: sqlite3 connection
+
+    Returns:
+        list: tuples of index name, table and indexed columns
+    """
+    indexes = []
+    for table in table_names(conn):
+        cols = table_column_names(conn, table)
+        if table in member_indexes:
+            index_cols = member_indexes[table]
+            if set(index_cols).issubset(cols):
+                indexes.append((f"idx_{table}_{'_'.join(index_cols)}", table, index_cols))
+            continue
+
+        for date_col in indexed_date_cols:
+            if date_col not in cols:
+                continue
+            index_cols = [date_col, "member_id"] if "member_id" in cols else [date_col]
+            indexes.append((f"idx_{table}_{date_col}", table, index_cols))
+    return indexes
+
+
+def ensure_indexes(filepath):
+    """
+    Creates any of the planned indexes that the database is missing and
+    updates the query planner statistics if an index was created
+
+    Args:
+        filepath(str): path to the SQLite database
+
+    Returns:
+        list: names of the indexes that were created
+    """
+    # mode=rw so a missing database is an error instead of a new empty file
+    conn = sqlite3.connect(f"{Path(filepath).absolute().as_uri()}?mode=rw", uri=True)
+    try:
+        existing = {
+            row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+        }
+        created = []
+        for name, table, cols in planned_indexes(conn):
+            if name in existing:
+                continue
+            conn.execute(f"CREATE INDEX {name} ON {table} ({', '.join(cols)})")
+            created.append(name)
+
+        if created:
+            conn.execute("ANALYZE")
+        conn.commit()
+    finally:
+        conn.close()
+    return created
+
+
+def query_templates(conn):
+    """
+    Returns the dashboard's queries, built by the same functions the
+    pages run them with and filled in with sample parameters so they
+    can be explained
+
+    Args:
+        conn: sqlite3 connection
+
+    Returns:
+        list: tuples of description, query and parameters
+    """
+    tables = table_names(conn)
+    columns = partial(table_column_names, conn)
+    start_date, end_date = sample_dates
+    templates = []
+    for center in sample_centers:
+        # utilization EDA rows, er reads er_only and acute
+        for utl_type in cube_tables + ["er"]:
+            needed = ["er_only", "acute"] if utl_type == "er" else [utl_type]
+            if not set(needed).issubset(tables):
+                continue
+            query, params, _ = utilization_frame_query(
+                utl_type, center, start_date, end_date, columns
+            )
+            templates.append((f"utilization_frame {utl_type} {center}", query, params))
+
+        if "utilization_cube" in tables:
+            for utl_type in cube_tables:
+                for date_type in cube_date_cols:
+                    query, params, _ = cube_frame_query(
+                        utl_type, date_type, center, start_date, end_date
+                    )
+                    templates.append((f"cube_frame {utl_type} {date_type} {center}", query, params))
+
+        for incident in drop_downs:
+            if incident in tables:
+                query, params = incidents_query(start_date, end_date, incident, center)
+                templates.append((f"incidents_df {incident} {center}", query, params))
+
+        query, params = demographic_query(start_date, end_date, center, ["d.dob"])
+        templates.append((f"demographic_df {center}", query, params))
+
+    team_params = {"start_date": start_date, "end_date": end_date}
+    for name, from_sql, cols in [
+        ("team_info", info_from_sql, info_columns),
+        ("team_utilization", utilization_from_sql, utilization_columns),
+        ("team_incidents", incidents_from_sql, incident_columns),
+    ]:
+        templates.append((name, team_query(from_sql, cols), team_params))
+    return templates
+
+
+def explain_report(filepath):
+    """
+    Runs EXPLAIN QUERY PLAN for every query template
+
+    Args:
+        filepath(str): path to the SQLite database
+
+    Returns:
+        list: dictionaries with the template description, query plan
+            lines and whether any table is read with a full scan
+    """
+    conn = sqlite3.connect(read_only_uri(filepath), uri=True)
+    try:
+        report = []
+        for description, query, params in query_templates(conn):
+            plan = explain(conn, query, params)
+            report.append(
+                {"template": description, "plan": plan, "full_scan": plan_has_full_scan(plan)}
+            )
+    finally:
+        conn.close()
+    return report
+
+
+def print_report(report):
+    """
+    Prints an explain report, full scans first
+
+    Args:
+        report(list): output of explain_report
+    """
+    for row in sorted(report, key=lambda row: not row["full_scan"]):
+        status = "FULL SCAN" if row["full_scan"] else "ok"
+        print(f"{status:<10}{row['template']}")
+        for line in row["plan"]:
+            print(f"{'':<10}  {line}")
+
+
+def main():
+    """
+    Creates missing indexes in a database and prints the query plans
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("filepath", metavar="DB_PATH")
+    parser.add_argument(
+        "--report-only", action="store_true", help="print query plans without creating indexes"
+    )
+    args = parser.parse_args()
+
+    if not args.report_only:
+        created = ensure_indexes(args.filepath)
+        print(f"Created {len(created)} indexes: {', '.join(created)}")
+    print_report(explain_report(args.filepath))
+
+
+if __name__ == "__main__":
+    main()
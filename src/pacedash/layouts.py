@@ -126,7 +126,7 @@ def utilization_header(title):
 
                      
 #card column wrappers
-def card_col(card_title='', card_val_id='', color=color_palette[1], size=2, title_id='', width='95%', height='90%', font_size="2.5vmax"):
+def card_col(card_title='', card_val_id='', color=color_palette[1], size=2, title_id='', width='95%', height='90%', font_size="2.5vmax", values=None):
     """
     Creates a column contains one bootstrap card
 
@@ -137,6 +137,8 @@ def card_col(card_title='', card_val_id='', color=color_palette[1], size=2, titl
         size: width of column
         title_id: if title needs to be updated with a callback
             this is set to the id and card_title is set to ''
+        values: dictionary of card value id to the contents of the card
+            body, used when a page fills all of its cards in one callback
 
     Returns:
         Column containing one card
@@ -153,7 +155,7 @@ def card_col(card_title='', card_val_id='', color=color_palette[1], size=2, titl
                             "background-color": color
                                 },
                     ),
-                    html.H3(id=card_val_id, className="card-value", style={
+                    html.H3((values or {}).get(card_val_id), id=card_val_id, className="card-value", style={
     "font-size": font_size}),
                 ],
                 style={"width": width, "height": height},
@@ -0,0 +1,320 @@
+import bisect
+import threading
+import time
+from collections import deque
+from functools import wraps
+from flask import Response, abort, jsonify, request
+from dash.exceptions import PreventUpdate
+from .db_utils import pool_stats, thread_db_seconds
+from .profiler_utils import query_report
+from .settings import metrics_recent_calls, metrics_local_only
+
+# Callback metrics
+# instrument_callbacks replaces app.callback so every callback registered
+# after it is timed. The callback function is timed on its own (wall time
+# and the time it held pooled database connections) and dash's wrapper
+# around it, which serializes the return value, is timed as well, so the
+# serialization time is the difference. Totals are kept as histograms per
+# callback id and served in the Prometheus text format on /metrics, the
+# most recent calls are kept for the slowest callbacks view.
+
+seconds_buckets = [0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30]
+bytes_buckets = [1_000, 10_000, 50_000, 100_000, 250_000, 500_000, 1_000_000, 5_000_000]
+
+
+class Histogram:
+    """
+    Cumulative histogram in the Prometheus style
+
+    Args:
+        buckets(list): upper bounds of the buckets, in increasing order
+    """
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def lines(self, name, labels):
+        """
+        Returns the histogram in the Prometheus text format
+
+        Args:
+            name(str): metric name
+            labels(str): label pairs, i.e. callback="graph.figure"
+
+        Returns:
+            list: lines of the exposition format
+        """
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + ["+Inf"], self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+        lines.append(f"{name}_sum{{{labels}}} {self.sum}")
+        lines.append(f"{name}_count{{{labels}}} {self.count}")
+        return lines
+
+
+class CallbackMetrics:
+    """
+    Timings, payload sizes and error counts of one callback
+    """
+
+    def __init__(self):
+        self.wall = Histogram(seconds_buckets)
+        self.db = Histogram(seconds_buckets)
+        self.serialize = Histogram(seconds_buckets)
+        self.payload = Histogram(bytes_buckets)
+        self.errors = 0
+        self.prevented = 0
+
+
+callback_metrics = {}
+# (time, callback id, wall seconds) of the most recent calls
+recent_calls = deque(maxlen=metrics_recent_calls)
+_metrics_lock = threading.Lock()
+
+# seconds spent in the callback function, per thread, read by the outer
+# wrapper to split out the serialization time
+_call_timing = threading.local()
+
+
+def callback_id(output):
+    """
+    Returns the id dash gives a callback with this output
+
+    Args:
+        output: dash Output
+
+    Returns:
+        str: component id and property separated by a dot
+    """
+    return f"{output.component_id}.{output.component_property}"
+
+
+def _metrics_for(cid):
+    metrics = callback_metrics.get(cid)
+    if metrics is None:
+        metrics = callback_metrics[cid] = CallbackMetrics()
+    return metrics
+
+
+def timed_callback(cid, func):
+    """
+    Wraps a callback function to time it and count its errors
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        db_start = thread_db_seconds()
+        try:
+            return func(*args, **kwargs)
+        except PreventUpdate:
+            with _metrics_lock:
+                _metrics_for(cid).prevented += 1
+            raise
+        except Exception:
+            with _metrics_lock:
+                _metrics_for(cid).errors += 1
+            raise
+        finally:
+            _call_timing.seconds = time.perf_counter() - start
+            _call_timing.db_seconds = thread_db_seconds() - db_start
+
+    return wrapper
+
+
+def response_size(response):
+    """
+    Returns the size of a callback response in bytes, dash 0.36 returns a
+    flask Response and older versions return the serialized JSON string
+
+    Returns:
+        int: size in bytes, None if there is no body to measure
+    """
+    if isinstance(response, Response):
+        if response.is_streamed:
+            return None
+        return len(response.get_data())
+    if isinstance(response, str):
+        return len(response.encode("utf-8"))
+    if isinstance(response, bytes):
+        return len(response)
+    return None
+
+
+def timed_response(cid, dash_wrapper):
+    """
+    Wraps dash's callback wrapper to time the whole call and
+    measure the serialized response, calls that raise an error or
+    PreventUpdate are timed too
+    """
+
+    @wraps(dash_wrapper)
+    def wrapper(*args, **kwargs):
+        _call_timing.seconds = None
+        _call_timing.db_seconds = 0.0
+        response = None
+        start = time.perf_counter()
+        try:
+            response = dash_wrapper(*args, **kwargs)
+            return response
+        finally:
+            wall = time.perf_counter() - start
+            func_seconds = _call_timing.seconds
+            if func_seconds is None:
+                func_seconds = wall
+            size = response_size(response)
+            with _metrics_lock:
+                metrics = _metrics_for(cid)
+                metrics.wall.observe(wall)
+                metrics.db.observe(_call_timing.db_seconds)
+                metrics.serialize.observe(max(wall - func_seconds, 0.0))
+                # failed calls have no response to measure
+                if size is not None:
+                    metrics.payload.observe(size)
+                recent_calls.append((time.time(), cid, wall))
+
+    return wrapper
+
+
+def instrument_callbacks(app):
+    """
+    Replaces app.callback so every callback registered afterwards is timed
+
+    Args:
+        app: Dash app
+    """
+    register = app.callback
+
+    def callback(output, inputs=[], state=[], *args, **kwargs):
+        dash_decorator = register(output, inputs, state, *args, **kwargs)
+        cid = callback_id(output)
+
+        def decorator(func):
+            dash_wrapper = dash_decorator(timed_callback(cid, func))
+            # dash calls the function stored in callback_map on each request
+            app.callback_map[cid]["callback"] = timed_response(cid, dash_wrapper)
+            return dash_wrapper
+
+        return decorator
+
+    app.callback = callback
+
+
+def slowest_callbacks(window=3600, limit=10):
+    """
+    Ranks callbacks by their 95th percentile wall time over recent calls
+
+    Args:
+        window(float): seconds of recent calls to include
+        limit(int): number of callbacks to return
+
+    Returns:
+        list: dicts with the callback id, calls, mean, p95 and max seconds
+    """
+    since = time.time() - window
+    with _metrics_lock:
+        calls = [(cid, wall) for called, cid, wall in recent_calls if called >= since]
+
+    by_callback = {}
+    for cid, wall in calls:
+        by_callback.setdefault(cid, []).append(wall)
+
+    ranked = []
+    for cid, walls in by_callback.items():
+        walls.sort()
+        ranked.append(
+            {
+                "callback": cid,
+                "calls": len(walls),
+                "mean_seconds": round(sum(walls) / len(walls), 4),
+                "p95_seconds": round(walls[min(int(len(walls) * 0.95), len(walls) - 1)], 4),
+                "max_seconds": round(walls[-1], 4),
+            }
+        )
+    ranked.sort(key=lambda row: row["p95_seconds"], reverse=True)
+    return ranked[:limit]
+
+
+def metrics_text():
+    """
+    Returns every callback metric and the pool stats in the
+    Prometheus text format
+
+    Returns:
+        str: exposition text
+    """
+    lines = []
+    histograms = [
+        ("pacedash_callback_seconds", "wall", "Callback wall time"),
+        ("pacedash_callback_db_seconds", "db", "Time callbacks held pooled database connections"),
+        ("pacedash_callback_serialize_seconds", "serialize", "Time serializing callback responses"),
+        ("pacedash_callback_payload_bytes", "payload", "Size of callback responses"),
+    ]
+    with _metrics_lock:
+        for name, attr, help_text in histograms:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+            for cid, metrics in sorted(callback_metrics.items()):
+                lines.extend(getattr(metrics, attr).lines(name, f'callback="{cid}"'))
+
+        for name, attr in [
+            ("pacedash_callback_errors_total", "errors"),
+            ("pacedash_callback_prevented_total", "prevented"),
+        ]:
+            lines.append(f"# TYPE {name} counter")
+            for cid, metrics in sorted(callback_metrics.items()):
+                lines.append(f'{name}{{callback="{cid}"}} {getattr(metrics, attr)}')
+
+    for pool, stats in pool_stats().items():
+        for stat, value in stats.items():
+            lines.append(f'pacedash_db_pool_{stat}{{pool="{pool}"}} {value}')
+    return "\n".join(lines) + "\n"
+
+
+def local_request():
+    """
+    Checks that a request comes from the server itself
+    """
+    return request.remote_addr in ("127.0.0.1", "::1")
+
+
+def register_metrics_routes(server):
+    """
+    Adds /metrics, /metrics/slowest and /metrics/queries to the flask
+    server, they only answer requests from the server itself when
+    metrics_local_only is set
+
+    Args:
+        server: flask server of the dash app
+    """
+
+    @server.route("/metrics")
+    def metrics():
+        if metrics_local_only and not local_request():
+            abort(404)
+        return Response(metrics_text(), mimetype="text/plain; version=0.0.4")
+
+    @server.route("/metrics/slowest")
+    def metrics_slowest():
+        if metrics_local_only and not local_request():
+            abort(404)
+        window = request.args.get("window", 3600, type=float)
+        limit = request.args.get("limit", 10, type=int)
+        return jsonify(slowest_callbacks(window, limit))
+
+    @server.route("/metrics/queries")
+    def metrics_queries():
+        if metrics_local_only and not local_request():
+            abort(404)
+        limit = request.args.get("limit", 25, type=int)
+        return jsonify(query_report(limit))
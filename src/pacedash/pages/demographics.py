@@ -8,7 +8,7 @@ from ..helper_functions import (
     enrollment,
     demographics,
     quality,
-    card_value
+    card_values
 )
 from ..settings import color_palette
 from ..layouts import (
@@ -19,32 +19,44 @@ from ..layouts import (
 )
 
 
-layout = html.Div(
-    [
-        Row(indicator_header("Demographics"), className="header-row"),
+def card_rows(values=None):
+    """
+    Creates the rows of indicator cards
+
+    Args:
+        values(dict): card value id to the contents of the card
+
+    Returns:
+        list: rows of card columns
+    """
+    return [
         Row(
             [
                 card_col(
                     card_title="Avg. Age",
                     card_val_id="card-1-demographics",
+                    values=values,
                     color=color_palette[1],
                     size=3,
                 ),
                 card_col(
                     card_title="Avg. Years Enrolled",
                     card_val_id="card-2-demographics",
+                    values=values,
                     color=color_palette[1],
                     size=3,
                 ),
                 card_col(
                     card_title="Living in the Community(%)",
                     card_val_id="card-3-demographics",
+                    values=values,
                     color=color_palette[1],
                     size=3,
                 ),
                 card_col(
                     card_title="Below 65 Years Old(%)",
                     card_val_id="card-4-demographics",
+                    values=values,
                     color=color_palette[1],
                     size=3,
                 ),
@@ -56,36 +68,42 @@ layout = html.Div(
                 card_col(
                     card_title="Non-English(%)",
                     card_val_id="card-5-demographics",
+                    values=values,
                     color=color_palette[3],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="Non-White(%)",
                     card_val_id="card-6-demographics",
+                    values=values,
                     color=color_palette[3],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="Female(%)",
                     card_val_id="card-7-demographics",
+                    values=values,
                     color=color_palette[3],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="Dual(%)",
                     card_val_id="card-8-demographics",
+                    values=values,
                     color=color_palette[3],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="Medicaid Only(%)",
                     card_val_id="card-9-demographics",
+                    values=values,
                     color=color_palette[3],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="Private Pay(%)",
                     card_val_id="card-10-demographics",
+                    values=values,
                     color=color_palette[3],
                     font_size="1.25vmax",
                 ),
@@ -97,326 +115,261 @@ layout = html.Div(
                 card_col(
                     card_title="BH Diagnosis(%)",
                     card_val_id="card-11-demographics",
+                    values=values,
                     color=color_palette[1],
                     font_size="2vmax",
                 ),
                 card_col(
                     card_title="6+ Chronic Conditions(%)",
                     card_val_id="card-12-demographics",
+                    values=values,
                     color=color_palette[1],
                     font_size="2vmax",
                 ),
                 card_col(
                     card_title="Pneumo. Rate",
                     card_val_id="card-13-demographics",
+                    values=values,
                     color=color_palette[1],
                     font_size="2vmax",
                 ),
                 card_col(
                     card_title="Influenza Rate",
                     card_val_id="card-14-demographics",
+                    values=values,
                     color=color_palette[1],
                     font_size="2vmax",
                 ),
                 card_col(
                     card_title="Avg. Days Until NF Admit",
                     card_val_id="card-15-demographics",
+                    values=values,
                     color=color_palette[1],
                     font_size="2vmax",
                 ),
                 card_col(
                     card_title="No Hosp. Last Year(%)",
                     card_val_id="card-16-demographics",
+                    values=values,
                     color=color_palette[1],
                     font_size="2vmax",
                 ),
             ],
             className="third-row",
         ),
-        Row(
-            [
-                Col(
-                    [
-                        Col(
-                            [
-                                dcc.Link(
-                                    html.H6("Demo. EDA", style={"font-size": "1vmax"}),
-                                    href="/demographics-eda",
-                                )
-                            ],
-                            size=2,
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "center",
-                            },
-                        ),
-                        Col(
-                            [
-                                dcc.Link(
-                                    html.H6(
-                                        "Enroll. EDA", style={"font-size": "1vmax"}
-                                    ),
-                                    href="/enrollment-eda",
-                                )
-                            ],
-                            size=2,
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "center",
-                            },
-                        ),
-                        Col(
-                            [
-                                dcc.Link(
-                                    html.H6(
-                                        "Incidents EDA", style={"font-size": "1vmax"}
-                                    ),
-                                    href="/incidents-eda",
-                                )
-                            ],
-                            size=2,
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "center",
-                            },
-                        ),
-                        Col(
-                            [
-                                dcc.Link(
-                                    html.H6("Utl. EDA", style={"font-size": "1vmax"}),
-                                    href="/utilization-eda",
-                                )
-                            ],
-                            size=2,
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "center",
-                            },
-                        ),
-                        Col(
-                            [
-                                dcc.Link(
-                                    html.H6("Town Table", style={"font-size": "1vmax"}),
-                                    href="/town_count",
-                                )
-                            ],
-                            size=2,
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "center",
-                            },
-                        ),
-                    ],
-                    size=6,
-                    mobile_size=12,
-                    style={
-                        "display": "flex",
-                        "flex-direction": "row",
-                        "justify-content": "center",
-                        "align-items": "flex-end",
-                    },
-                )
-            ],
-            style={
-                "margin-top": "0.5vh",
-                "height": "6vh",
-                "display": "flex",
-                "flex-direction": "row",
-                "justify-content": "flex-end",
-                "align-items": "flex-end",
-            },
-        ),
     ]
-)
-
-
-@app.callback(Output("card-1-demographics", "children"), [Input("time_range", "value")])
-def card_val_1_demographics(time_range):
-    return card_value(
-        time_range,
-        demographics.avg_age,
-        "demographics",
-        "avg_age",
-        top_number_bottom_spark,
-    )
-
-
-@app.callback(Output("card-2-demographics", "children"), [Input("time_range", "value")])
-def card_val_2_demographics(time_range):
-    return card_value(
-        time_range,
-        enrollment.avg_years_enrolled,
-        "enrollment",
-        "avg_years_enrolled",
-        top_number_bottom_spark,
-    )
-
-
-@app.callback(Output("card-3-demographics", "children"), [Input("time_range", "value")])
-def card_val_3_demographics(time_range):
-    return card_value(
-        time_range,
-        demographics.living_in_community_percent,
-        "demographics",
-        "percent_living_in_community",
-        top_number_bottom_spark,
-    )
-
-
-@app.callback(Output("card-4-demographics", "children"), [Input("time_range", "value")])
-def card_val_4_demographics(time_range):
-    return card_value(
-        time_range,
-        demographics.percent_age_below_65,
-        "demographics",
-        "percent_below_65",
-        top_number_bottom_spark,
-    )
-
-
-@app.callback(Output("card-5-demographics", "children"), [Input("time_range", "value")])
-def card_val_5_demographics(time_range):
-    return card_value(
-        time_range,
-        demographics.percent_primary_non_english,
-        "demographics",
-        "percent_primary_non_english",
-        left_number_right_spark,
-    )
-
-
-@app.callback(Output("card-6-demographics", "children"), [Input("time_range", "value")])
-def card_val_6_demographics(time_range):
-    return card_value(
-        time_range,
-        demographics.percent_non_white,
-        "demographics",
-        "percent_non_white",
-        left_number_right_spark,
-    )
-
-
-@app.callback(Output("card-7-demographics", "children"), [Input("time_range", "value")])
-def card_val_7_demographics(time_range):
-    return card_value(
-        time_range,
-        demographics.percent_female,
-        "demographics",
-        "percent_female",
-        left_number_right_spark,
-    )
-
 
-@app.callback(Output("card-8-demographics", "children"), [Input("time_range", "value")])
-def card_val_8_demographics(time_range):
-    return card_value(
-        time_range,
-        demographics.percent_dual,
-        "demographics",
-        "percent_dual_enrolled",
-        left_number_right_spark,
-    )
-
-
-@app.callback(Output("card-9-demographics", "children"), [Input("time_range", "value")])
-def card_val_9_demographics(time_range):
-    return card_value(
-        time_range,
-        demographics.percent_medicaid_only,
-        "demographics",
-        "percent_medicaid_only",
-        left_number_right_spark,
-    )
 
-
-@app.callback(
-    Output("card-10-demographics", "children"), [Input("time_range", "value")]
-)
-def card_val_10_demographics(time_range):
-    return card_value(
-        time_range,
-        demographics.percent_private_pay,
-        "demographics",
-        "percent_private_pay",
-        left_number_right_spark,
+def build_layout():
+    """
+    Creates the demographics indicator page
+    """
+    return html.Div(
+        [
+            Row(indicator_header("Demographics"), className="header-row"),
+            html.Div(card_rows(), id="demographics-cards"),
+            Row(
+                [
+                    Col(
+                        [
+                            Col(
+                                [
+                                    dcc.Link(
+                                        html.H6("Demo. EDA", style={"font-size": "1vmax"}),
+                                        href="/demographics-eda",
+                                    )
+                                ],
+                                size=2,
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "center",
+                                },
+                            ),
+                            Col(
+                                [
+                                    dcc.Link(
+                                        html.H6(
+                                            "Enroll. EDA", style={"font-size": "1vmax"}
+                                        ),
+                                        href="/enrollment-eda",
+                                    )
+                                ],
+                                size=2,
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "center",
+                                },
+                            ),
+                            Col(
+                                [
+                                    dcc.Link(
+                                        html.H6(
+                                            "Incidents EDA", style={"font-size": "1vmax"}
+                                        ),
+                                        href="/incidents-eda",
+                                    )
+                                ],
+                                size=2,
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "center",
+                                },
+                            ),
+                            Col(
+                                [
+                                    dcc.Link(
+                                        html.H6("Utl. EDA", style={"font-size": "1vmax"}),
+                                        href="/utilization-eda",
+                                    )
+                                ],
+                                size=2,
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "center",
+                                },
+                            ),
+                            Col(
+                                [
+                                    dcc.Link(
+                                        html.H6("Town Table", style={"font-size": "1vmax"}),
+                                        href="/town_count",
+                                    )
+                                ],
+                                size=2,
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "center",
+                                },
+                            ),
+                        ],
+                        size=6,
+                        mobile_size=12,
+                        style={
+                            "display": "flex",
+                            "flex-direction": "row",
+                            "justify-content": "center",
+                            "align-items": "flex-end",
+                        },
+                    )
+                ],
+                style={
+                    "margin-top": "0.5vh",
+                    "height": "6vh",
+                    "display": "flex",
+                    "flex-direction": "row",
+                    "justify-content": "flex-end",
+                    "align-items": "flex-end",
+                },
+            ),
+        ]
     )
 
 
-@app.callback(
-    Output("card-11-demographics", "children"), [Input("time_range", "value")]
-)
-def card_val_11_demographics(time_range):
-    return card_value(
-        time_range,
-        demographics.behavorial_dx_percent,
-        "demographics",
-        "bh_dx_percent",
-        top_number_bottom_spark,
-    )
-
-
-@app.callback(
-    Output("card-12-demographics", "children"), [Input("time_range", "value")]
-)
-def card_val_12_demographics(time_range):
-    return card_value(
-        time_range,
-        demographics.over_six_chronic_conditions_percent,
-        "demographics",
-        "six_chronic_conditions",
-        top_number_bottom_spark,
-    )
-
-
-@app.callback(
-    Output("card-13-demographics", "children"), [Input("time_range", "value")]
-)
-def card_val_13_demographics(time_range):
-    return card_value(
-        time_range,
-        quality.pneumo_rate,
-        "quality",
-        "pneumo_rate",
-        top_number_bottom_spark,
-    )
-
-
-@app.callback(
-    Output("card-14-demographics", "children"), [Input("time_range", "value")]
-)
-def card_val_14_demographics(time_range):
-    return card_value(
-        time_range, quality.influ_rate, "quality", "influ_rate", top_number_bottom_spark
-    )
-
-
-@app.callback(
-    Output("card-15-demographics", "children"), [Input("time_range", "value")]
-)
-def card_val_15_demographics(time_range):
-    return card_value(
-        time_range,
-        quality.avg_days_until_nf_admission,
-        "quality",
-        "avg_days_until_nf_admission",
-        top_number_bottom_spark,
-    )
-
-
-@app.callback(
-    Output("card-16-demographics", "children"), [Input("time_range", "value")]
-)
-def card_val_16_demographics(time_range):
-    return card_value(
-        time_range,
-        quality.no_hosp_admission_last_year,
-        "quality",
-        "no_hosp_admission_last_year",
-        top_number_bottom_spark,
-    )
-
+cards = {
+    "card-1-demographics": dict(
+        value_function=demographics.avg_age,
+        agg_table="demographics",
+        agg_col="avg_age",
+        card_layout=top_number_bottom_spark,
+    ),
+    "card-2-demographics": dict(
+        value_function=enrollment.avg_years_enrolled,
+        agg_table="enrollment",
+        agg_col="avg_years_enrolled",
+        card_layout=top_number_bottom_spark,
+    ),
+    "card-3-demographics": dict(
+        value_function=demographics.living_in_community_percent,
+        agg_table="demographics",
+        agg_col="percent_living_in_community",
+        card_layout=top_number_bottom_spark,
+    ),
+    "card-4-demographics": dict(
+        value_function=demographics.percent_age_below_65,
+        agg_table="demographics",
+        agg_col="percent_below_65",
+        card_layout=top_number_bottom_spark,
+    ),
+    "card-5-demographics": dict(
+        value_function=demographics.percent_primary_non_english,
+        agg_table="demographics",
+        agg_col="percent_primary_non_english",
+        card_layout=left_number_right_spark,
+    ),
+    "card-6-demographics": dict(
+        value_function=demographics.percent_non_white,
+        agg_table="demographics",
+        agg_col="percent_non_white",
+        card_layout=left_number_right_spark,
+    ),
+    "card-7-demographics": dict(
+        value_function=demographics.percent_female,
+        agg_table="demographics",
+        agg_col="percent_female",
+        card_layout=left_number_right_spark,
+    ),
+    "card-8-demographics": dict(
+        value_function=demographics.percent_dual,
+        agg_table="demographics",
+        agg_col="percent_dual_enrolled",
+        card_layout=left_number_right_spark,
+    ),
+    "card-9-demographics": dict(
+        value_function=demographics.percent_medicaid_only,
+        agg_table="demographics",
+        agg_col="percent_medicaid_only",
+        card_layout=left_number_right_spark,
+    ),
+    "card-10-demographics": dict(
+        value_function=demographics.percent_private_pay,
+        agg_table="demographics",
+        agg_col="percent_private_pay",
+        card_layout=left_number_right_spark,
+    ),
+    "card-11-demographics": dict(
+        value_function=demographics.behavorial_dx_percent,
+        agg_table="demographics",
+        agg_col="bh_dx_percent",
+        card_layout=top_number_bottom_spark,
+    ),
+    "card-12-demographics": dict(
+        value_function=demographics.over_six_chronic_conditions_percent,
+        agg_table="demographics",
+        agg_col="six_chronic_conditions",
+        card_layout=top_number_bottom_spark,
+    ),
+    "card-13-demographics": dict(
+        value_function=quality.pneumo_rate,
+        agg_table="quality",
+        agg_col="pneumo_rate",
+        card_layout=top_number_bottom_spark,
+    ),
+    "card-14-demographics": dict(
+        value_function=quality.influ_rate,
+        agg_table="quality",
+        agg_col="influ_rate",
+        card_layout=top_number_bottom_spark,
+    ),
+    "card-15-demographics": dict(
+        value_function=quality.avg_days_until_nf_admission,
+        agg_table="quality",
+        agg_col="avg_days_until_nf_admission",
+        card_layout=top_number_bottom_spark,
+    ),
+    "card-16-demographics": dict(
+        value_function=quality.no_hosp_admission_last_year,
+        agg_table="quality",
+        agg_col="no_hosp_admission_last_year",
+        card_layout=top_number_bottom_spark,
+    ),
+}
+
+
+@app.callback(Output("demographics-cards", "children"), [Input("time_range", "value")])
+def card_vals_demographics(time_range):
+    return card_rows(card_values(time_range, cards))
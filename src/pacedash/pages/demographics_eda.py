@@ -3,6 +3,7 @@ import dash_html_components as html
 from dash.dependencies import Input, Output
 
 from ..app import app
+from ..figure_utils import slim_figure_output
 from ..components import Col, Row
 
 from ..layouts import (
@@ -18,130 +19,134 @@ from ..demographics_eda_utils import (
 )
 
 
-layout = html.Div(
-    [
-        Row(
-            [
-                data_drop_with_graph_radios(
-                    "graph-one-drop-demo",
-                    demographic_attribute_options,
-                    "age",
-                    "graph-one-type",
-                    "age_dist",
-                ),
-                center_dropdown_col(),
-                select_date_col(),
-                data_drop_with_graph_radios(
-                    "graph-two-drop-demo",
-                    demographic_attribute_options,
-                    "gender",
-                    "graph-two-type",
-                    "gen_dist",
-                ),
-            ],
-            className="options-row",
-        ),
-        equal_graph_row("graph-one-demo", "graph-two-demo"),
-        Row(
-            [
-                Col(
-                    [
-                        Col(
-                            [
-                                dcc.Link(
-                                    html.H6("Demo. EDA", style={"font-size": "1vmax"}),
-                                    href="/demographics-eda",
-                                )
-                            ],
-                            size=2,
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "center",
-                            },
-                        ),
-                        Col(
-                            [
-                                dcc.Link(
-                                    html.H6(
-                                        "Enroll. EDA", style={"font-size": "1vmax"}
-                                    ),
-                                    href="/enrollment-eda",
-                                )
-                            ],
-                            size=2,
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "center",
-                            },
-                        ),
-                        Col(
-                            [
-                                dcc.Link(
-                                    html.H6(
-                                        "Incidents EDA", style={"font-size": "1vmax"}
-                                    ),
-                                    href="/incidents-eda",
-                                )
-                            ],
-                            size=2,
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "center",
-                            },
-                        ),
-                        Col(
-                            [
-                                dcc.Link(
-                                    html.H6("Utl. EDA", style={"font-size": "1vmax"}),
-                                    href="/utilization-eda",
-                                )
-                            ],
-                            size=2,
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "center",
-                            },
-                        ),
-                        Col(
-                            [
-                                dcc.Link(
-                                    html.H6("Town Table", style={"font-size": "1vmax"}),
-                                    href="/town_count",
-                                )
-                            ],
-                            size=2,
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "center",
-                            },
-                        ),
-                    ],
-                    size=6,
-                    mobile_size=12,
-                    style={
-                        "display": "flex",
-                        "flex-direction": "row",
-                        "justify-content": "center",
-                        "align-items": "flex-end",
-                    },
-                )
-            ],
-            style={
-                "margin-top": "0.5vh",
-                "height": "6vh",
-                "display": "flex",
-                "flex-direction": "row",
-                "justify-content": "flex-end",
-                "align-items": "flex-end",
-            },
-        ),
-    ]
-)
+def build_layout():
+    """
+    Creates the demographics EDA page
+    """
+    return html.Div(
+        [
+            Row(
+                [
+                    data_drop_with_graph_radios(
+                        "graph-one-drop-demo",
+                        demographic_attribute_options,
+                        "age",
+                        "graph-one-type",
+                        "age_dist",
+                    ),
+                    center_dropdown_col(),
+                    select_date_col(),
+                    data_drop_with_graph_radios(
+                        "graph-two-drop-demo",
+                        demographic_attribute_options,
+                        "gender",
+                        "graph-two-type",
+                        "gen_dist",
+                    ),
+                ],
+                className="options-row",
+            ),
+            equal_graph_row("graph-one-demo", "graph-two-demo"),
+            Row(
+                [
+                    Col(
+                        [
+                            Col(
+                                [
+                                    dcc.Link(
+                                        html.H6("Demo. EDA", style={"font-size": "1vmax"}),
+                                        href="/demographics-eda",
+                                    )
+                                ],
+                                size=2,
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "center",
+                                },
+                            ),
+                            Col(
+                                [
+                                    dcc.Link(
+                                        html.H6(
+                                            "Enroll. EDA", style={"font-size": "1vmax"}
+                                        ),
+                                        href="/enrollment-eda",
+                                    )
+                                ],
+                                size=2,
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "center",
+                                },
+                            ),
+                            Col(
+                                [
+                                    dcc.Link(
+                                        html.H6(
+                                            "Incidents EDA", style={"font-size": "1vmax"}
+                                        ),
+                                        href="/incidents-eda",
+                                    )
+                                ],
+                                size=2,
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "center",
+                                },
+                            ),
+                            Col(
+                                [
+                                    dcc.Link(
+                                        html.H6("Utl. EDA", style={"font-size": "1vmax"}),
+                                        href="/utilization-eda",
+                                    )
+                                ],
+                                size=2,
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "center",
+                                },
+                            ),
+                            Col(
+                                [
+                                    dcc.Link(
+                                        html.H6("Town Table", style={"font-size": "1vmax"}),
+                                        href="/town_count",
+                                    )
+                                ],
+                                size=2,
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "center",
+                                },
+                            ),
+                        ],
+                        size=6,
+                        mobile_size=12,
+                        style={
+                            "display": "flex",
+                            "flex-direction": "row",
+                            "justify-content": "center",
+                            "align-items": "flex-end",
+                        },
+                    )
+                ],
+                style={
+                    "margin-top": "0.5vh",
+                    "height": "6vh",
+                    "display": "flex",
+                    "flex-direction": "row",
+                    "justify-content": "flex-end",
+                    "align-items": "flex-end",
+                },
+            ),
+        ]
+    )
 
 
 @app.callback(
@@ -193,6 +198,7 @@ def update_graph_two_type_val(available_options):
         Input("center-drop", "value"),
     ],
 )
+@slim_figure_output
 def update_graph_one_demos(graph_type, start_date, end_date, center):
     """
     Updates left graph based on user selected options
@@ -209,6 +215,7 @@ def update_graph_one_demos(graph_type, start_date, end_date, center):
         Input("center-drop", "value"),
     ],
 )
+@slim_figure_output
 def update_graph_two_demos(graph_type, start_date, end_date, center):
     """
     Updates right graph based on user selected options
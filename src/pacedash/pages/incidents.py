@@ -13,8 +13,7 @@ from ..helper_functions import (
     sparkline,
     arrow_direction,
     indicator_color,
-    time_range_dict,
-    card_value
+    card_values
 )
 from ..settings import color_palette
 from ..layouts import (
@@ -24,9 +23,18 @@ from ..layouts import (
     text_val_no_sparkline
 )
 
-layout = html.Div(
-    [
-       Row(indicator_header("Incidents"), className="header-row"),
+
+def card_rows(values=None):
+    """
+    Creates the rows of indicator cards
+
+    Args:
+        values(dict): card value id to the contents of the card
+
+    Returns:
+        list: rows of card columns
+    """
+    return [
        Row([Col([
              html.H4("Falls",)
             ], size = 12, style = {"text-align": "left",
@@ -38,36 +46,42 @@ layout = html.Div(
                 card_col(
                     card_title="Falls per 100MM",
                     card_val_id="card-1-incidents",
+                    values=values,
                     color=color_palette[1],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="Ppts with Fall",
                     card_val_id="card-2-incidents",
+                    values=values,
                     color=color_palette[1],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="Falls by Repeaters(%)",
                     card_val_id="card-3-incidents",
+                    values=values,
                     color=color_palette[1],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="Ppts Without Fall(%)",
                     card_val_id="card-4-incidents",
+                    values=values,
                     color=color_palette[1],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="Major Harm/Death",
                     card_val_id="card-5-incidents",
+                    values=values,
                     color=color_palette[1],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="Fall per 100MM(adjusted)",
                     card_val_id="card-6-incidents",
+                    values=values,
                     color=color_palette[1],
                     font_size="1.25vmax",
                 ),
@@ -85,36 +99,42 @@ layout = html.Div(
                 card_col(
                     card_title="Infections per 100MM",
                     card_val_id="card-7-incidents",
+                    values=values,
                     color=color_palette[3],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="Ppts with Infection",
                     card_val_id="card-8-incidents",
+                    values=values,
                     color=color_palette[3],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="Infections by Repeaters(%)",
                     card_val_id="card-9-incidents",
+                    values=values,
                     color=color_palette[3],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="Ppts Without Infection(%)",
                     card_val_id="card-10-incidents",
+                    values=values,
                     color=color_palette[3],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="Sepsis",
                     card_val_id="card-11-incidents",
+                    values=values,
                     color=color_palette[3],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="UTI per 100MM",
                     card_val_id="card-12-incidents",
+                    values=values,
                     color=color_palette[3],
                     font_size="1.25vmax",
                 ),
@@ -132,36 +152,42 @@ layout = html.Div(
                 card_col(
                     card_title="Med Errors per 100MM",
                     card_val_id="card-13-incidents",
+                    values=values,
                     color=color_palette[1],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="Ppts with Med Error",
                     card_val_id="card-14-incidents",
+                    values=values,
                     color=color_palette[1],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="Most Common Responsibility",
                     card_val_id="card-15-incidents",
+                    values=values,
                     color=color_palette[1],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="Ppts Without Med Error(%)",
                     card_val_id="card-16-incidents",
+                    values=values,
                     color=color_palette[1],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="Major Harm/Death",
                     card_val_id="card-17-incidents",
+                    values=values,
                     color=color_palette[1],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="High Risk Related",
                     card_val_id="card-18-incidents",
+                    values=values,
                     color=color_palette[1],
                     font_size="1.25vmax",
                 ),
@@ -179,36 +205,42 @@ layout = html.Div(
                 card_col(
                     card_title="Wounds per 100MM",
                     card_val_id="card-19-incidents",
+                    values=values,
                     color=color_palette[3],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="Ppts with Wound",
                     card_val_id="card-20-incidents",
+                    values=values,
                     color=color_palette[3],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="Avg. Wound Healing Time",
                     card_val_id="card-21-incidents",
+                    values=values,
                     color=color_palette[3],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="Ppts Without Wound(%)",
                     card_val_id="card-22-incidents",
+                    values=values,
                     color=color_palette[3],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="Unstageable",
                     card_val_id="card-23-incidents",
+                    values=values,
                     color=color_palette[3],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="Pressure Ulcer per 100MM",
                     card_val_id="card-24-incidents",
+                    values=values,
                     color=color_palette[3],
                     font_size="1.25vmax",
                 ),
@@ -226,208 +258,176 @@ layout = html.Div(
                 card_col(
                     card_title="Burns per 100MM",
                     card_val_id="card-25-incidents",
+                    values=values,
                     color=color_palette[1],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="Ppts with Burn",
                     card_val_id="card-26-incidents",
+                    values=values,
                     color=color_palette[1],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="Burns by Repeaters(%)",
                     card_val_id="card-27-incidents",
+                    values=values,
                     color=color_palette[1],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="Ppts Without Burn(%)",
                     card_val_id="card-28-incidents",
+                    values=values,
                     color=color_palette[1],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="3rd Degree+",
                     card_val_id="card-29-incidents",
+                    values=values,
                     color=color_palette[1],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="RN Assessment (%)",
                     card_val_id="card-30-incidents",
+                    values=values,
                     color=color_palette[1],
                     font_size="1.25vmax",
                 ),
             ],
             className="equal-row"
         ),
-        Row(
-            [
-                Col(
-                    [
-                        Col(
-                            [
-                                dcc.Link(
-                                    html.H6("Demo. EDA", style={
-                                            "font-size": "1vmax"}),
-                                    href="/demographics-eda",
-                                )
-                            ],
-                            size=2,
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "center",
-                            },
-                        ),
-                        Col(
-                            [
-                                dcc.Link(
-                                    html.H6(
-                                        "Enroll. EDA", style={"font-size": "1vmax"}
-                                    ),
-                                    href="/enrollment-eda",
-                                )
-                            ],
-                            size=2,
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "center",
-                            },
-                        ),
-                        Col(
-                            [
-                                dcc.Link(
-                                    html.H6(
-                                        "Incidents EDA", style={"font-size": "1vmax"}
-                                    ),
-                                    href="/incidents-eda",
-                                )
-                            ],
-                            size=2,
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "center",
-                            },
-                        ),
-                        Col(
-                            [
-                                dcc.Link(
-                                    html.H6(
-                                        "Utl. EDA", style={"font-size": "1vmax"}
-                                    ),
-                                    href="/utilization-eda",
-                                )
-                            ],
-                            size=2,
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "center",
-                            },
-                        ),
-                        Col(
-                            [
-                                dcc.Link(
-                                    html.H6("Town Table", style={
-                                            "font-size": "1vmax"}),
-                                    href="/town_count",
-                                )
-                            ],
-                            size=2,
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "center",
-                            },
-                        ),
-                    ],
-                    size=6,
-                    mobile_size=12,
-                    style={
-                        "display": "flex",
-                        "flex-direction": "row",
-                        "justify-content": "center",
-                        "align-items": "flex-end",
-                    },
-                )
-            ],
-            style={
-                "margin-top": "0",
-                "height": "4vh",
-                "display": "flex",
-                "flex-direction": "row",
-                "justify-content": "flex-end",
-                "align-items": "flex-end",
-            },
-        ),
     ]
-)
-
-
-@app.callback(Output("card-1-incidents", "children"), [Input("time_range", "value")])
-def card_val_1_incident(time_range):
-    return card_value(time_range, incidents.incident_per_100MM, "falls", "per_100MM", left_number_right_spark, ["falls"])
-
-@app.callback(Output("card-2-incidents", "children"), [Input("time_range", "value")])
-def card_val_2_incident(time_range):
-    return card_value(time_range, incidents.ppts_w_incident, "falls", "unique_ppts", left_number_right_spark, ["falls"])
-
-@app.callback(Output("card-3-incidents", "children"), [Input("time_range", "value")])
-def card_val_3_incident(time_range):
-    return card_value(time_range, incidents.percent_by_repeaters, "falls", "percent_by_repeaters", left_number_right_spark, ["falls"])
-
-@app.callback(Output("card-4-incidents", "children"), [Input("time_range", "value")])
-def card_val_4_incident(time_range):
-    return card_value(time_range, incidents.percent_without_incident_in_period, "falls", "percent_without", left_number_right_spark, ["falls"])
-
-@app.callback(Output("card-5-incidents", "children"), [Input("time_range", "value")])
-def card_val_5_incident(time_range):
-    return card_value(time_range, incidents.major_harm_percent, "falls", "major_harm_percent", left_number_right_spark, ["falls"])
-
-@app.callback(Output("card-6-incidents", "children"), [Input("time_range", "value")])
-def card_val_6_incident(time_range):
-    return card_value(time_range, incidents.adjusted_per_100MM, "falls", "adjusted_per100MM", left_number_right_spark, ["falls"])
-
-@app.callback(Output("card-7-incidents", "children"), [Input("time_range", "value")])
-def card_val_7_incident(time_range):
-    return card_value(time_range, incidents.incident_per_100MM, "infections", "per_100MM", left_number_right_spark, ["infections"])
 
-@app.callback(Output("card-8-incidents", "children"), [Input("time_range", "value")])
-def card_val_8_incident(time_range):
-    return card_value(time_range, incidents.ppts_w_incident, "infections", "unique_ppts", left_number_right_spark, ["infections"])
-
-@app.callback(Output("card-9-incidents", "children"), [Input("time_range", "value")])
-def card_val_9_incident(time_range):
-    return card_value(time_range, incidents.percent_by_repeaters, "infections", "percent_by_repeaters", left_number_right_spark, ["infections"])
-
-@app.callback(Output("card-10-incidents", "children"), [Input("time_range", "value")])
-def card_val_10_incident(time_range):
-    return card_value(time_range, incidents.percent_without_incident_in_period, "infections", "percent_without", left_number_right_spark, ["infections"])
-
-@app.callback(Output("card-11-incidents", "children"), [Input("time_range", "value")])
-def card_val_11_incident(time_range):
-    return card_value(time_range, incidents.sepsis_per_100, "infections", "sepsis_per_100MM", left_number_right_spark)
-
-@app.callback(Output("card-12-incidents", "children"), [Input("time_range", "value")])
-def card_val_12_incident(time_range):
-    return card_value(time_range, incidents.uti_per_100, "infections", "uti_per_100MM", left_number_right_spark)
-
-@app.callback(Output("card-13-incidents", "children"), [Input("time_range", "value")])
-def card_val_13_incident(time_range):
-    return card_value(time_range, incidents.incident_per_100MM, "med_errors", "per_100MM", left_number_right_spark, ["med_errors"])
-
-@app.callback(Output("card-14-incidents", "children"), [Input("time_range", "value")])
-def card_val_14_incident(time_range):
-    return card_value(time_range, incidents.ppts_w_incident, "med_errors", "unique_ppts", left_number_right_spark, ["med_errors"])
-
-@app.callback(Output("card-15-incidents", "children"), [Input("time_range", "value")])
-def card_val_15_incident(time_range):
-    params = time_range_dict[time_range][0]()
 
+def build_layout():
+    """
+    Creates the incidents indicator page
+    """
+    return html.Div(
+        [
+           Row(indicator_header("Incidents"), className="header-row"),
+            html.Div(card_rows(), id="incidents-cards"),
+            Row(
+                [
+                    Col(
+                        [
+                            Col(
+                                [
+                                    dcc.Link(
+                                        html.H6("Demo. EDA", style={
+                                                "font-size": "1vmax"}),
+                                        href="/demographics-eda",
+                                    )
+                                ],
+                                size=2,
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "center",
+                                },
+                            ),
+                            Col(
+                                [
+                                    dcc.Link(
+                                        html.H6(
+                                            "Enroll. EDA", style={"font-size": "1vmax"}
+                                        ),
+                                        href="/enrollment-eda",
+                                    )
+                                ],
+                                size=2,
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "center",
+                                },
+                            ),
+                            Col(
+                                [
+                                    dcc.Link(
+                                        html.H6(
+                                            "Incidents EDA", style={"font-size": "1vmax"}
+                                        ),
+                                        href="/incidents-eda",
+                                    )
+                                ],
+                                size=2,
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "center",
+                                },
+                            ),
+                            Col(
+                                [
+                                    dcc.Link(
+                                        html.H6(
+                                            "Utl. EDA", style={"font-size": "1vmax"}
+                                        ),
+                                        href="/utilization-eda",
+                                    )
+                                ],
+                                size=2,
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "center",
+                                },
+                            ),
+                            Col(
+                                [
+                                    dcc.Link(
+                                        html.H6("Town Table", style={
+                                                "font-size": "1vmax"}),
+                                        href="/town_count",
+                                    )
+                                ],
+                                size=2,
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "center",
+                                },
+                            ),
+                        ],
+                        size=6,
+                        mobile_size=12,
+                        style={
+                            "display": "flex",
+                            "flex-direction": "row",
+                            "justify-content": "center",
+                            "align-items": "flex-end",
+                        },
+                    )
+                ],
+                style={
+                    "margin-top": "0",
+                    "height": "4vh",
+                    "display": "flex",
+                    "flex-direction": "row",
+                    "justify-content": "flex-end",
+                    "align-items": "flex-end",
+                },
+            ),
+        ]
+    )
+
+
+def med_error_responsibility_card(params):
+    """
+    Card showing the most common responsibility for med errors and
+    the percent of med errors it accounts for
+
+    Args:
+        params(tuple): start date and end date in format 'YYYY-MM-DD'
+
+    Returns:
+        list: list of bootstrap components that create a card
+    """
     current_value = incidents.most_common_med_errors_responsibility(params)
     total = incidents.total_incidents(params, incident_table="med_errors")
     
@@ -438,62 +438,207 @@ def card_val_15_incident(time_range):
 
     return text_val_no_sparkline(f"{current_value[0]}({round(percent,2)}%)", "incidents-eda")
 
-@app.callback(Output("card-16-incidents", "children"), [Input("time_range", "value")])
-def card_val_16_incident(time_range):
-    return card_value(time_range, incidents.percent_without_incident_in_period, "med_errors", "percent_without", left_number_right_spark, ["med_errors"])
-
-@app.callback(Output("card-17-incidents", "children"), [Input("time_range", "value")])
-def card_val_17_incident(time_range):
-    return card_value(time_range, incidents.major_harm_percent, "med_errors", "major_harm_percent", left_number_right_spark, ["med_errors"])
-
-@app.callback(Output("card-18-incidents", "children"), [Input("time_range", "value")])
-def card_val_18_incident(time_range):
-    return card_value(time_range, incidents.high_risk_med_error_count, "med_errors", "high_risk", left_number_right_spark)
-
-@app.callback(Output("card-19-incidents", "children"), [Input("time_range", "value")])
-def card_val_19_incident(time_range):
-    return card_value(time_range, incidents.incident_per_100MM, "wounds", "per_100MM", left_number_right_spark, ["wounds"])
-
-@app.callback(Output("card-20-incidents", "children"), [Input("time_range", "value")])
-def card_val_20_incident(time_range):
-    return card_value(time_range, incidents.ppts_w_incident, "wounds", "unique_ppts", left_number_right_spark, ["wounds"])
-
-@app.callback(Output("card-21-incidents", "children"), [Input("time_range", "value")])
-def card_val_21_incident(time_range):
-    return card_value(time_range, incidents.avg_wound_healing_time, "wounds", "avg_healing_time", left_number_right_spark)
-
-@app.callback(Output("card-22-incidents", "children"), [Input("time_range", "value")])
-def card_val_22_incident(time_range):
-    return card_value(time_range, incidents.percent_without_incident_in_period, "wounds", "percent_without", left_number_right_spark, ["wounds"])
-
-@app.callback(Output("card-23-incidents", "children"), [Input("time_range", "value")])
-def card_val_23_incident(time_range):
-    return card_value(time_range, incidents.unstageable_wound_percent, "wounds", "percent_unstageable", left_number_right_spark)
-
-@app.callback(Output("card-24-incidents", "children"), [Input("time_range", "value")])
-def card_val_24_incident(time_range):
-    return card_value(time_range, incidents.pressure_ulcer_per_100, "wounds", "pressure_ulcer_per_100", left_number_right_spark)
-
-@app.callback(Output("card-25-incidents", "children"), [Input("time_range", "value")])
-def card_val_25_incident(time_range):
-    return card_value(time_range, incidents.incident_per_100MM, "burns", "per_100MM", left_number_right_spark, ["burns"])
-
-@app.callback(Output("card-26-incidents", "children"), [Input("time_range", "value")])
-def card_val_26_incident(time_range):
-    return card_value(time_range, incidents.ppts_w_incident, "burns", "unique_ppts", left_number_right_spark, ["burns"])
-
-@app.callback(Output("card-27-incidents", "children"), [Input("time_range", "value")])
-def card_val_27_incident(time_range):
-    return card_value(time_range, incidents.percent_by_repeaters, "burns", "percent_by_repeaters", left_number_right_spark, ["burns"])
-
-@app.callback(Output("card-28-incidents", "children"), [Input("time_range", "value")])
-def card_val_28_incident(time_range):
-    return card_value(time_range, incidents.percent_without_incident_in_period, "burns", "percent_without", left_number_right_spark, ["burns"])
-
-@app.callback(Output("card-29-incidents", "children"), [Input("time_range", "value")])
-def card_val_29_incident(time_range):
-    return card_value(time_range, incidents.third_degree_burn_rate, "burns", "third_degree_rate", left_number_right_spark)
 
-@app.callback(Output("card-30-incidents", "children"), [Input("time_range", "value")])
-def card_val_30_incident(time_range):
-    return card_value(time_range, incidents.rn_assessment_following_burn_percent, "burns", "rn_assessment_percent", left_number_right_spark)
+cards = {
+    "card-1-incidents": dict(
+        value_function=incidents.incident_per_100MM,
+        agg_table="falls",
+        agg_col="per_100MM",
+        card_layout=left_number_right_spark,
+        additional_args=["falls"],
+    ),
+    "card-2-incidents": dict(
+        value_function=incidents.ppts_w_incident,
+        agg_table="falls",
+        agg_col="unique_ppts",
+        card_layout=left_number_right_spark,
+        additional_args=["falls"],
+    ),
+    "card-3-incidents": dict(
+        value_function=incidents.percent_by_repeaters,
+        agg_table="falls",
+        agg_col="percent_by_repeaters",
+        card_layout=left_number_right_spark,
+        additional_args=["falls"],
+    ),
+    "card-4-incidents": dict(
+        value_function=incidents.percent_without_incident_in_period,
+        agg_table="falls",
+        agg_col="percent_without",
+        card_layout=left_number_right_spark,
+        additional_args=["falls"],
+    ),
+    "card-5-incidents": dict(
+        value_function=incidents.major_harm_percent,
+        agg_table="falls",
+        agg_col="major_harm_percent",
+        card_layout=left_number_right_spark,
+        additional_args=["falls"],
+    ),
+    "card-6-incidents": dict(
+        value_function=incidents.adjusted_per_100MM,
+        agg_table="falls",
+        agg_col="adjusted_per100MM",
+        card_layout=left_number_right_spark,
+        additional_args=["falls"],
+    ),
+    "card-7-incidents": dict(
+        value_function=incidents.incident_per_100MM,
+        agg_table="infections",
+        agg_col="per_100MM",
+        card_layout=left_number_right_spark,
+        additional_args=["infections"],
+    ),
+    "card-8-incidents": dict(
+        value_function=incidents.ppts_w_incident,
+        agg_table="infections",
+        agg_col="unique_ppts",
+        card_layout=left_number_right_spark,
+        additional_args=["infections"],
+    ),
+    "card-9-incidents": dict(
+        value_function=incidents.percent_by_repeaters,
+        agg_table="infections",
+        agg_col="percent_by_repeaters",
+        card_layout=left_number_right_spark,
+        additional_args=["infections"],
+    ),
+    "card-10-incidents": dict(
+        value_function=incidents.percent_without_incident_in_period,
+        agg_table="infections",
+        agg_col="percent_without",
+        card_layout=left_number_right_spark,
+        additional_args=["infections"],
+    ),
+    "card-11-incidents": dict(
+        value_function=incidents.sepsis_per_100,
+        agg_table="infections",
+        agg_col="sepsis_per_100MM",
+        card_layout=left_number_right_spark,
+    ),
+    "card-12-incidents": dict(
+        value_function=incidents.uti_per_100,
+        agg_table="infections",
+        agg_col="uti_per_100MM",
+        card_layout=left_number_right_spark,
+    ),
+    "card-13-incidents": dict(
+        value_function=incidents.incident_per_100MM,
+        agg_table="med_errors",
+        agg_col="per_100MM",
+        card_layout=left_number_right_spark,
+        additional_args=["med_errors"],
+    ),
+    "card-14-incidents": dict(
+        value_function=incidents.ppts_w_incident,
+        agg_table="med_errors",
+        agg_col="unique_ppts",
+        card_layout=left_number_right_spark,
+        additional_args=["med_errors"],
+    ),
+    "card-15-incidents": med_error_responsibility_card,
+    "card-16-incidents": dict(
+        value_function=incidents.percent_without_incident_in_period,
+        agg_table="med_errors",
+        agg_col="percent_without",
+        card_layout=left_number_right_spark,
+        additional_args=["med_errors"],
+    ),
+    "card-17-incidents": dict(
+        value_function=incidents.major_harm_percent,
+        agg_table="med_errors",
+        agg_col="major_harm_percent",
+        card_layout=left_number_right_spark,
+        additional_args=["med_errors"],
+    ),
+    "card-18-incidents": dict(
+        value_function=incidents.high_risk_med_error_count,
+        agg_table="med_errors",
+        agg_col="high_risk",
+        card_layout=left_number_right_spark,
+    ),
+    "card-19-incidents": dict(
+        value_function=incidents.incident_per_100MM,
+        agg_table="wounds",
+        agg_col="per_100MM",
+        card_layout=left_number_right_spark,
+        additional_args=["wounds"],
+    ),
+    "card-20-incidents": dict(
+        value_function=incidents.ppts_w_incident,
+        agg_table="wounds",
+        agg_col="unique_ppts",
+        card_layout=left_number_right_spark,
+        additional_args=["wounds"],
+    ),
+    "card-21-incidents": dict(
+        value_function=incidents.avg_wound_healing_time,
+        agg_table="wounds",
+        agg_col="avg_healing_time",
+        card_layout=left_number_right_spark,
+    ),
+    "card-22-incidents": dict(
+        value_function=incidents.percent_without_incident_in_period,
+        agg_table="wounds",
+        agg_col="percent_without",
+        card_layout=left_number_right_spark,
+        additional_args=["wounds"],
+    ),
+    "card-23-incidents": dict(
+        value_function=incidents.unstageable_wound_percent,
+        agg_table="wounds",
+        agg_col="percent_unstageable",
+        card_layout=left_number_right_spark,
+    ),
+    "card-24-incidents": dict(
+        value_function=incidents.pressure_ulcer_per_100,
+        agg_table="wounds",
+        agg_col="pressure_ulcer_per_100",
+        card_layout=left_number_right_spark,
+    ),
+    "card-25-incidents": dict(
+        value_function=incidents.incident_per_100MM,
+        agg_table="burns",
+        agg_col="per_100MM",
+        card_layout=left_number_right_spark,
+        additional_args=["burns"],
+    ),
+    "card-26-incidents": dict(
+        value_function=incidents.ppts_w_incident,
+        agg_table="burns",
+        agg_col="unique_ppts",
+        card_layout=left_number_right_spark,
+        additional_args=["burns"],
+    ),
+    "card-27-incidents": dict(
+        value_function=incidents.percent_by_repeaters,
+        agg_table="burns",
+        agg_col="percent_by_repeaters",
+        card_layout=left_number_right_spark,
+        additional_args=["burns"],
+    ),
+    "card-28-incidents": dict(
+        value_function=incidents.percent_without_incident_in_period,
+        agg_table="burns",
+        agg_col="percent_without",
+        card_layout=left_number_right_spark,
+        additional_args=["burns"],
+    ),
+    "card-29-incidents": dict(
+        value_function=incidents.third_degree_burn_rate,
+        agg_table="burns",
+        agg_col="third_degree_rate",
+        card_layout=left_number_right_spark,
+    ),
+    "card-30-incidents": dict(
+        value_function=incidents.rn_assessment_following_burn_percent,
+        agg_table="burns",
+        agg_col="rn_assessment_percent",
+        card_layout=left_number_right_spark,
+    ),
+}
+
+
+@app.callback(Output("incidents-cards", "children"), [Input("time_range", "value")])
+def card_vals_incident(time_range):
+    return card_rows(card_values(time_range, cards))
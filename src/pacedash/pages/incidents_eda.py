@@ -6,6 +6,7 @@ from ..app import app
 from ..components import Col, Row
 from ..helper_functions import update_dates
 from ..settings import dropdown_style
+from ..figure_utils import slim_figure_output
 
 from ..layouts import (
     center_dropdown_col,
@@ -22,185 +23,189 @@ from ..incidents_eda_utils import (
     incident_types_dropdown,
 )
 
-layout = html.Div(
-    [
-        Row(
-            [
-                center_dropdown_col(),
-                select_date_col(),
-                Col(
-                    [
-                        dcc.Dropdown(
-                            id="incident-drop",
-                            options=incident_types_dropdown,
-                            value="falls",
-                            style=dropdown_style,
-                        ),
-                        Row(
-                            [
-                                Col(
-                                    [month_quarter_radio()],
-                                    bp="md",
-                                    size=6,
-                                    mobile_size=6,
-                                    style={
-                                        "display": "flex",
-                                        "flex-direction": "column",
-                                        "justify-content": "center",
-                                    },
-                                )
-                            ],
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "flex-start",
-                                "align-items": "center",
-                            },
-                        ),
-                    ],
-                    bp="md",
-                    size=3,
-                    style={
-                        "padding-top": "0.5vh",
-                        "display": "flex",
-                        "flex-direction": "column",
-                        "justify-content": "center",
-                    },
-                ),
-                graph_drop_with_filter_amnt(
-                    "graph-one-drop", None, "graph-one-radio", "incident-options"
-                ),
-                Col(
-                    [
-                        dcc.RadioItems(
-                            id="outlier-radio",
-                            options=[
-                                {"label": "All", "value": False},
-                                {"label": "Exclude Outliers", "value": True},
-                            ],
-                            value=False,
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "flex-end",
-                                "align-items": "center",
-                            },
-                        )
-                    ],
-                    bp="md",
-                    size=3,
-                    mobile_size=4,
-                    style={
-                        "display": "flex",
-                        "flex-direction": "row",
-                        "justify-content": "center",
-                        "align-items": "center",
-                    },
-                ),
-            ],
-            className="options-row",
-        ),
-        graph_row("graph-one"),
-        Row(
-            [
-                Col(
-                    [
-                        Col(
-                            [
-                                dcc.Link(
-                                    html.H6("Demo. EDA", style={"font-size": "1vmax"}),
-                                    href="/demographics-eda",
-                                )
-                            ],
-                            size=2,
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "center",
-                            },
-                        ),
-                        Col(
-                            [
-                                dcc.Link(
-                                    html.H6(
-                                        "Enroll. EDA", style={"font-size": "1vmax"}
-                                    ),
-                                    href="/enrollment-eda",
-                                )
-                            ],
-                            size=2,
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "center",
-                            },
-                        ),
-                        Col(
-                            [
-                                dcc.Link(
-                                    html.H6(
-                                        "Incidents EDA", style={"font-size": "1vmax"}
-                                    ),
-                                    href="/incidents-eda",
-                                )
-                            ],
-                            size=2,
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "center",
-                            },
-                        ),
-                        Col(
-                            [
-                                dcc.Link(
-                                    html.H6("Utl. EDA", style={"font-size": "1vmax"}),
-                                    href="/utilization-eda",
-                                )
-                            ],
-                            size=2,
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "center",
-                            },
-                        ),
-                        Col(
-                            [
-                                dcc.Link(
-                                    html.H6("Town Table", style={"font-size": "1vmax"}),
-                                    href="/town_count",
-                                )
-                            ],
-                            size=2,
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "center",
-                            },
-                        ),
-                    ],
-                    size=6,
-                    mobile_size=12,
-                    style={
-                        "display": "flex",
-                        "flex-direction": "row",
-                        "justify-content": "center",
-                        "align-items": "flex-end",
-                    },
-                )
-            ],
-            style={
-                "margin-top": "0.5vh",
-                "height": "4vh",
-                "display": "flex",
-                "flex-direction": "row",
-                "justify-content": "flex-end",
-                "align-items": "flex-end",
-            },
-        ),
-    ]
-)
+def build_layout():
+    """
+    Creates the incidents EDA page
+    """
+    return html.Div(
+        [
+            Row(
+                [
+                    center_dropdown_col(),
+                    select_date_col(),
+                    Col(
+                        [
+                            dcc.Dropdown(
+                                id="incident-drop",
+                                options=incident_types_dropdown,
+                                value="falls",
+                                style=dropdown_style,
+                            ),
+                            Row(
+                                [
+                                    Col(
+                                        [month_quarter_radio()],
+                                        bp="md",
+                                        size=6,
+                                        mobile_size=6,
+                                        style={
+                                            "display": "flex",
+                                            "flex-direction": "column",
+                                            "justify-content": "center",
+                                        },
+                                    )
+                                ],
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "flex-start",
+                                    "align-items": "center",
+                                },
+                            ),
+                        ],
+                        bp="md",
+                        size=3,
+                        style={
+                            "padding-top": "0.5vh",
+                            "display": "flex",
+                            "flex-direction": "column",
+                            "justify-content": "center",
+                        },
+                    ),
+                    graph_drop_with_filter_amnt(
+                        "graph-one-drop", None, "graph-one-radio", "incident-options"
+                    ),
+                    Col(
+                        [
+                            dcc.RadioItems(
+                                id="outlier-radio",
+                                options=[
+                                    {"label": "All", "value": False},
+                                    {"label": "Exclude Outliers", "value": True},
+                                ],
+                                value=False,
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "flex-end",
+                                    "align-items": "center",
+                                },
+                            )
+                        ],
+                        bp="md",
+                        size=3,
+                        mobile_size=4,
+                        style={
+                            "display": "flex",
+                            "flex-direction": "row",
+                            "justify-content": "center",
+                            "align-items": "center",
+                        },
+                    ),
+                ],
+                className="options-row",
+            ),
+            graph_row("graph-one"),
+            Row(
+                [
+                    Col(
+                        [
+                            Col(
+                                [
+                                    dcc.Link(
+                                        html.H6("Demo. EDA", style={"font-size": "1vmax"}),
+                                        href="/demographics-eda",
+                                    )
+                                ],
+                                size=2,
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "center",
+                                },
+                            ),
+                            Col(
+                                [
+                                    dcc.Link(
+                                        html.H6(
+                                            "Enroll. EDA", style={"font-size": "1vmax"}
+                                        ),
+                                        href="/enrollment-eda",
+                                    )
+                                ],
+                                size=2,
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "center",
+                                },
+                            ),
+                            Col(
+                                [
+                                    dcc.Link(
+                                        html.H6(
+                                            "Incidents EDA", style={"font-size": "1vmax"}
+                                        ),
+                                        href="/incidents-eda",
+                                    )
+                                ],
+                                size=2,
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "center",
+                                },
+                            ),
+                            Col(
+                                [
+                                    dcc.Link(
+                                        html.H6("Utl. EDA", style={"font-size": "1vmax"}),
+                                        href="/utilization-eda",
+                                    )
+                                ],
+                                size=2,
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "center",
+                                },
+                            ),
+                            Col(
+                                [
+                                    dcc.Link(
+                                        html.H6("Town Table", style={"font-size": "1vmax"}),
+                                        href="/town_count",
+                                    )
+                                ],
+                                size=2,
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "center",
+                                },
+                            ),
+                        ],
+                        size=6,
+                        mobile_size=12,
+                        style={
+                            "display": "flex",
+                            "flex-direction": "row",
+                            "justify-content": "center",
+                            "align-items": "flex-end",
+                        },
+                    )
+                ],
+                style={
+                    "margin-top": "0.5vh",
+                    "height": "4vh",
+                    "display": "flex",
+                    "flex-direction": "row",
+                    "justify-content": "flex-end",
+                    "align-items": "flex-end",
+                },
+            ),
+        ]
+    )
 
 
 @app.callback(Output("graph-one-drop", "options"), [Input("incident-drop", "value")])
@@ -266,6 +271,7 @@ def incident_one_value(arg):
         Input("outlier-radio", "value"),
     ],
 )
+@slim_figure_output
 def update_graph_one(
     incident,
     start_date,
@@ -4,7 +4,7 @@ from dash.dependencies import Input, Output
 
 from ..app import app
 from ..components import Col, Row
-from ..helper_functions import utilization, card_value
+from ..helper_functions import utilization, card_values
 from ..settings import color_palette
 
 from ..layouts import (
@@ -14,32 +14,45 @@ from ..layouts import (
     top_number_bottom_spark,
 )
 
-layout = html.Div(
-    [
-        Row(utilization_header("Nursing Facilities"), className="header-row"),
+
+def card_rows(values=None):
+    """
+    Creates the rows of indicator cards
+
+    Args:
+        values(dict): card value id to the contents of the card
+
+    Returns:
+        list: rows of card columns
+    """
+    return [
         Row(
             [
                 card_col(
                     card_title="Custodial per 100MM",
                     card_val_id="card-1-nfs",
+                    values=values,
                     color=color_palette[1],
                     size=3,
                 ),
                 card_col(
                     card_title="Respite per 100MM",
                     card_val_id="card-2-nfs",
+                    values=values,
                     color=color_palette[1],
                     size=3,
                 ),
                 card_col(
                     card_title="Skilled per 100MM",
                     card_val_id="card-3-nfs",
+                    values=values,
                     color=color_palette[1],
                     size=3,
                 ),
                 card_col(
                     card_title="ALF per 100MM",
                     card_val_id="card-4-nfs",
+                    values=values,
                     color=color_palette[1],
                     size=3,
                 ),
@@ -51,36 +64,42 @@ layout = html.Div(
                 card_col(
                     card_title="Custodial Admissions",
                     card_val_id="card-5-nfs",
+                    values=values,
                     color=color_palette[3],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="Respite Admissions",
                     card_val_id="card-6-nfs",
+                    values=values,
                     color=color_palette[3],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="Skilled Admissions",
                     card_val_id="card-7-nfs",
+                    values=values,
                     color=color_palette[3],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="Custodial ALOS",
                     card_val_id="card-8-nfs",
+                    values=values,
                     color=color_palette[3],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="Respite ALOS",
                     card_val_id="card-9-nfs",
+                    values=values,
                     color=color_palette[3],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="Skilled ALOS",
                     card_val_id="card-10-nfs",
+                    values=values,
                     color=color_palette[3],
                     font_size="1.25vmax",
                 ),
@@ -92,208 +111,280 @@ layout = html.Div(
                 card_col(
                     card_title="Custodial Days",
                     card_val_id="card-11-nfs",
+                    values=values,
                     color=color_palette[1],
                     font_size="2vmax",
                 ),
                 card_col(
                     card_title="Respite Days",
                     card_val_id="card-12-nfs",
+                    values=values,
                     color=color_palette[1],
                     font_size="2vmax",
                 ),
                 card_col(
                     card_title="Skilled Days",
                     card_val_id="card-13-nfs",
+                    values=values,
                     color=color_palette[1],
                     font_size="2vmax",
                 ),
                 card_col(
                     card_title="Custodial(%)",
                     card_val_id="card-14-nfs",
+                    values=values,
                     color=color_palette[1],
                     font_size="2vmax",
                 ),
                 card_col(
                     card_title="ALF(%)",
                     card_val_id="card-15-nfs",
+                    values=values,
                     color=color_palette[1],
                     font_size="2vmax",
                 ),
                 card_col(
                     card_title="Discharged to Higher LOC(%)",
                     card_val_id="card-16-nfs",
+                    values=values,
                     color=color_palette[1],
                     font_size="2vmax",
                 ),
             ],
             className="third-row",
         ),
-        Row(
-            [
-                Col(
-                    [
-                        Col(
-                            [
-                                dcc.Link(
-                                    html.H6("Demo. EDA", style={
-                                            "font-size": "1vmax"}),
-                                    href="/demographics-eda",
-                                )
-                            ],
-                            size=2,
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "center",
-                            },
-                        ),
-                        Col(
-                            [
-                                dcc.Link(
-                                    html.H6(
-                                        "Enroll. EDA", style={"font-size": "1vmax"}
-                                    ),
-                                    href="/enrollment-eda",
-                                )
-                            ],
-                            size=2,
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "center",
-                            },
-                        ),
-                        Col(
-                            [
-                                dcc.Link(
-                                    html.H6(
-                                        "Incidents EDA", style={"font-size": "1vmax"}
-                                    ),
-                                    href="/incidents-eda",
-                                )
-                            ],
-                            size=2,
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "center",
-                            },
-                        ),
-                        Col(
-                            [
-                                dcc.Link(
-                                    html.H6(
-                                        "Utl. EDA", style={"font-size": "1vmax"}
-                                    ),
-                                    href="/utilization-eda",
-                                )
-                            ],
-                            size=2,
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "center",
-                            },
-                        ),
-                        Col(
-                            [
-                                dcc.Link(
-                                    html.H6("Town Table", style={
-                                            "font-size": "1vmax"}),
-                                    href="/town_count",
-                                )
-                            ],
-                            size=2,
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "center",
-                            },
-                        ),
-                    ],
-                    size=6,
-                    mobile_size=12,
-                    style={
-                        "display": "flex",
-                        "flex-direction": "row",
-                        "justify-content": "center",
-                        "align-items": "flex-end",
-                    },
-                )
-            ],
-            style={
-                "margin-top": "0.5vh",
-                "height": "6vh",
-                "display": "flex",
-                "flex-direction": "row",
-                "justify-content": "flex-end",
-                "align-items": "flex-end",
-            },
-        ),
     ]
-)
-
-
-@app.callback(Output("card-1-nfs", "children"), [Input("time_range", "value")])
-def card_val_1_nursing_facilities(time_range):
-    return card_value(time_range, utilization.ppts_in_utl_per_100MM, "utilization", "custodial_per_100MM", top_number_bottom_spark, ["custodial"])
-
-@app.callback(Output("card-2-nfs", "children"), [Input("time_range", "value")])
-def card_val_2_nursing_facilities(time_range):
-    return card_value(time_range, utilization.ppts_in_utl_per_100MM, "utilization", "respite_per_100MM", top_number_bottom_spark, ["respite"])
-
-@app.callback(Output("card-3-nfs", "children"), [Input("time_range", "value")])
-def card_val_3_nursing_facilities(time_range):
-    return card_value(time_range, utilization.ppts_in_utl_per_100MM, "utilization", "skilled_per_100MM", top_number_bottom_spark, ["skilled"])
-
-@app.callback(Output("card-4-nfs", "children"), [Input("time_range", "value")])
-def card_val_4_nursing_facilities(time_range):
-    return card_value(time_range, utilization.ppts_in_utl_per_100MM, "utilization", "alfs_per_100MM", top_number_bottom_spark, ["alfs"])
-
-@app.callback(Output("card-5-nfs", "children"), [Input("time_range", "value")])
-def card_val_5_nursing_facilities(time_range):
-    return card_value(time_range, utilization.admissions_count, "utilization", "custodial_admissions", left_number_right_spark, ["custodial"])
-
-@app.callback(Output("card-6-nfs", "children"), [Input("time_range", "value")])
-def card_val_6_nursing_facilities(time_range):
-    return card_value(time_range, utilization.admissions_count, "utilization", "respite_admissions", left_number_right_spark, ["respite"])
-
-@app.callback(Output("card-7-nfs", "children"), [Input("time_range", "value")])
-def card_val_7_nursing_facilities(time_range):
-    return card_value(time_range, utilization.admissions_count, "utilization", "skilled_admissions", left_number_right_spark, ["skilled"])
-
-@app.callback(Output("card-8-nfs", "children"), [Input("time_range", "value")])
-def card_val_8_nursing_facilities(time_range):
-    return card_value(time_range, utilization.alos, "utilization", "custodial_alos", left_number_right_spark, ["custodial"])
-
-@app.callback(Output("card-9-nfs", "children"), [Input("time_range", "value")])
-def card_val_9_nursing_facilities(time_range):
-    return card_value(time_range, utilization.alos, "utilization", "respite_alos", left_number_right_spark, ["respite"])
-
-@app.callback(Output("card-10-nfs", "children"), [Input("time_range", "value")])
-def card_val_10_nursing_facilities(time_range):
-    return card_value(time_range, utilization.alos, "utilization", "skilled_alos", left_number_right_spark, ["skilled"])
 
-@app.callback(Output("card-11-nfs", "children"), [Input("time_range", "value")])
-def card_val_11_nursing_facilities(time_range):
-    return card_value(time_range, utilization.utilization_days, "utilization", "custodial_days", top_number_bottom_spark, ["custodial"])
 
-@app.callback(Output("card-12-nfs", "children"), [Input("time_range", "value")])
-def card_val_12_nursing_facilities(time_range):
-    return card_value(time_range, utilization.utilization_days, "utilization", "respite_days", top_number_bottom_spark, ["respite"])
+def build_layout():
+    """
+    Creates the nursing facility indicator page
+    """
+    return html.Div(
+        [
+            Row(utilization_header("Nursing Facilities"), className="header-row"),
+            html.Div(card_rows(), id="nfs-cards"),
+            Row(
+                [
+                    Col(
+                        [
+                            Col(
+                                [
+                                    dcc.Link(
+                                        html.H6("Demo. EDA", style={
+                                                "font-size": "1vmax"}),
+                                        href="/demographics-eda",
+                                    )
+                                ],
+                                size=2,
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "center",
+                                },
+                            ),
+                            Col(
+                                [
+                                    dcc.Link(
+                                        html.H6(
+                                            "Enroll. EDA", style={"font-size": "1vmax"}
+                                        ),
+                                        href="/enrollment-eda",
+                                    )
+                                ],
+                                size=2,
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "center",
+                                },
+                            ),
+                            Col(
+                                [
+                                    dcc.Link(
+                                        html.H6(
+                                            "Incidents EDA", style={"font-size": "1vmax"}
+                                        ),
+                                        href="/incidents-eda",
+                                    )
+                                ],
+                                size=2,
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "center",
+                                },
+                            ),
+                            Col(
+                                [
+                                    dcc.Link(
+                                        html.H6(
+                                            "Utl. EDA", style={"font-size": "1vmax"}
+                                        ),
+                                        href="/utilization-eda",
+                                    )
+                                ],
+                                size=2,
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "center",
+                                },
+                            ),
+                            Col(
+                                [
+                                    dcc.Link(
+                                        html.H6("Town Table", style={
+                                                "font-size": "1vmax"}),
+                                        href="/town_count",
+                                    )
+                                ],
+                                size=2,
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "center",
+                                },
+                            ),
+                        ],
+                        size=6,
+                        mobile_size=12,
+                        style={
+                            "display": "flex",
+                            "flex-direction": "row",
+                            "justify-content": "center",
+                            "align-items": "flex-end",
+                        },
+                    )
+                ],
+                style={
+                    "margin-top": "0.5vh",
+                    "height": "6vh",
+                    "display": "flex",
+                    "flex-direction": "row",
+                    "justify-content": "flex-end",
+                    "align-items": "flex-end",
+                },
+            ),
+        ]
+    )
 
-@app.callback(Output("card-13-nfs", "children"), [Input("time_range", "value")])
-def card_val_13_nursing_facilities(time_range):
-    return card_value(time_range, utilization.utilization_days, "utilization", "skilled_days", top_number_bottom_spark, ["skilled"])
 
-@app.callback(Output("card-14-nfs", "children"), [Input("time_range", "value")])
-def card_val_14_nursing_facilities(time_range):
-    return card_value(time_range, utilization.ppts_in_utl_percent, "utilization", "custodial_percent", top_number_bottom_spark, ["custodial"])
+cards = {
+    "card-1-nfs": dict(
+        value_function=utilization.ppts_in_utl_per_100MM,
+        agg_table="utilization",
+        agg_col="custodial_per_100MM",
+        card_layout=top_number_bottom_spark,
+        additional_args=["custodial"],
+    ),
+    "card-2-nfs": dict(
+        value_function=utilization.ppts_in_utl_per_100MM,
+        agg_table="utilization",
+        agg_col="respite_per_100MM",
+        card_layout=top_number_bottom_spark,
+        additional_args=["respite"],
+    ),
+    "card-3-nfs": dict(
+        value_function=utilization.ppts_in_utl_per_100MM,
+        agg_table="utilization",
+        agg_col="skilled_per_100MM",
+        card_layout=top_number_bottom_spark,
+        additional_args=["skilled"],
+    ),
+    "card-4-nfs": dict(
+        value_function=utilization.ppts_in_utl_per_100MM,
+        agg_table="utilization",
+        agg_col="alfs_per_100MM",
+        card_layout=top_number_bottom_spark,
+        additional_args=["alfs"],
+    ),
+    "card-5-nfs": dict(
+        value_function=utilization.admissions_count,
+        agg_table="utilization",
+        agg_col="custodial_admissions",
+        card_layout=left_number_right_spark,
+        additional_args=["custodial"],
+    ),
+    "card-6-nfs": dict(
+        value_function=utilization.admissions_count,
+        agg_table="utilization",
+        agg_col="respite_admissions",
+        card_layout=left_number_right_spark,
+        additional_args=["respite"],
+    ),
+    "card-7-nfs": dict(
+        value_function=utilization.admissions_count,
+        agg_table="utilization",
+        agg_col="skilled_admissions",
+        card_layout=left_number_right_spark,
+        additional_args=["skilled"],
+    ),
+    "card-8-nfs": dict(
+        value_function=utilization.alos,
+        agg_table="utilization",
+        agg_col="custodial_alos",
+        card_layout=left_number_right_spark,
+        additional_args=["custodial"],
+    ),
+    "card-9-nfs": dict(
+        value_function=utilization.alos,
+        agg_table="utilization",
+        agg_col="respite_alos",
+        card_layout=left_number_right_spark,
+        additional_args=["respite"],
+    ),
+    "card-10-nfs": dict(
+        value_function=utilization.alos,
+        agg_table="utilization",
+        agg_col="skilled_alos",
+        card_layout=left_number_right_spark,
+        additional_args=["skilled"],
+    ),
+    "card-11-nfs": dict(
+        value_function=utilization.utilization_days,
+        agg_table="utilization",
+        agg_col="custodial_days",
+        card_layout=top_number_bottom_spark,
+        additional_args=["custodial"],
+    ),
+    "card-12-nfs": dict(
+        value_function=utilization.utilization_days,
+        agg_table="utilization",
+        agg_col="respite_days",
+        card_layout=top_number_bottom_spark,
+        additional_args=["respite"],
+    ),
+    "card-13-nfs": dict(
+        value_function=utilization.utilization_days,
+        agg_table="utilization",
+        agg_col="skilled_days",
+        card_layout=top_number_bottom_spark,
+        additional_args=["skilled"],
+    ),
+    "card-14-nfs": dict(
+        value_function=utilization.ppts_in_utl_percent,
+        agg_table="utilization",
+        agg_col="custodial_percent",
+        card_layout=top_number_bottom_spark,
+        additional_args=["custodial"],
+    ),
+    "card-15-nfs": dict(
+        value_function=utilization.ppts_in_utl_percent,
+        agg_table="utilization",
+        agg_col="alfs_percent",
+        card_layout=top_number_bottom_spark,
+        additional_args=["alfs"],
+    ),
+    "card-16-nfs": dict(
+        value_function=utilization.percent_nf_discharged_to_higher_loc,
+        agg_table="utilization",
+        agg_col="nf_higher_loc_discharge_percent",
+        card_layout=top_number_bottom_spark,
+    ),
+}
 
-@app.callback(Output("card-15-nfs", "children"), [Input("time_range", "value")])
-def card_val_15_nursing_facilities(time_range):
-    return card_value(time_range, utilization.ppts_in_utl_percent, "utilization", "alfs_percent", top_number_bottom_spark, ["alfs"])
 
-@app.callback(Output("card-16-nfs", "children"), [Input("time_range", "value")])
-def card_val_16_nursing_facilities(time_range):
-    return card_value(time_range, utilization.percent_nf_discharged_to_higher_loc, "utilization", "nf_higher_loc_discharge_percent", top_number_bottom_spark)
\ No newline at end of file
+@app.callback(Output("nfs-cards", "children"), [Input("time_range", "value")])
+def card_vals_nursing_facilities(time_range):
+    return card_rows(card_values(time_range, cards))
@@ -8,9 +8,10 @@ from ..helper_functions import (
     enrollment,
     center_enrollment,
     demographics,
-    agg,
-    card_value,
+    card_values,
+    sql_fetchone,
 )
+from ..db_utils import agg_pool
 from ..settings import color_palette
 
 from ..layouts import (
@@ -20,32 +21,45 @@ from ..layouts import (
     top_number_bottom_spark,
 )
 
-layout = html.Div(
-    [
-        Row(indicator_header("Operations"), className="header-row"),
+
+def card_rows(values=None):
+    """
+    Creates the rows of indicator cards
+
+    Args:
+        values(dict): card value id to the contents of the card
+
+    Returns:
+        list: rows of card columns
+    """
+    return [
         Row(
             [
                 card_col(
                     card_title="Census",
                     card_val_id="card-1-ops",
+                    values=values,
                     color=color_palette[1],
                     size=3,
                 ),
                 card_col(
                     card_title="Providence",
                     card_val_id="card-2-ops",
+                    values=values,
                     color=color_palette[1],
                     size=3,
                 ),
                 card_col(
                     card_title="Woonsocket",
                     card_val_id="card-3-ops",
+                    values=values,
                     color=color_palette[1],
                     size=3,
                 ),
                 card_col(
                     card_title="Westerly",
                     card_val_id="card-4-ops",
+                    values=values,
                     color=color_palette[1],
                     size=3,
                 ),
@@ -57,36 +71,42 @@ layout = html.Div(
                 card_col(
                     card_title="Avg. Attendance PVD",
                     card_val_id="card-5-ops",
+                    values=values,
                     color=color_palette[3],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="Avg. Attendance WOO",
                     card_val_id="card-6-ops",
+                    values=values,
                     color=color_palette[3],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="Avg. Attendance WES",
                     card_val_id="card-7-ops",
+                    values=values,
                     color=color_palette[3],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="Cancellation Rate PVD",
                     card_val_id="card-8-ops",
+                    values=values,
                     color=color_palette[3],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="Cancellation Rate WOO",
                     card_val_id="card-9-ops",
+                    values=values,
                     color=color_palette[3],
                     font_size="1.25vmax",
                 ),
                 card_col(
                     card_title="Cancellation Rate WES",
                     card_val_id="card-10-ops",
+                    values=values,
                     color=color_palette[3],
                     font_size="1.25vmax",
                 ),
@@ -98,142 +118,159 @@ layout = html.Div(
                 card_col(
                     card_title="Attending Day Center(%)",
                     card_val_id="card-11-ops",
+                    values=values,
                     color=color_palette[1],
                     font_size="2vmax",
                 ),
                 card_col(
                     card_title="Rides by PACE(%)",
                     card_val_id="card-12-ops",
+                    values=values,
                     color=color_palette[1],
                     font_size="2vmax",
                 ),
                 card_col(
                     card_title="Staffing Ratio",
                     card_val_id="card-13-ops",
+                    values=values,
                     color=color_palette[1],
                     font_size="2vmax",
                 ),
                 card_col(
                     card_title="Staff Hours per DC Ppt",
                     card_val_id="card-14-ops",
+                    values=values,
                     color=color_palette[1],
                     font_size="2vmax",
                 ),
                 card_col(
                     card_title="Level 2 Events in DC",
                     card_val_id="card-15-ops",
+                    values=values,
                     color=color_palette[1],
                     font_size="2vmax",
                 ),
                 card_col(
                     card_title="Avg. Risk Score",
                     card_val_id="card-16-ops",
+                    values=values,
                     color=color_palette[1],
                     font_size="2vmax",
                 ),
             ],
             className="third-row",
         ),
-        Row(
-            [
-                Col(
-                    [
-                        Col(
-                            [
-                                dcc.Link(
-                                    html.H6("Demo. EDA", style={"font-size": "1vmax"}),
-                                    href="/demographics-eda",
-                                )
-                            ],
-                            size=2,
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "center",
-                            },
-                        ),
-                        Col(
-                            [
-                                dcc.Link(
-                                    html.H6(
-                                        "Enroll. EDA", style={"font-size": "1vmax"}
-                                    ),
-                                    href="/enrollment-eda",
-                                )
-                            ],
-                            size=2,
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "center",
-                            },
-                        ),
-                        Col(
-                            [
-                                dcc.Link(
-                                    html.H6(
-                                        "Incidents EDA", style={"font-size": "1vmax"}
-                                    ),
-                                    href="/incidents-eda",
-                                )
-                            ],
-                            size=2,
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "center",
-                            },
-                        ),
-                        Col(
-                            [
-                                dcc.Link(
-                                    html.H6("Utl. EDA", style={"font-size": "1vmax"}),
-                                    href="/utilization-eda",
-                                )
-                            ],
-                            size=2,
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "center",
-                            },
-                        ),
-                        Col(
-                            [
-                                dcc.Link(
-                                    html.H6("Town Table", style={"font-size": "1vmax"}),
-                                    href="/town_count",
-                                )
-                            ],
-                            size=2,
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "center",
-                            },
-                        ),
-                    ],
-                    size=6,
-                    mobile_size=12,
-                    style={
-                        "display": "flex",
-                        "flex-direction": "row",
-                        "justify-content": "center",
-                        "align-items": "flex-end",
-                    },
-                )
-            ],
-            style={
-                "margin-top": "0.5vh",
-                "height": "6vh",
-                "display": "flex",
-                "flex-direction": "row",
-                "justify-content": "flex-end",
-                "align-items": "flex-end",
-            },
-        ),
     ]
-)
+
+
+def build_layout():
+    """
+    Creates the operations indicator page
+    """
+    return html.Div(
+        [
+            Row(indicator_header("Operations"), className="header-row"),
+            html.Div(card_rows(), id="ops-cards"),
+            Row(
+                [
+                    Col(
+                        [
+                            Col(
+                                [
+                                    dcc.Link(
+                                        html.H6("Demo. EDA", style={"font-size": "1vmax"}),
+                                        href="/demographics-eda",
+                                    )
+                                ],
+                                size=2,
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "center",
+                                },
+                            ),
+                            Col(
+                                [
+                                    dcc.Link(
+                                        html.H6(
+                                            "Enroll. EDA", style={"font-size": "1vmax"}
+                                        ),
+                                        href="/enrollment-eda",
+                                    )
+                                ],
+                                size=2,
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "center",
+                                },
+                            ),
+                            Col(
+                                [
+                                    dcc.Link(
+                                        html.H6(
+                                            "Incidents EDA", style={"font-size": "1vmax"}
+                                        ),
+                                        href="/incidents-eda",
+                                    )
+                                ],
+                                size=2,
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "center",
+                                },
+                            ),
+                            Col(
+                                [
+                                    dcc.Link(
+                                        html.H6("Utl. EDA", style={"font-size": "1vmax"}),
+                                        href="/utilization-eda",
+                                    )
+                                ],
+                                size=2,
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "center",
+                                },
+                            ),
+                            Col(
+                                [
+                                    dcc.Link(
+                                        html.H6("Town Table", style={"font-size": "1vmax"}),
+                                        href="/town_count",
+                                    )
+                                ],
+                                size=2,
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "center",
+                                },
+                            ),
+                        ],
+                        size=6,
+                        mobile_size=12,
+                        style={
+                            "display": "flex",
+                            "flex-direction": "row",
+                            "justify-content": "center",
+                            "align-items": "flex-end",
+                        },
+                    )
+                ],
+                style={
+                    "margin-top": "0.5vh",
+                    "height": "6vh",
+                    "display": "flex",
+                    "flex-direction": "row",
+                    "justify-content": "flex-end",
+                    "align-items": "flex-end",
+                },
+            ),
+        ]
+    )
 
 
 def avg_agg_column(params, col, table):
@@ -248,162 +285,93 @@ def avg_agg_column(params, col, table):
     Return:
         float: average of column during period
     """
-    return agg.single_value_query(
-        f"SELECT ROUND(AVG({col}), 2) FROM {table} WHERE month BETWEEN ? AND ?", params
-    )
-
-
-@app.callback(Output("card-1-ops", "children"), [Input("time_range", "value")])
-def card_val_1_operations(time_range):
-    return card_value(
-        time_range,
-        enrollment.census_during_period,
-        "enrollment",
-        "census",
-        top_number_bottom_spark,
-    )
-
-
-@app.callback(Output("card-2-ops", "children"), [Input("time_range", "value")])
-def card_val_2_operations(time_range):
-    return card_value(
-        time_range,
-        center_enrollment.census_on_end_date,
-        "center_enrollment",
-        "pvd_census",
-        top_number_bottom_spark,
-        ["Providence"],
-    )
-
-
-@app.callback(Output("card-3-ops", "children"), [Input("time_range", "value")])
-def card_val_3_operations(time_range):
-    return card_value(
-        time_range,
-        center_enrollment.census_on_end_date,
-        "center_enrollment",
-        "woon_census",
-        top_number_bottom_spark,
-        ["Woonsocket"],
-    )
-
-
-@app.callback(Output("card-4-ops", "children"), [Input("time_range", "value")])
-def card_val_4_operations(time_range):
-    return card_value(
-        time_range,
-        center_enrollment.census_on_end_date,
-        "center_enrollment",
-        "wes_census",
-        top_number_bottom_spark,
-        ["Westerly"],
-    )
-
-
-@app.callback(Output("card-5-ops", "children"), [Input("time_range", "value")])
-def card_val_5_operations(time_range):
-    return card_value(
-        time_range,
-        avg_agg_column,
-        "center_enrollment",
-        "pvd_actual_census",
-        left_number_right_spark,
-        ["pvd_actual_census", "center_enrollment"],
-    )
-
-
-@app.callback(Output("card-6-ops", "children"), [Input("time_range", "value")])
-def card_val_6_operations(time_range):
-    return card_value(
-        time_range,
-        avg_agg_column,
-        "center_enrollment",
-        "woon_actual_census",
-        left_number_right_spark,
-        ["woon_actual_census", "center_enrollment"],
-    )
-
-
-@app.callback(Output("card-7-ops", "children"), [Input("time_range", "value")])
-def card_val_7_operations(time_range):
-    return card_value(
-        time_range,
-        avg_agg_column,
-        "center_enrollment",
-        "wes_actual_census",
-        left_number_right_spark,
-        ["wes_actual_census", "center_enrollment"],
-    )
-
-
-@app.callback(Output("card-8-ops", "children"), [Input("time_range", "value")])
-def card_val_8_operations(time_range):
-    return card_value(
-        time_range,
-        avg_agg_column,
-        "center_enrollment",
-        "pvd_pace_cancelation_rate",
-        left_number_right_spark,
-        ["pvd_pace_cancelation_rate", "center_enrollment"],
-    )
-
-
-@app.callback(Output("card-9-ops", "children"), [Input("time_range", "value")])
-def card_val_9_operations(time_range):
-    return card_value(
-        time_range,
-        avg_agg_column,
-        "center_enrollment",
-        "woon_pace_cancelation_rate",
-        left_number_right_spark,
-        ["woon_pace_cancelation_rate", "center_enrollment"],
-    )
-
-
-@app.callback(Output("card-10-ops", "children"), [Input("time_range", "value")])
-def card_val_10_operations(time_range):
-    return card_value(
-        time_range,
-        avg_agg_column,
-        "center_enrollment",
-        "wes_pace_cancelation_rate",
-        left_number_right_spark,
-        ["wes_pace_cancelation_rate", "center_enrollment"],
-    )
-
-
-@app.callback(Output("card-11-ops", "children"), [Input("time_range", "value")])
-def card_val_11_operations(time_range):
-    return card_value(
-        time_range,
-        demographics.percent_attending_dc,
-        "demographics",
-        "percent_attending_dc",
-        top_number_bottom_spark,
-    )
-
-
-@app.callback(Output("card-12-ops", "children"), [Input("time_range", "value")])
-def card_val_12_operations(time_range):
-    return ""
-
-
-@app.callback(Output("card-13-ops", "children"), [Input("time_range", "value")])
-def card_val_13_operations(time_range):
-    return ""
-
-
-@app.callback(Output("card-14-ops", "children"), [Input("time_range", "value")])
-def card_val_14_operations(time_range):
-    return ""
-
-
-@app.callback(Output("card-15-ops", "children"), [Input("time_range", "value")])
-def card_val_15_operations(time_range):
-    return ""
-
-
-@app.callback(Output("card-16-ops", "children"), [Input("time_range", "value")])
-def card_val_16_operations(time_range):
-    return ""
-
+    return sql_fetchone(
+        f"SELECT ROUND(AVG({col}), 2) FROM {table} WHERE month BETWEEN ? AND ?",
+        params,
+        agg_pool,
+    )[0]
+
+
+# card-12-ops through card-16-ops do not have an indicator yet and are left empty
+cards = {
+    "card-1-ops": dict(
+        value_function=enrollment.census_during_period,
+        agg_table="enrollment",
+        agg_col="census",
+        card_layout=top_number_bottom_spark,
+    ),
+    "card-2-ops": dict(
+        value_function=center_enrollment.census_on_end_date,
+        agg_table="center_enrollment",
+        agg_col="pvd_census",
+        card_layout=top_number_bottom_spark,
+        additional_args=["Providence"],
+    ),
+    "card-3-ops": dict(
+        value_function=center_enrollment.census_on_end_date,
+        agg_table="center_enrollment",
+        agg_col="woon_census",
+        card_layout=top_number_bottom_spark,
+        additional_args=["Woonsocket"],
+    ),
+    "card-4-ops": dict(
+        value_function=center_enrollment.census_on_end_date,
+        agg_table="center_enrollment",
+        agg_col="wes_census",
+        card_layout=top_number_bottom_spark,
+        additional_args=["Westerly"],
+    ),
+    "card-5-ops": dict(
+        value_function=avg_agg_column,
+        agg_table="center_enrollment",
+        agg_col="pvd_actual_census",
+        card_layout=left_number_right_spark,
+        additional_args=["pvd_actual_census", "center_enrollment"],
+    ),
+    "card-6-ops": dict(
+        value_function=avg_agg_column,
+        agg_table="center_enrollment",
+        agg_col="woon_actual_census",
+        card_layout=left_number_right_spark,
+        additional_args=["woon_actual_census", "center_enrollment"],
+    ),
+    "card-7-ops": dict(
+        value_function=avg_agg_column,
+        agg_table="center_enrollment",
+        agg_col="wes_actual_census",
+        card_layout=left_number_right_spark,
+        additional_args=["wes_actual_census", "center_enrollment"],
+    ),
+    "card-8-ops": dict(
+        value_function=avg_agg_column,
+        agg_table="center_enrollment",
+        agg_col="pvd_pace_cancelation_rate",
+        card_layout=left_number_right_spark,
+        additional_args=["pvd_pace_cancelation_rate", "center_enrollment"],
+    ),
+    "card-9-ops": dict(
+        value_function=avg_agg_column,
+        agg_table="center_enrollment",
+        agg_col="woon_pace_cancelation_rate",
+        card_layout=left_number_right_spark,
+        additional_args=["woon_pace_cancelation_rate", "center_enrollment"],
+    ),
+    "card-10-ops": dict(
+        value_function=avg_agg_column,
+        agg_table="center_enrollment",
+        agg_col="wes_pace_cancelation_rate",
+        card_layout=left_number_right_spark,
+        additional_args=["wes_pace_cancelation_rate", "center_enrollment"],
+    ),
+    "card-11-ops": dict(
+        value_function=demographics.percent_attending_dc,
+        agg_table="demographics",
+        agg_col="percent_attending_dc",
+        card_layout=top_number_bottom_spark,
+    ),
+}
+
+
+@app.callback(Output("ops-cards", "children"), [Input("time_range", "value")])
+def card_vals_operations(time_range):
+    return card_rows(card_values(time_range, cards))
@@ -1,37 +1,41 @@
 import dash_core_components as dcc
 import dash_html_components as html
 from dash.dependencies import Input, Output
-import plotly.graph_objs as go
 
 from ..app import app
 from ..components import Row
 from ..helper_functions import enrollment
 from ..settings import color_palette, graph_config
+from ..figure_utils import figure_trace, figure_layout
 
-layout = html.Div(
-    [
-        Row(
-            [
-                dcc.Graph(
-                    id="map-graph",
-                    style={"height": "93vh", "width": "100vw"},
-                    config=graph_config,
-                ),
-                dcc.Interval(
-                    id="interval-component",
-                    interval=604_800 * 1000,  # in milliseconds
-                    n_intervals=0,
-                ),
-            ],
-            style={
-                "display": "flex",
-                "flex-direction": "column",
-                "justify-content": "center",
-                "align-content": "center",
-            },
-        )
-    ]
-)
+def build_layout():
+    """
+    Creates the participant map page
+    """
+    return html.Div(
+        [
+            Row(
+                [
+                    dcc.Graph(
+                        id="map-graph",
+                        style={"height": "93vh", "width": "100vw"},
+                        config=graph_config,
+                    ),
+                    dcc.Interval(
+                        id="interval-component",
+                        interval=604_800 * 1000,  # in milliseconds
+                        n_intervals=0,
+                    ),
+                ],
+                style={
+                    "display": "flex",
+                    "flex-direction": "column",
+                    "justify-content": "center",
+                    "align-content": "center",
+                },
+            )
+        ]
+    )
 
 
 @app.callback(
@@ -46,7 +50,8 @@ def update_map(n):
     enrolled_df, disenrolled_df = enrollment.address_mapping_df()
 
     fig_data = [
-        go.Scattermapbox(
+        figure_trace(
+            "scattermapbox",
             lat=disenrolled_df.lat,
             lon=disenrolled_df.lon,
             mode="markers",
@@ -56,7 +61,8 @@ def update_map(n):
             text=disenrolled_df.name + "<br>" + disenrolled_df.full_address,
             hoverinfo="text",
         ),
-        go.Scattermapbox(
+        figure_trace(
+            "scattermapbox",
             lat=enrolled_df.lat,
             lon=enrolled_df.lon,
             mode="markers",
@@ -68,7 +74,7 @@ def update_map(n):
         ),
     ]
 
-    fig_layout = go.Layout(
+    fig_layout = figure_layout(
         autosize=True,
         paper_bgcolor="rgba(0,0,0,0)",
         plot_bgcolor="rgba(0,0,0,0)",
@@ -1,57 +1,61 @@
-import urllib
 import dash_html_components as html
 from dash.dependencies import Input, Output
 from ..app import app
 from ..components import Row, Col
 from ..team_utils import create_comparison_table
 from ..layouts import indicator_header
+from ..download_utils import team_csv_url
 from ..helper_functions import time_range_dict
 from ..settings import color_palette
 
-layout = html.Div(
-    [
-        Row(indicator_header(title="Team Comparison"), className="header-row"),
-        Row(
-            [
-                Col(
-                    [
-                        html.A(
-                            "Download Data",
-                            id="download-link",
-                            download="team_comparison.csv",
-                            href="",
-                            target="_blank",
-                        )
-                    ],
-                    size=1,
-                    mobile_size=12,
-                    style={
-                        "display": "flex",
-                        "flex-direction": "row",
-                        "justify-content": "flex-start",
-                        "align-items": "flex-start",
-                    },
-                ),
-                Col(
-                    id="team-table",
-                    size=11,
-                    mobile_size=12,
-                    style={
-                        "display": "flex",
-                        "flex-direction": "column",
-                        "justify-content": "center",
-                        "align-items": "flex-start",
-                    },
-                ),
-            ],
-            style={
-                "display": "flex",
-                "flex-direction": "row",
-                "justify-content": "center",
-            },
-        ),
-    ]
-)
+def build_layout():
+    """
+    Creates the team comparison page
+    """
+    return html.Div(
+        [
+            Row(indicator_header(title="Team Comparison"), className="header-row"),
+            Row(
+                [
+                    Col(
+                        [
+                            html.A(
+                                "Download Data",
+                                id="download-link",
+                                download="team_comparison.csv",
+                                href="",
+                                target="_blank",
+                            )
+                        ],
+                        size=1,
+                        mobile_size=12,
+                        style={
+                            "display": "flex",
+                            "flex-direction": "row",
+                            "justify-content": "flex-start",
+                            "align-items": "flex-start",
+                        },
+                    ),
+                    Col(
+                        id="team-table",
+                        size=11,
+                        mobile_size=12,
+                        style={
+                            "display": "flex",
+                            "flex-direction": "column",
+                            "justify-content": "center",
+                            "align-items": "flex-start",
+                        },
+                    ),
+                ],
+                style={
+                    "display": "flex",
+                    "flex-direction": "row",
+                    "justify-content": "center",
+                },
+            ),
+        ]
+    )
 
 indictors_to_url = {
     "Participants": "team_info-ppts",
@@ -114,7 +118,7 @@ def update_team_table(time_range):
                     html.Td(
                         html.A(
                             dff.iloc[i][col],
-                            href=f"{indictors_to_url[dff.iloc[i][col]]}",
+                            href=f"{indictors_to_url.get(dff.iloc[i][col], '')}",
                             target="_blank",
                         ),
                         style={"text-align": "center"},
@@ -133,18 +137,13 @@ def update_team_table(time_range):
 @app.callback(Output("download-link", "href"), [Input("time_range", "value")])
 def update_download_link(time_range):
     """
-    Returns a csv string of the data used to create the chart
+    Returns the url of the csv of the data used to create the table,
+    the csv is built when the link is clicked
 
     Args:
         time_range(str): time period of the table values
-        
+
     Returns:
-        str: string used to allow user to download csv of data
+        str: url used to allow user to download csv of data
     """
-    params = time_range_dict[time_range][0]()
-    dff = create_comparison_table(params, return_df=True)
-    csv_string = dff.to_csv(index=False, encoding="utf-8")
-    csv_string = "data:text/csv;charset=utf-8,%EF%BB%BF" + urllib.parse.quote(
-        csv_string
-    )
-    return csv_string
+    return team_csv_url(time_range)
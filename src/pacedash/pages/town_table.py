@@ -9,115 +9,119 @@ from ..helper_functions import center_enrollment, enrollment
 from ..settings import color_palette
 
 
-layout = html.Div(
-    [
-        Row(
-            [
-                Col(
-                    [
-                        dcc.Dropdown(
-                            id="center-drop",
-                            options=[
-                                {"label": "All Centers", "value": "all"},
-                                {"label": "Providence", "value": "Providence"},
-                                {"label": "Westerly", "value": "Westerly"},
-                                {"label": "Woonsocket", "value": "Woonsocket"},
-                            ],
-                            value="all",
-                            searchable=False,
-                        ),
-                        dcc.Input(
-                            id="start_date",
-                            type="text",
-                            size=13,
-                            value=(
-                                pd.to_datetime("today") - pd.DateOffset(years=1)
-                            ).strftime("%m/%d/%Y"),
-                            style={
-                                "text-align": "center",
-                                "width": "100%",
-                                "min-height": "3vh",
-                                "border-color": "#ccc",
-                                "border-style": "solid",
-                                "border-width": "1px",
-                                "border-radius": "4px",
-                            },
-                        ),
-                        dcc.Input(
-                            id="end_date",
-                            type="text",
-                            size=13,
-                            value=pd.to_datetime("today").strftime("%m/%d/%Y"),
-                            style={
-                                "text-align": "center",
-                                "width": "100%",
-                                "min-height": "3vh",
-                                "border-color": "#ccc",
-                                "border-style": "solid",
-                                "border-width": "1px",
-                                "border-radius": "4px",
-                            },
-                        ),
-                        dcc.Interval(
-                            id="interval-component",
-                            interval=12 * 60 * 60 * 1000,  # in milliseconds
-                            n_intervals=0,
-                        ),
-                        dcc.Link(
-                            html.H6("Ppts Map"),
-                            href="/map",
-                            style={"font-size": "1vmin"},
-                        ),
-                        dcc.Link(
-                            html.H6("Demo. EDA"),
-                            href="/demographics-eda",
-                            style={"font-size": "1vmin"},
-                        ),
-                        dcc.Link(
-                            html.H6("Enroll. EDA"),
-                            href="/enrollment-eda",
-                            style={"font-size": "1vmin"},
-                        ),
-                        dcc.Link(
-                            html.H6("Incidents EDA"),
-                            href="/incidents-eda",
-                            style={"font-size": "1vmin"},
-                        ),
-                        dcc.Link(
-                            html.H6("Utl. EDA"),
-                            href="/utilization-eda",
-                            style={"font-size": "1vmin"},
-                        ),
-                    ],
-                    bp="md",
-                    size=2,
-                    style={
-                        "display": "flex",
-                        "flex-direction": "column",
-                        "justify-content": "flex-start",
-                        "margin-bottom": "2vh",
-                    },
-                ),
-                Col(
-                    id="town-table",
-                    size=10,
-                    style={
-                        "display": "flex",
-                        "flex-direction": "column",
-                        "justify-content": "center",
-                        "align-items": "flex-start",
-                    },
-                ),
-            ],
-            style={
-                "margin-top": "4vh",
-                "display": "flex",
-                "flex-direction": "row",
-                "justify-content": "center",
-            },
-        )
-    ]
-)
+def build_layout():
+    """
+    Creates the town count page
+    """
+    return html.Div(
+        [
+            Row(
+                [
+                    Col(
+                        [
+                            dcc.Dropdown(
+                                id="center-drop",
+                                options=[
+                                    {"label": "All Centers", "value": "all"},
+                                    {"label": "Providence", "value": "Providence"},
+                                    {"label": "Westerly", "value": "Westerly"},
+                                    {"label": "Woonsocket", "value": "Woonsocket"},
+                                ],
+                                value="all",
+                                searchable=False,
+                            ),
+                            dcc.Input(
+                                id="start_date",
+                                type="text",
+                                size=13,
+                                value=(
+                                    pd.to_datetime("today") - pd.DateOffset(years=1)
+                                ).strftime("%m/%d/%Y"),
+                                style={
+                                    "text-align": "center",
+                                    "width": "100%",
+                                    "min-height": "3vh",
+                                    "border-color": "#ccc",
+                                    "border-style": "solid",
+                                    "border-width": "1px",
+                                    "border-radius": "4px",
+                                },
+                            ),
+                            dcc.Input(
+                                id="end_date",
+                                type="text",
+                                size=13,
+                                value=pd.to_datetime("today").strftime("%m/%d/%Y"),
+                                style={
+                                    "text-align": "center",
+                                    "width": "100%",
+                                    "min-height": "3vh",
+                                    "border-color": "#ccc",
+                                    "border-style": "solid",
+                                    "border-width": "1px",
+                                    "border-radius": "4px",
+                                },
+                            ),
+                            dcc.Interval(
+                                id="interval-component",
+                                interval=12 * 60 * 60 * 1000,  # in milliseconds
+                                n_intervals=0,
+                            ),
+                            dcc.Link(
+                                html.H6("Ppts Map"),
+                                href="/map",
+                                style={"font-size": "1vmin"},
+                            ),
+                            dcc.Link(
+                                html.H6("Demo. EDA"),
+                                href="/demographics-eda",
+                                style={"font-size": "1vmin"},
+                            ),
+                            dcc.Link(
+                                html.H6("Enroll. EDA"),
+                                href="/enrollment-eda",
+                                style={"font-size": "1vmin"},
+                            ),
+                            dcc.Link(
+                                html.H6("Incidents EDA"),
+                                href="/incidents-eda",
+                                style={"font-size": "1vmin"},
+                            ),
+                            dcc.Link(
+                                html.H6("Utl. EDA"),
+                                href="/utilization-eda",
+                                style={"font-size": "1vmin"},
+                            ),
+                        ],
+                        bp="md",
+                        size=2,
+                        style={
+                            "display": "flex",
+                            "flex-direction": "column",
+                            "justify-content": "flex-start",
+                            "margin-bottom": "2vh",
+                        },
+                    ),
+                    Col(
+                        id="town-table",
+                        size=10,
+                        style={
+                            "display": "flex",
+                            "flex-direction": "column",
+                            "justify-content": "center",
+                            "align-items": "flex-start",
+                        },
+                    ),
+                ],
+                style={
+                    "margin-top": "4vh",
+                    "display": "flex",
+                    "flex-direction": "row",
+                    "justify-content": "center",
+                },
+            )
+        ]
+    )
 
 
 @app.callback(
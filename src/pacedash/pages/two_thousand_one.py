@@ -243,18 +243,22 @@ def create_images(image_urls):
     return imgs
 
 
-layout = html.Div(
-    [
-        Row(
-            [Col(create_list(titles)), Col(create_images(image_urls))],
-            style={
-                "margin-top": "4vh",
-                "display": "flex",
-                "flex-direction": "row",
-                "justify-content": "center",
-            },
-        )
-    ],
-    style={"height": "100%"},
-)
+def build_layout():
+    """
+    Creates the 2001 page
+    """
+    return html.Div(
+        [
+            Row(
+                [Col(create_list(titles)), Col(create_images(image_urls))],
+                style={
+                    "margin-top": "4vh",
+                    "display": "flex",
+                    "flex-direction": "row",
+                    "justify-content": "center",
+                },
+            )
+        ],
+        style={"height": "100%"},
+    )
 
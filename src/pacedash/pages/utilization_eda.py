@@ -1,12 +1,12 @@
-import sqlite3
 import dash_core_components as dcc
 import dash_html_components as html
 from dash.dependencies import Input, Output
 
 from ..app import app
 from ..components import Col, Row
-from ..helper_functions import db_filepath, update_dates
+from ..helper_functions import sql_fetchall, update_dates
 from ..settings import dropdown_style
+from ..figure_utils import slim_figure_output
 from ..layouts import (
     center_dropdown_col,
     select_date_col,
@@ -23,258 +23,262 @@ from ..utilization_eda_utils import (
     utilization_table_types,
 )
 
-layout = html.Div(
-    [
-        Row(
-            [
-                center_dropdown_col(),
-                select_date_col(),
-                Col(
-                    [
-                        dcc.Dropdown(
-                            id="utl-filter",
-                            value=None,
-                            searchable=True,
-                            style=dropdown_style,
-                        ),
-                        Row(
-                            [
-                                Col(
-                                    [
-                                        dcc.Dropdown(
-                                            id="data-source",
-                                            options=utilization_table_types,
-                                            value="acute",
-                                            searchable=False,
-                                            clearable=False,
-                                            style=dropdown_style,
-                                        )
-                                    ],
-                                    bp="md",
-                                    size=5,
-                                    style={
-                                        "padding-top": "0.5vh",
-                                        "display": "flex",
-                                        "flex-direction": "column",
-                                        "justify-content": "center",
-                                        "align-content": "center",
-                                    },
-                                ),
-                                Col(
-                                    [
-                                        dcc.RadioItems(
-                                            id="utl-filter-amnt",
-                                            options=[
-                                                {"label": "Top 5", "value": "5"},
-                                                {"label": "10", "value": "10"},
-                                                {"label": "All", "value": "all"},
-                                            ],
-                                            value="5",
-                                        )
-                                    ],
-                                    bp="md",
-                                    size=7,
-                                    style={
-                                        "padding-top": "0.5vh",
-                                        "display": "flex",
-                                        "flex-direction": "column",
-                                        "justify-content": "center",
-                                        "align-content": "center",
-                                    },
-                                ),
-                            ],
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "flex-start",
-                                "align-items": "center",
-                            },
-                        ),
-                    ],
-                    bp="md",
-                    size=3,
-                    style={
-                        "padding-top": "0.5vh",
-                        "display": "flex",
-                        "flex-direction": "column",
-                        "justify-content": "center",
-                    },
-                ),
-                Col(
-                    [
-                        dcc.Dropdown(
-                            id="filter-values", style=dropdown_style, value=None
-                        ),
-                        dcc.Dropdown(
-                            id="additional-filter", style=dropdown_style, value=None
-                        ),
-                    ],
-                    bp="md",
-                    size=2,
-                    style={
-                        "display": "flex",
-                        "flex-direction": "column",
-                        "justify-content": "center",
-                    },
-                ),
-                Col(
-                    [
-                        dcc.Dropdown(
-                            id="graph-one-stat",
-                            options=[
-                                {"label": "Admissions", "value": "admission_date"},
-                                {"label": "Discharges", "value": "discharge_date"},
-                                {"label": "ALOS", "value": "alos"},
-                                {"label": "30-Day Readmits", "value": "30-day"},
-                            ],
-                            value="admission_date",
-                            style=dropdown_style,
-                        ),
-                        dcc.Dropdown(
-                            id="graph-two-stat",
-                            options=[
-                                {"label": "Admissions", "value": "admission_date"},
-                                {"label": "Discharges", "value": "discharge_date"},
-                                {"label": "ALOS", "value": "alos"},
-                                {"label": "30-Day Readmits", "value": "30-day"},
-                            ],
-                            value="alos",
-                            style=dropdown_style,
-                        ),
-                    ],
-                    bp="md",
-                    size=2,
-                    style={
-                        "display": "flex",
-                        "flex-direction": "column",
-                        "justify-content": "center",
-                    },
-                ),
-                Col(
-                    [month_quarter_radio()],
-                    bp="md",
-                    size=2,
-                    mobile_size=6,
-                    style={
-                        "padding-top": "0.5vh",
-                        "display": "flex",
-                        "flex-direction": "row",
-                        "justify-content": "flex-end",
-                    },
-                ),
-            ],
-            className="options-row",
-        ),
-        equal_graph_row("utl-graph-one", "utl-graph-two"),
-        Row(
-            [
-                Col(
-                    [
-                        dcc.RadioItems(
-                            id="graph_type",
-                            options=[
-                                {"label": "Bar", "value": "bar"},
-                                {"label": "Line", "value": "line"},
-                            ],
-                            value="bar",
-                        )
-                    ],
-                    bp="md",
-                    size=6,
-                    mobile_size=12,
-                    style={
-                        "padding-top": "0.5vh",
-                        "display": "flex",
-                        "flex-direction": "row",
-                        "justify-content": "flex-start",
-                    },
-                ),
-                                Col(
-                    [
-                        Col(
-                            [
-                                dcc.Link(
-                                    html.H6("Demo. EDA", style={"font-size": "1vmax"}),
-                                    href="/demographics-eda",
-                                )
-                            ],
-                            size=2,
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "center",
-                            },
-                        ),
-                        Col(
-                            [
-                                dcc.Link(
-                                    html.H6("Enroll. EDA", style={"font-size": "1vmax"}),
-                                    href="/enrollment-eda",
-                                )
-                            ],
-                            size=2,
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "center",
-                            },
-                        ),
-                        Col(
-                            [
-                                dcc.Link(
-                                    html.H6("Incidents EDA", style={"font-size": "1vmax"}),
-                                    href="/incidents-eda"
-                                )
-                            ],
-                            size=2, 
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "center",
-                            },
-                        ),
-                        Col(
-                            [
-                                dcc.Link(
-                                    html.H6("Utl. EDA", style={"font-size": "1vmax"}),
-                                    href="/utilization-eda"                                    
-                                )
-                            ],
-                            size=2,
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "center",
-                            },
-                        ),
-                        Col(
-                            [
-                                dcc.Link(
-                                    html.H6("Town Table", style={"font-size": "1vmax"}),
-                                    href="/town_count",
-                                )
-                            ],
-                            size=2,
-                            style={
-                                "display": "flex",
-                                "flex-direction": "row",
-                                "justify-content": "center",
-                            },
-                        )
-                    ],
-                    size=6, mobile_size = 12,
-                    style={
-                        "display": "flex",
-                        "flex-direction": "row",
-                        "justify-content": "center",
-                        "align-items": "flex-end",
-                    },
-                )
-            ],
-            className="bottom-row",
-        ),
-    ]
-)
+def build_layout():
+    """
+    Creates the utilization EDA page
+    """
+    return html.Div(
+        [
+            Row(
+                [
+                    center_dropdown_col(),
+                    select_date_col(),
+                    Col(
+                        [
+                            dcc.Dropdown(
+                                id="utl-filter",
+                                value=None,
+                                searchable=True,
+                                style=dropdown_style,
+                            ),
+                            Row(
+                                [
+                                    Col(
+                                        [
+                                            dcc.Dropdown(
+                                                id="data-source",
+                                                options=utilization_table_types,
+                                                value="acute",
+                                                searchable=False,
+                                                clearable=False,
+                                                style=dropdown_style,
+                                            )
+                                        ],
+                                        bp="md",
+                                        size=5,
+                                        style={
+                                            "padding-top": "0.5vh",
+                                            "display": "flex",
+                                            "flex-direction": "column",
+                                            "justify-content": "center",
+                                            "align-content": "center",
+                                        },
+                                    ),
+                                    Col(
+                                        [
+                                            dcc.RadioItems(
+                                                id="utl-filter-amnt",
+                                                options=[
+                                                    {"label": "Top 5", "value": "5"},
+                                                    {"label": "10", "value": "10"},
+                                                    {"label": "All", "value": "all"},
+                                                ],
+                                                value="5",
+                                            )
+                                        ],
+                                        bp="md",
+                                        size=7,
+                                        style={
+                                            "padding-top": "0.5vh",
+                                            "display": "flex",
+                                            "flex-direction": "column",
+                                            "justify-content": "center",
+                                            "align-content": "center",
+                                        },
+                                    ),
+                                ],
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "flex-start",
+                                    "align-items": "center",
+                                },
+                            ),
+                        ],
+                        bp="md",
+                        size=3,
+                        style={
+                            "padding-top": "0.5vh",
+                            "display": "flex",
+                            "flex-direction": "column",
+                            "justify-content": "center",
+                        },
+                    ),
+                    Col(
+                        [
+                            dcc.Dropdown(
+                                id="filter-values", style=dropdown_style, value=None
+                            ),
+                            dcc.Dropdown(
+                                id="additional-filter", style=dropdown_style, value=None
+                            ),
+                        ],
+                        bp="md",
+                        size=2,
+                        style={
+                            "display": "flex",
+                            "flex-direction": "column",
+                            "justify-content": "center",
+                        },
+                    ),
+                    Col(
+                        [
+                            dcc.Dropdown(
+                                id="graph-one-stat",
+                                options=[
+                                    {"label": "Admissions", "value": "admission_date"},
+                                    {"label": "Discharges", "value": "discharge_date"},
+                                    {"label": "ALOS", "value": "alos"},
+                                    {"label": "30-Day Readmits", "value": "30-day"},
+                                ],
+                                value="admission_date",
+                                style=dropdown_style,
+                            ),
+                            dcc.Dropdown(
+                                id="graph-two-stat",
+                                options=[
+                                    {"label": "Admissions", "value": "admission_date"},
+                                    {"label": "Discharges", "value": "discharge_date"},
+                                    {"label": "ALOS", "value": "alos"},
+                                    {"label": "30-Day Readmits", "value": "30-day"},
+                                ],
+                                value="alos",
+                                style=dropdown_style,
+                            ),
+                        ],
+                        bp="md",
+                        size=2,
+                        style={
+                            "display": "flex",
+                            "flex-direction": "column",
+                            "justify-content": "center",
+                        },
+                    ),
+                    Col(
+                        [month_quarter_radio()],
+                        bp="md",
+                        size=2,
+                        mobile_size=6,
+                        style={
+                            "padding-top": "0.5vh",
+                            "display": "flex",
+                            "flex-direction": "row",
+                            "justify-content": "flex-end",
+                        },
+                    ),
+                ],
+                className="options-row",
+            ),
+            equal_graph_row("utl-graph-one", "utl-graph-two"),
+            Row(
+                [
+                    Col(
+                        [
+                            dcc.RadioItems(
+                                id="graph_type",
+                                options=[
+                                    {"label": "Bar", "value": "bar"},
+                                    {"label": "Line", "value": "line"},
+                                ],
+                                value="bar",
+                            )
+                        ],
+                        bp="md",
+                        size=6,
+                        mobile_size=12,
+                        style={
+                            "padding-top": "0.5vh",
+                            "display": "flex",
+                            "flex-direction": "row",
+                            "justify-content": "flex-start",
+                        },
+                    ),
+                                    Col(
+                        [
+                            Col(
+                                [
+                                    dcc.Link(
+                                        html.H6("Demo. EDA", style={"font-size": "1vmax"}),
+                                        href="/demographics-eda",
+                                    )
+                                ],
+                                size=2,
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "center",
+                                },
+                            ),
+                            Col(
+                                [
+                                    dcc.Link(
+                                        html.H6("Enroll. EDA", style={"font-size": "1vmax"}),
+                                        href="/enrollment-eda",
+                                    )
+                                ],
+                                size=2,
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "center",
+                                },
+                            ),
+                            Col(
+                                [
+                                    dcc.Link(
+                                        html.H6("Incidents EDA", style={"font-size": "1vmax"}),
+                                        href="/incidents-eda"
+                                    )
+                                ],
+                                size=2, 
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "center",
+                                },
+                            ),
+                            Col(
+                                [
+                                    dcc.Link(
+                                        html.H6("Utl. EDA", style={"font-size": "1vmax"}),
+                                        href="/utilization-eda"                                    
+                                    )
+                                ],
+                                size=2,
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "center",
+                                },
+                            ),
+                            Col(
+                                [
+                                    dcc.Link(
+                                        html.H6("Town Table", style={"font-size": "1vmax"}),
+                                        href="/town_count",
+                                    )
+                                ],
+                                size=2,
+                                style={
+                                    "display": "flex",
+                                    "flex-direction": "row",
+                                    "justify-content": "center",
+                                },
+                            )
+                        ],
+                        size=6, mobile_size = 12,
+                        style={
+                            "display": "flex",
+                            "flex-direction": "row",
+                            "justify-content": "center",
+                            "align-items": "flex-end",
+                        },
+                    )
+                ],
+                className="bottom-row",
+            ),
+        ]
+    )
 
 
 @app.callback(Output("utl-filter", "options"), [Input("data-source", "value")])
@@ -314,12 +318,9 @@ def update_filter_options(selected_filter, data_source):
                 SELECT {selected_filter} FROM inpatient
                 WHERE inpatient.er = 1)"""
 
-        conn = sqlite3.connect(db_filepath)
-        c = conn.cursor()
         q = f"""SELECT DISTINCT({selected_filter})
         FROM {data_source}"""
-        results = c.execute(q).fetchall()
-        conn.close()
+        results = sql_fetchall(q)
 
         if len(results) <= 3:
             results = [val for val in results if val[0] != None]
@@ -384,6 +385,7 @@ def update_additional_value(arg):
         Input("additional-filter", "value"),
     ],
 )
+@slim_figure_output
 def utl_graph_one(
     start_date,
     end_date,
@@ -467,6 +469,7 @@ def utl_graph_one(
         Input("additional-filter", "value"),
     ],
 )
+@slim_figure_output
 def utl_graph_two(
     start_date,
     end_date,
@@ -0,0 +1,308 @@
+import re
+import sqlite3
+import threading
+import time
+from collections import deque
+from .settings import (
+    profile_queries,
+    slow_query_seconds,
+    query_timings_kept,
+)
+
+# Query profiler
+# Most dashboard queries are f-string templates, so the same query shape
+# arrives with different dates, centers and IN lists. Each statement is
+# reduced to a fingerprint with literals replaced by ? and IN lists
+# collapsed, and the fingerprint's count, total and p95 time and rows
+# returned are recorded. The first time a fingerprint runs longer than
+# slow_query_seconds its EXPLAIN QUERY PLAN is captured, so a slow template
+# can be checked for full table scans.
+# Profiling is done by the connection and cursor classes below, the pools
+# use them when profile_queries is set. paceutils opens its own connections,
+# with profile_external_queries app.py patches sqlite3.connect so those are
+# profiled too.
+
+_comment = re.compile(r"--[^\n]*|/\*.*?\*/", re.S)
+_string = re.compile(r"'(?:[^']|'')*'")
+_number = re.compile(r"(?<![\w.])\d+(?:\.\d+)?(?![\w.])")
+_in_list = re.compile(r"\bin\s*\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_space = re.compile(r"\s+")
+
+
+def fingerprint(statement):
+    """
+    Normalizes a SQL statement so every call of a template has the same text
+
+    Args:
+        statement(str): SQL statement
+
+    Returns:
+        str: lower case statement with literals replaced by ? and
+            IN lists replaced by (...)
+    """
+    statement = _comment.sub(" ", statement)
+    statement = _string.sub("?", statement)
+    statement = _number.sub("?", statement)
+    statement = _space.sub(" ", statement).strip().lower()
+    statement = _in_list.sub("in (...)", statement)
+    return statement.rstrip(";").strip()
+
+
+def plan_has_full_scan(plan):
+    """
+    Checks if a query plan reads any table with a full scan
+
+    Args:
+        plan(list): detail column of EXPLAIN QUERY PLAN rows
+
+    Returns:
+        bool: True if a table is scanned without an index, a covering
+            index scan reads the index instead of the table and scans
+            of CTEs and subqueries read rows already produced
+    """
+    plan = [line.split() for line in plan]
+    subqueries = {
+        words[1] for words in plan if len(words) > 1 and words[0] in ("CO-ROUTINE", "MATERIALIZE")
+    }
+    for words in plan:
+        if len(words) < 2 or words[0] != "SCAN" or "INDEX" in words:
+            continue
+        # older SQLite versions write SCAN TABLE name and SCAN SUBQUERY n
+        name = words[2] if words[1] == "TABLE" and len(words) > 2 else words[1]
+        if words[1] not in ("SUBQUERY", "CONSTANT") and name not in subqueries:
+            return True
+    return False
+
+
+class QueryStats:
+    """
+    Timings and rows of one query fingerprint
+    """
+
+    def __init__(self, statement):
+        self.example = statement
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.rows = 0
+        self.recent = deque(maxlen=query_timings_kept)
+        self.plan = None
+
+    def p95(self):
+        if not self.recent:
+            return 0.0
+        recent = sorted(self.recent)
+        return recent[min(int(len(recent) * 0.95), len(recent) - 1)]
+
+
+query_stats = {}
+_stats_lock = threading.Lock()
+
+
+def explain(conn, statement, params):
+    """
+    Returns the query plan of a statement
+
+    Args:
+        conn: sqlite3 connection the statement ran on
+        statement(str): SQL statement
+        params: parameters of the statement
+
+    Returns:
+        list: detail column of the plan rows, or the error if the
+            plan could not be read
+    """
+    cursor = sqlite3.Cursor(conn)
+    try:
+        return [row[-1] for row in cursor.execute(f"EXPLAIN QUERY PLAN {statement}", params)]
+    except sqlite3.Error as e:
+        return [f"EXPLAIN failed: {e}"]
+    finally:
+        cursor.close()
+
+
+def record_query(conn, statement, params, seconds, rows):
+    """
+    Adds one run of a statement to the stats of its fingerprint
+
+    Args:
+        conn: sqlite3 connection the statement ran on, None if the
+            plan should not be captured
+        statement(str): SQL statement
+        params: parameters of the statement
+        seconds(float): time spent executing and fetching
+        rows(int): rows fetched
+    """
+    key = fingerprint(statement)
+    with _stats_lock:
+        stats = query_stats.get(key)
+        if stats is None:
+            stats = query_stats[key] = QueryStats(statement)
+        stats.count += 1
+        stats.total += seconds
+        stats.max = max(stats.max, seconds)
+        stats.rows += rows
+        stats.recent.append(seconds)
+        capture_plan = (
+            stats.plan is None
+            and seconds >= slow_query_seconds
+            and conn is not None
+            and not key.startswith(("pragma", "explain"))
+        )
+        if capture_plan:
+            stats.plan = []
+
+    if capture_plan:
+        plan = explain(conn, statement, params)
+        with _stats_lock:
+            stats.plan = plan
+
+
+class ProfilingCursor(sqlite3.Cursor):
+    """
+    Cursor that times each statement from execute until its rows are
+    fetched or the cursor is closed
+    """
+
+    _statement = None
+
+    def _finish(self):
+        if self._statement is not None:
+            statement, self._statement = self._statement, None
+            record_query(self.connection, statement, self._params, self._seconds, self._rows)
+
+    def _timed(self, method, *args):
+        start = time.perf_counter()
+        try:
+            return method(*args)
+        finally:
+            self._seconds += time.perf_counter() - start
+
+    def execute(self, sql, parameters=()):
+        self._finish()
+        self._statement, self._params, self._seconds, self._rows = sql, parameters, 0.0, 0
+        try:
+            self._timed(super().execute, sql, parameters)
+        except Exception:
+            self._statement = None
+            raise
+        return self
+
+    def fetchone(self):
+        row = self._timed(super().fetchone)
+        if row is None:
+            self._finish()
+        else:
+            self._rows += 1
+        return row
+
+    def fetchmany(self, size=None):
+        size = self.arraysize if size is None else size
+        rows = self._timed(super().fetchmany, size)
+        self._rows += len(rows)
+        if len(rows) < size:
+            self._finish()
+        return rows
+
+    def fetchall(self):
+        rows = self._timed(super().fetchall)
+        self._rows += len(rows)
+        self._finish()
+        return rows
+
+    def __next__(self):
+        row = self.fetchone()
+        if row is None:
+            raise StopIteration
+        return row
+
+    def close(self):
+        self._finish()
+        super().close()
+
+    def __del__(self):
+        # a cursor dropped before its rows were all fetched, the plan is
+        # not captured since the connection may be in use elsewhere
+        if self._statement is not None:
+            statement, self._statement = self._statement, None
+            record_query(None, statement, self._params, self._seconds, self._rows)
+
+
+class ProfilingConnection(sqlite3.Connection):
+    """
+    Connection whose cursors, including the ones conn.execute
+    creates, are profiled
+    """
+
+    def cursor(self, factory=ProfilingCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+
+def connection_factory():
+    """
+    Returns the connection class the pools open
+
+    Returns:
+        class: ProfilingConnection if profile_queries is set,
+            otherwise sqlite3.Connection
+    """
+    return ProfilingConnection if profile_queries else sqlite3.Connection
+
+
+_connect = sqlite3.connect
+
+
+def _profiled_connect(*args, **kwargs):
+    kwargs.setdefault("factory", ProfilingConnection)
+    return _connect(*args, **kwargs)
+
+
+def profile_external_connections():
+    """
+    Replaces sqlite3.connect so connections opened outside the pools,
+    i.e. by paceutils, are profiled as well
+    """
+    sqlite3.connect = _profiled_connect
+
+
+def query_report(limit=25):
+    """
+    Returns the recorded fingerprints, most total time first
+
+    Args:
+        limit(int): number of fingerprints to return
+
+    Returns:
+        list: dicts with the fingerprint, an example statement, count,
+            total, mean, p95 and max seconds, rows, and the query plan
+            if the fingerprint was slow
+    """
+    with _stats_lock:
+        stats = sorted(query_stats.items(), key=lambda item: item[1].total, reverse=True)
+        report = [
+            {
+                "fingerprint": key,
+                "example": query.example,
+                "count": query.count,
+                "total_seconds": round(query.total, 4),
+                "mean_seconds": round(query.total / query.count, 4),
+                "p95_seconds": round(query.p95(), 4),
+                "max_seconds": round(query.max, 4),
+                "rows": query.rows,
+                "plan": query.plan,
+                "full_scan": plan_has_full_scan(query.plan or []),
+            }
+            for key, query in stats[:limit]
+        ]
+    return report
+
+
+def reset_query_stats():
+    """
+    Clears every recorded fingerprint
+    """
+    with _stats_lock:
+        query_stats.clear()
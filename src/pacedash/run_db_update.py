@@ -1,6 +1,62 @@
+import os
 import shutil
 import glob
+import time
 import distutils.dir_util
+from .db_utils import db_pool, agg_pool, load_snapshots
+from .cache_utils import clear_caches
+from .warmup_utils import warm_caches
+from .cube_utils import build_utilization_cube
+from .index_utils import ensure_indexes, explain_report, print_report
+
+
+def replace_file(src, dest, retries=5, prepare=None):
+    """
+    Copies src next to dest and then renames it over dest, so readers
+    see either the old file or the new one and never a partial copy.
+
+    Windows refuses to rename over a file that is open, so pooled
+    connections are closed and the rename is retried.
+
+    Args:
+        src(str): path of the file to copy
+        dest(str): path of the file to replace
+        retries(int): number of times to retry the rename
+        prepare(func): called with the path of the copy before it
+            replaces dest, i.e. to build derived tables
+    """
+    tmp_path = f"{dest}.tmp"
+    shutil.copy2(src, tmp_path)
+    if prepare is not None:
+        prepare(tmp_path)
+    for attempt in range(retries):
+        try:
+            os.replace(tmp_path, dest)
+            return
+        except PermissionError:
+            if attempt == retries - 1:
+                raise
+            db_pool.reset()
+            agg_pool.reset()
+            time.sleep(1)
+
+
+def prepare_dashboard_db(filepath):
+    """
+    Builds the tables and indexes the dashboard adds to a new copy
+    of PaceDashboard.db
+
+    Args:
+        filepath(str): path to the copy of the database
+    """
+    build_utilization_cube(filepath)
+    created = ensure_indexes(filepath)
+    print(f"Created {len(created)} indexes")
+
+    # list any query template that still reads a whole table
+    full_scans = [row for row in explain_report(filepath) if row["full_scan"]]
+    print(f"{len(full_scans)} query templates use a full table scan")
+    print_report(full_scans)
 
 
 def update_db():
@@ -9,11 +65,18 @@ def update_db():
 
     Needs to be generalized
     """
-    shutil.copy2(
+    replace_file(
         "V:/Databases/PaceDashboard.db",
         "E:/pace_dash/src/pacedash/data/PaceDashboard.db",
+        prepare=prepare_dashboard_db,
     )
-    shutil.copy2("V:/Databases/agg.db", "E:/pace_dash/src/pacedash/data/agg.db")
+    replace_file("V:/Databases/agg.db", "E:/pace_dash/src/pacedash/data/agg.db")
+
+    # reload in-memory snapshots or reopen pooled connections
+    # so queries read the new files
+    load_snapshots()
+    clear_caches()
+    warm_caches()
 
     print("Updated DB")
 
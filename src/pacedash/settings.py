@@ -40,13 +40,110 @@ NAV_ITEMS = (
 ###only need to be set here
 ###only need to be changed if you use a different name
 ###for your databases
+###PACEDASH_DB and PACEDASH_AGG_DB override the database paths,
+###i.e. to run against benchmarks/synthetic_db.py output
 path_prefix = Path().absolute()
-db_filepath = "src/pacedash/data/PaceDashboard.db"
+db_filepath = os.environ.get("PACEDASH_DB", "src/pacedash/data/PaceDashboard.db")
 # user_db = f"{path_prefix}/src/pacedash/data/users.db"
 user_db = "V:/Databases/users.db"
 # log_path = "src/pacedash/data/log.txt"
 log_path = "V:/Databases/log.txt"
-agg_filepath = "src/pacedash/data/agg.db"
+agg_filepath = os.environ.get("PACEDASH_AGG_DB", "src/pacedash/data/agg.db")
+
+###read-only connection pools for the dashboard databases
+###size should be close to the number of callbacks that
+###run at the same time, see db_utils.pool_stats
+db_pool_size = 16
+# seconds a request waits for a free connection
+db_pool_timeout = 30
+# bytes of the database file to memory map
+db_mmap_size = 256 * 1024 * 1024
+# negative values are KiB of page cache per connection
+db_cache_size = -32000
+# if True both databases are copied into memory at startup and
+# after each refresh, only queries run through db_pool and agg_pool
+# (sql_return_df, sql_fetchall, the team table) read the copies, the
+# paceutils objects in helper_functions open the database files themselves
+db_in_memory = False
+
+###profile every query the pools run, see profiler_utils.query_report
+###and /metrics/queries, adds a little time to each fetch
+profile_queries = False
+# also profile the connections paceutils opens itself
+profile_external_queries = False
+# seconds after which a query's EXPLAIN QUERY PLAN is captured
+slow_query_seconds = 0.25
+# most recent timings kept per query for the p95
+query_timings_kept = 1000
+
+# number of card values kept in memory, cleared when the data files change
+card_cache_size = 512
+# number of agg tables kept in the sparkline store, one per table
+# and sparkline period
+sparkline_table_cache_size = 64
+# number of agg dataframes kept for the default graph page
+graph_cache_size = 256
+
+# utilization EDA rows shared by the two graphs, kept for a short time
+# since every dropdown change asks for new rows
+utl_frame_cache_size = 16
+utl_frame_cache_ttl = 60
+
+# answer the utilization EDA from the utilization_cube table built
+# when the database is refreshed, raw visit tables are used if False
+# or if the database does not have the cube yet
+use_utilization_cube = True
+
+# create missing date range and member_id indexes in PaceDashboard.db
+# at startup, the database file must be writable
+db_ensure_indexes = True
+
+###team comparison table indicators come from a few grouped queries
+###that run in parallel on a shared pool of threads
+team_indicator_workers = 6
+# seconds a query can run before the table shows its columns as N/A
+team_indicator_timeout = 30
+# number of time periods the team comparison table is kept for,
+# cleared when the data files change
+team_table_cache_size = 32
+
+###fill the card and team table caches for every page and time range
+###in the background after a refresh, and at startup if set
+warm_caches_on_start = True
+# threads used by warmup, each holds a database connection while it runs
+warmup_workers = 4
+
+# rows written to each chunk of a streamed csv download
+csv_chunk_rows = 1000
+
+###gzip responses larger than compress_min_size bytes for browsers
+###that accept it, replaces dash's own flask-compress which is used
+###when this is off
+compress_responses = True
+compress_min_size = 500
+compress_level = 6
+compress_content_types = [
+    "application/json",
+    "application/javascript",
+    "text/javascript",
+    "text/css",
+    "text/html",
+    "text/plain",
+    "image/svg+xml",
+]
+# number of compressed bodies kept for responses that repeat,
+# i.e. static assets and the layout
+compress_cache_size = 256
+# print the size, ratio and CPU time of each compressed response
+log_compression = False
+
+###time every callback and serve the histograms on /metrics in the
+###prometheus text format, /metrics/slowest ranks recent callbacks
+metrics_enabled = True
+# number of recent calls kept for the slowest callbacks view
+metrics_recent_calls = 5000
+# only answer /metrics requests made from the server itself
+metrics_local_only = True
 
 # forgot password email
 forgot_pw_email = "asmith@pace-ri.org"
@@ -80,6 +177,19 @@ color_palette = [
     "#fff",
 ]
 
+# build graph traces and layouts with plotly.graph_objs so every
+# property is validated, slower, only needed while debugging a figure
+validate_figures = False
+
+###chart callbacks slim their figures before sending them
+# decimal places values are rounded to
+figure_decimals = 3
+# line traces with more points are decimated to this many
+figure_max_points = 500
+# print and keep the serialized figure size before and after slimming,
+# adds two JSON encodings to every chart callback
+report_figure_sizes = False
+
 # configuration for plotly graphs
 graph_config = {
     "modeBarButtonsToRemove": [
@@ -0,0 +1,145 @@
+import numpy as np
+import pandas as pd
+from .cache_utils import DataCache
+from .db_utils import agg_pool
+from .figure_utils import figure_trace, figure_layout
+from .settings import sparkline_table_cache_size
+
+# Sparkline store
+# Every card's sparkline is the last year of one column of an agg table and
+# only changes when agg.db is refreshed. Each agg table is read once for
+# the sparkline period with a single query, its numeric columns are kept as
+# float32 arrays next to one array of month dates, and a card's figure is
+# built from those arrays the first time it is asked for. The store is a
+# DataCache so it is dropped and rebuilt when the data files change.
+
+sparkline_tables = DataCache(maxsize=sparkline_table_cache_size)
+
+
+class SparklineTable:
+    """
+    Months and numeric columns of an agg table for one sparkline period
+
+    Args:
+        df: pandas dataframe with a month column and the table's columns
+    """
+
+    def __init__(self, df):
+        self.months = np.datetime_as_string(
+            pd.to_datetime(df["month"]).values.astype("datetime64[D]"), unit="D"
+        ).tolist()
+        self.series = {}
+        for col in df.columns:
+            if col == "month":
+                continue
+            values = pd.to_numeric(df[col], errors="coerce")
+            if values.notnull().any() or df[col].isnull().all():
+                self.series[col] = values.values.astype(np.float32)
+        self.figures = {}
+
+    def figure(self, col):
+        """
+        Returns the sparkline figure of a column, building it
+        the first time it is asked for
+
+        Args:
+            col(str): column of the agg table
+
+        Returns:
+            dict: dictionary to pass to ploty graph figure, None if the
+                table does not have a numeric column named col
+        """
+        if col not in self.figures:
+            values = self.series.get(col)
+            if values is None:
+                return None
+            # float32 is only for storage, rounding drops the noise the
+            # conversion back to float adds
+            values = [
+                None if np.isnan(value) else round(float(value), 4) for value in values
+            ]
+            self.figures[col] = sparkline_figure(self.months, values)
+        return self.figures[col]
+
+
+def sparkline_figure(x, y):
+    """
+    Creates the figure of a sparkline
+
+    Args:
+        x(list): x-axis values
+        y(list): y-axis values
+
+    Returns:
+        dict: dictionary to pass to ploty graph figure
+    """
+    return {
+        "data": [
+            figure_trace(
+                "scatter",
+                x=x,
+                y=y,
+                mode="lines",
+                text=y,
+                line={"width": 3, "color": "#262626"},
+                hoverinfo="none",
+            )
+        ],
+        "layout": figure_layout(
+            margin={"pad": 0, "l": 10, "r": 10, "t": 10, "b": 10},
+            xaxis={
+                "showgrid": False,
+                "showline": False,
+                "zeroline": False,
+                "showticklabels": False,
+            },
+            yaxis={"showgrid": False, "zeroline": False, "showticklabels": False},
+            showlegend=False,
+            autosize=True,
+            paper_bgcolor="rgba(0,0,0,0)",
+            plot_bgcolor="rgba(0,0,0,0)",
+        ),
+    }
+
+
+def load_sparkline_table(agg_table, params):
+    """
+    Reads one agg table for the sparkline period
+
+    Args:
+        agg_table(str): table in the agg database
+        params(tuple): start date and end date of the sparkline
+
+    Returns:
+        SparklineTable: months and numeric columns of the table, empty
+            if the table does not have a month column
+    """
+    with agg_pool.connection() as conn:
+        cols = [row[1] for row in conn.execute(f"PRAGMA table_info({agg_table})")]
+        if "month" not in cols:
+            return SparklineTable(pd.DataFrame(columns=["month"]))
+        df = pd.read_sql(
+            f"SELECT * FROM {agg_table} WHERE month BETWEEN ? AND ? ORDER BY month",
+            conn,
+            params=list(params),
+        )
+    return SparklineTable(df)
+
+
+def stored_sparkline(agg_table, agg_col, params):
+    """
+    Returns the sparkline of a card from the store
+
+    Args:
+        agg_table(str): table in the agg database
+        agg_col(str): column in the table
+        params(tuple): start date and end date of the sparkline
+
+    Returns:
+        dict: dictionary to pass to ploty graph figure, None if the
+            column is not in the store
+    """
+    table = sparkline_tables.get_or_compute(
+        (agg_table, tuple(params)), load_sparkline_table, agg_table, params
+    )
+    return table.figure(agg_col)
@@ -1,44 +1,475 @@
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 import dash_table
-from .helper_functions import team
-from .settings import color_palette
+import pandas as pd
+from .helper_functions import sql_return_df
+from .cache_utils import DataCache
+from .settings import (
+    color_palette,
+    team_indicator_workers,
+    team_indicator_timeout,
+    team_table_cache_size,
+)
 
-###hold all team function used to create team comparison table
+###team comparison table
+# Every indicator is computed for every team by a few grouped queries
+# instead of one paceutils.Team query per indicator. Each query starts from
+# the participants enrolled on a team during the period (team_ppts_sql) and
+# adds a set of columns, so a new team or indicator does not add a query.
+
+# participants on each team at any point during the period, one row per
+# participant and team even if they have more than one enrollment span in
+# the period. disenrollment_date is NULL if any of those spans is open and
+# death_date is the disenrollment date of a span that ended in death
+team_ppts_sql = """
+    SELECT t.team, e.member_id,
+    MIN(e.enrollment_date) AS enrollment_date,
+    CASE WHEN COUNT(*) > COUNT(e.disenrollment_date) THEN NULL
+    ELSE MAX(e.disenrollment_date) END AS disenrollment_date,
+    MAX(CASE WHEN e.disenroll_type = 'Deceased' THEN e.disenrollment_date END) AS death_date
+    FROM teams t
+    JOIN enrollment e ON t.member_id = e.member_id
+    WHERE e.enrollment_date <= :end_date
+    AND (e.disenrollment_date >= :start_date OR e.disenrollment_date IS NULL)
+    GROUP BY t.team, e.member_id
+"""
+
+# member months of each team, the census on the first of each month that
+# starts in the period like enrollment_eda_utils.member_months
+team_member_months_sql = """
+    WITH RECURSIVE months(month) AS (
+        SELECT date(:start_date, '-1 day', 'start of month', '+1 month')
+        UNION ALL
+        SELECT date(month, '+1 month') FROM months
+        WHERE date(month, '+1 month') <= :end_date
+    )
+    SELECT t.team, COUNT(*) AS member_months
+    FROM months
+    JOIN enrollment e ON e.enrollment_date <= months.month
+    AND (e.disenrollment_date >= months.month OR e.disenrollment_date IS NULL)
+    JOIN teams t ON t.member_id = e.member_id
+    WHERE months.month <= :end_date
+    GROUP BY t.team
+"""
+
+# participant counts and demographics, the rows of the table
+info_columns = {
+    "participants": "COUNT(DISTINCT ppts.member_id)",
+    "age": "ROUND(AVG((julianday(:end_date) - julianday(d.dob)) / 365.25), 2)",
+    "percent non english": "ROUND(100.0 * SUM(d.language <> 'English') / COUNT(*), 2)",
+    "avg_years_enrolled": """ROUND(AVG((julianday(MIN(COALESCE(ppts.disenrollment_date, :end_date), :end_date))
+        - julianday(ppts.enrollment_date)) / 365.25), 2)""",
+    "mortality rate": """ROUND(100.0 * SUM(ppts.death_date BETWEEN :start_date AND :end_date)
+        / COUNT(*), 2)""",
+}
+info_from_sql = "FROM ppts LEFT JOIN demographics d ON ppts.member_id = d.member_id"
+
+# stays that overlap the period, acute stays go back to the start of
+# enrollment for the no admissions since enrollment column
+visits_sql = """
+    SELECT 'acute' AS utl_type, member_id, admission_date, discharge_date,
+    los, days_since_last_admission FROM acute
+    WHERE admission_date <= :end_date
+    UNION ALL
+    SELECT 'psych', member_id, admission_date, discharge_date, NULL, NULL FROM psych
+    WHERE admission_date BETWEEN :start_date AND :end_date
+    UNION ALL
+    SELECT 'er_only', member_id, admission_date, discharge_date, NULL, NULL FROM er_only
+    WHERE admission_date BETWEEN :start_date AND :end_date
+"""
+for stay_table in ["custodial", "respite", "skilled"]:
+    visits_sql += f"""    UNION ALL
+    SELECT '{stay_table}', member_id, admission_date, discharge_date, NULL, NULL FROM {stay_table}
+    WHERE admission_date <= :end_date
+    AND (discharge_date >= :start_date OR discharge_date IS NULL)
+"""
+
+admitted = "v.admission_date BETWEEN :start_date AND :end_date"
+acute_discharged = "v.utl_type = 'acute' AND v.discharge_date BETWEEN :start_date AND :end_date"
+died_within_30 = """julianday(ppts.death_date) - julianday(v.discharge_date) BETWEEN 0 AND 30"""
+# days of a stay that fall in the period
+days_in_period = """CAST(julianday(MIN(COALESCE(v.discharge_date, :end_date), :end_date))
+    - julianday(MAX(v.admission_date, :start_date)) + 1 AS INTEGER)"""
+
+utilization_columns = {
+    "acute admissions": f"SUM(v.utl_type = 'acute' AND {admitted})",
+    "er_only": "SUM(v.utl_type = 'er_only')",
+    "psych admissions": "SUM(v.utl_type = 'psych')",
+    "custodial days": f"SUM(CASE WHEN v.utl_type = 'custodial' THEN {days_in_period} END)",
+    "respite days": f"SUM(CASE WHEN v.utl_type = 'respite' THEN {days_in_period} END)",
+    "skilled days": f"SUM(CASE WHEN v.utl_type = 'skilled' THEN {days_in_period} END)",
+    "acute discharges": f"SUM({acute_discharged})",
+    "acute alos": f"ROUND(AVG(CASE WHEN {acute_discharged} THEN v.los END), 2)",
+    "acute 30 day readmits": f"""SUM(v.utl_type = 'acute' AND {admitted}
+        AND v.days_since_last_admission <= 30)""",
+    "ppts in custodial": "COUNT(DISTINCT CASE WHEN v.utl_type = 'custodial' THEN v.member_id END)",
+    "% of discharges with death within 30 days": f"""ROUND(100.0 * SUM({acute_discharged}
+        AND {died_within_30}) / SUM({acute_discharged}), 2)""",
+    "death within 30 days of discharge date": f"SUM({acute_discharged} AND {died_within_30})",
+    "percent with no admissions since enrollment": """ROUND(100.0 - 100.0 * COUNT(DISTINCT
+        CASE WHEN v.utl_type = 'acute' AND v.admission_date >= ppts.enrollment_date
+        THEN ppts.member_id END) / COUNT(DISTINCT ppts.member_id), 2)""",
+}
+utilization_from_sql = f"""FROM ppts
+    LEFT JOIN ({visits_sql}) v ON ppts.member_id = v.member_id"""
+
+team_incident_types = ["falls", "med_errors", "infections"]
+
+# incidents in the period, wounds are only used for the pressure ulcer rate
+incidents_sql = "\n    UNION ALL\n".join(
+    f"""    SELECT '{incident}' AS incident, member_id, NULL AS pressure_ulcer FROM {incident}
+    WHERE date_time_occurred >= :start_date AND date_time_occurred < date(:end_date, '+1 day')"""
+    for incident in team_incident_types
+) + """
+    UNION ALL
+    SELECT 'wounds', member_id, pressure_ulcer FROM wounds
+    WHERE date_time_occurred >= :start_date AND date_time_occurred < date(:end_date, '+1 day')
+"""
+
+# rates are per 100 member months, the same as the team_incidents
+# *_per_100MM agg columns the teams page links them to
+incident_columns = {
+    "wound rate": """ROUND(100.0 * SUM(i.incident = 'wounds' AND i.pressure_ulcer = 1)
+        / MAX(mm.member_months), 2)"""
+}
+for incident in team_incident_types:
+    incident_columns[incident] = f"SUM(i.incident = '{incident}')"
+    incident_columns[f"{incident} per 100 ppts"] = f"""ROUND(100.0 * SUM(i.incident = '{incident}')
+        / MAX(mm.member_months), 2)"""
+    incident_columns[f"individuals w/ {incident}"] = f"""COUNT(DISTINCT
+        CASE WHEN i.incident = '{incident}' THEN i.member_id END)"""
+incidents_from_sql = f"""FROM ppts
+    LEFT JOIN ({incidents_sql}) i ON ppts.member_id = i.member_id
+    LEFT JOIN ({team_member_months_sql}) mm ON ppts.team = mm.team"""
+
+# columns of the comparison table in the order they are shown
+team_columns = [
+    "participants",
+    "acute admissions",
+    "er_only",
+    "psych admissions",
+    "custodial days",
+    "respite days",
+    "skilled days",
+    "acute discharges",
+    "acute alos",
+    "acute 30 day readmits",
+    "age",
+    "percent non english",
+    "avg_years_enrolled",
+    "ppts in custodial",
+    "mortality rate",
+    "% of discharges with death within 30 days",
+    "death within 30 days of discharge date",
+    "percent with no admissions since enrollment",
+    "wound rate",
+]
+for incident in team_incident_types:
+    team_columns += [incident, f"{incident} per 100 ppts", f"individuals w/ {incident}"]
+
+
+def team_query(from_sql, columns):
+    """
+    Creates one grouped team query, its parameters are the
+    start_date and end_date of the period
+
+    Args:
+        from_sql(str): FROM clause joining the ppts of team_ppts_sql
+            to the rows the columns are computed from
+        columns(dict): column name to its aggregate SQL expression
+
+    Returns:
+        str: SQL statement
+    """
+    selected = ",\n    ".join(f'{expr} AS "{name}"' for name, expr in columns.items())
+    return f"""
+    WITH ppts AS ({team_ppts_sql})
+    SELECT ppts.team,
+    {selected}
+    {from_sql}
+    GROUP BY ppts.team;
+    """
+
+
+def team_grouped_df(params, from_sql, columns):
+    """
+    Runs one grouped team query
+
+    Args:
+        params (tuple): start date and end date in format 'YYYY-MM-DD'
+        from_sql(str): FROM clause joining the ppts of team_ppts_sql
+            to the rows the columns are computed from
+        columns(dict): column name to its aggregate SQL expression
+
+    Returns:
+        DataFrame: team column followed by the columns, one row per team
+    """
+    query = team_query(from_sql, columns)
+    return sql_return_df(query, {"start_date": params[0], "end_date": params[1]}, None)
+
+
+def team_info(params):
+    """
+    Participants, age, language, years enrolled and mortality of each team
+    """
+    return team_grouped_df(params, info_from_sql, info_columns)
+
+
+def team_utilization(params):
+    """
+    Admissions, days, discharges, readmits and deaths after discharge
+    of each team
+    """
+    return team_grouped_df(params, utilization_from_sql, utilization_columns)
+
+
+def team_incidents(params):
+    """
+    Incident totals, rates and participants with incidents of each team
+    """
+    return team_grouped_df(params, incidents_from_sql, incident_columns)
+
+
+###grouped queries joined onto team_info, run in parallel
 all_team_funcs = [
-    (team.admissions_by_team, ["acute"]),
-    (team.er_only_visits_by_team, None),
-    (team.admissions_by_team, ["psych"]),
-    (team.days_by_team, ["custodial"]),
-    (team.days_by_team, ["respite"]),
-    (team.days_by_team, ["skilled"]),
-    (team.discharges_by_team, ["acute"]),
-    (team.alos_for_discharges_by_team, ["acute"]),
-    (team.readmits_by_team, ["acute", 30]),
-    (team.avg_age_by_team, None),
-    (team.percent_primary_non_english_by_team, None),
-    (team.avg_years_enrolled_by_team, None),
-    (team.ppts_in_custodial_by_team, None),
-    (team.mortality_by_team, None),
-    (team.percent_of_discharges_with_mortality_in_30_by_team, None),
-    (team.mortality_within_30days_of_discharge_rate_by_team, None),
-    (team.no_hosp_admission_since_enrollment_by_team, None),
-    (team.pressure_ulcer_rate_by_team, None),
-    (team.total_incidents_by_team, ["falls"]),
-    (team.incidents_per_member_by_team, ["falls"]),
-    (team.ppts_w_incident_by_team, ["falls"]),
-    (team.total_incidents_by_team, ["med_errors"]),
-    (team.incidents_per_member_by_team, ["med_errors"]),
-    (team.ppts_w_incident_by_team, ["med_errors"]),
-    (team.total_incidents_by_team, ["infections"]),
-    (team.incidents_per_member_by_team, ["infections"]),
-    (team.ppts_w_incident_by_team, ["infections"]),
+    (team_utilization, None),
+    (team_incidents, None),
 ]
 
+# columns each grouped query adds, shown as N/A if the query fails
+query_columns = {
+    team_utilization: list(utilization_columns),
+    team_incidents: list(incident_columns),
+}
+
+
+# indicators run on a shared pool so concurrent requests for the teams
+# page cannot open more than team_indicator_workers queries between them
+indicator_pool = ThreadPoolExecutor(
+    max_workers=team_indicator_workers, thread_name_prefix="team-indicator"
+)
+
+# formatted comparison table for each time period, shared by the
+# table and the download link which both ask for it on every change
+comparison_cache = DataCache(maxsize=team_table_cache_size)
+
+# seconds and status of the most recent run of each indicator
+indicator_timings = {}
+_timings_lock = threading.Lock()
+
+
+def indicator_name(func, args):
+    """
+    Creates a readable name for a team indicator, used for timings
+    and as the row label when the indicator fails and its columns
+    are not known
+
+    Args:
+        func(func): function that returns a dataframe with a team column
+        args(list): additional arguments for the function, can be None
+
+    Returns:
+        str: function name and arguments separated by spaces
+    """
+    name = func.__name__.replace("_", " ")
+    if args:
+        name = " ".join([name] + [str(arg) for arg in args])
+    return name
+
+
+class IndicatorTask:
+    """
+    One team indicator submitted to the indicator pool, records when
+    it starts running so the timeout does not include time spent
+    waiting for a worker
+    """
+
+    def __init__(self, func, args, params, teams):
+        self.func = func
+        self.args = args
+        self.params = params
+        self.teams = teams
+        self.started = None
+        self.seconds = None
+
+    def __call__(self):
+        self.started = time.monotonic()
+        try:
+            return team_indicator(self.func, self.args, self.params, self.teams)
+        finally:
+            self.seconds = time.monotonic() - self.started
+
+    def overdue(self, now):
+        return self.started is not None and now - self.started > team_indicator_timeout
+
+
+def record_timing(name, seconds, status):
+    with _timings_lock:
+        indicator_timings[name] = {"seconds": round(seconds, 4), "status": status}
+
+
+def indicator_stats():
+    """
+    Returns the timings of the most recent run of each team indicator
+
+    Returns:
+        dict: indicator name to a dictionary with seconds and status,
+            status is ok, error or timeout
+    """
+    with _timings_lock:
+        return {name: dict(timing) for name, timing in indicator_timings.items()}
+
+
+def run_team_indicators(params, indicators, teams):
+    """
+    Runs the team indicators in parallel on the indicator pool.
+
+    An indicator that raises an error or runs longer than
+    team_indicator_timeout is returned as None so the rest of the
+    table can still be shown.
+
+    Args:
+        params (tuple): start date and end date in format 'YYYY-MM-DD'
+        indicators(list): (function, args) pairs to run
+        teams(Index): teams the results are lined up on
+
+    Returns:
+        list: DataFrame indexed by teams or None for each indicator,
+            in the order of indicators
+    """
+    tasks = [IndicatorTask(func, args, params, teams) for func, args in indicators]
+    futures = {indicator_pool.submit(task): i for i, task in enumerate(tasks)}
+    results = [None] * len(tasks)
+
+    # a worker held by an indicator that timed out is not returned to the
+    # pool right away, so queued indicators are not waited on forever
+    batches = math.ceil(len(tasks) / team_indicator_workers)
+    deadline = time.monotonic() + team_indicator_timeout * (batches + 1)
+
+    pending = set(futures)
+    while pending:
+        now = time.monotonic()
+        running = [tasks[futures[f]].started for f in pending if tasks[futures[f]].started]
+        next_check = min([deadline] + [started + team_indicator_timeout for started in running])
+        done, pending = wait(pending, timeout=max(next_check - now, 0), return_when=FIRST_COMPLETED)
+
+        for future in done:
+            task = tasks[futures[future]]
+            name = indicator_name(task.func, task.args)
+            try:
+                results[futures[future]] = future.result()
+            except Exception as e:
+                print(f"Team indicator {name} failed: {e}")
+                record_timing(name, task.seconds, "error")
+            else:
+                record_timing(name, task.seconds, "ok")
+
+        now = time.monotonic()
+        for future in list(pending):
+            task = tasks[futures[future]]
+            if task.overdue(now) or now >= deadline:
+                pending.discard(future)
+                future.cancel()
+                name = indicator_name(task.func, task.args)
+                print(f"Team indicator {name} timed out")
+                seconds = now - task.started if task.started else 0
+                record_timing(name, seconds, "timeout")
+
+    return results
+
+
+def team_indicator(func, args, params, teams):
+    """
+    Runs one team indicator function and lines its rows up on the teams,
+    a team returned more than once keeps its first row
+
+    Args:
+        func(func): function that returns a dataframe with a team column
+        args(list): additional arguments for the function, can be None
+        params (tuple): start date and end date in format 'YYYY-MM-DD'
+        teams(Index): teams of the comparison table
+
+    Returns:
+        DataFrame: indicator columns indexed by teams
+    """
+    if args is None:
+        df = func(params)
+    else:
+        df = func(params, *args)
+    df = df.drop_duplicates("team").set_index("team")
+    return df.reindex(teams)
+
+
+def team_metrics(params, indicators=None):
+    """
+    Creates a dataframe with the participants on each team and every
+    team indicator for the indicated time period.
+
+    The teams and their participants come from team_info, the grouped
+    queries of indicators run in parallel and are lined up on those teams
+    and joined with a single concat. The columns of a query that fails
+    are shown as N/A.
+
+    Args:
+        params (tuple): start date and end date in format 'YYYY-MM-DD'
+        indicators(list): (function, args) pairs to include, defaults to
+            all_team_funcs
+
+    Returns:
+        DataFrame: one row per team, a team column followed by the
+            columns of team_columns
+    """
+    if indicators is None:
+        indicators = all_team_funcs
+
+    teams = team_info(params).drop_duplicates("team").set_index("team")
+    results = []
+    for (func, args), df in zip(indicators, run_team_indicators(params, indicators, teams.index)):
+        if df is None:
+            columns = query_columns.get(func, [indicator_name(func, args)])
+            df = pd.DataFrame("N/A", index=teams.index, columns=columns)
+        results.append(df)
+    df = pd.concat([teams] + results, axis=1)
+    columns = [col for col in team_columns if col in df.columns]
+    columns += [col for col in df.columns if col not in columns]
+    return df[columns].reset_index()
+
+
+def comparison_df(params):
+    """
+    Creates a dataframe with rows of indicators
+    and column of team names for the indicated time period.
+
+    Args:
+        params (tuple): start date and end date in format 'YYYY-MM-DD'
+
+    Returns:
+        DataFrame: Indicator column followed by a column for each team
+    """
+    df = team_metrics(params)
+
+    df.columns = [col.title() for col in df.columns]
+    df = df.sort_values("Participants", ascending=False).T
+    df.columns = df.loc["Team"]
+    df.drop("Team", inplace=True)
+    df.fillna(0, inplace=True)
+    df.reset_index(inplace=True)
+    df.rename(columns={"index": "Indicator", None: "None"}, inplace=True)
+
+    return df
+
 
 def create_comparison_table(params, return_df=False):
     """
     Creates dash table with rows of indicators
     and column of team names for the indicated time period.
 
+    The dataframe is cached by time period so the table and the download
+    link only compute it once, a table with an indicator that failed is
+    not kept so the next request tries it again.
+
     params (tuple): start date and end date in format 'YYYY-MM-DD'
     return_df(bool): indicates if the pandas dataframe should be returned
     instead of the dash table
@@ -49,22 +480,10 @@ def create_comparison_table(params, return_df=False):
         DataFrame: pandas dataframe
     """
 
-    df = team.ppts_on_team(params)
-    for func in all_team_funcs:
-        team_summary_func = func[0]
-        args = func[1]
-        if args is None:
-            df = df.merge(team_summary_func(params), on="team", how="left")
-        else:
-            df = df.merge(team_summary_func(params, *args), on="team", how="left")
-
-    df.columns = [col.title() for col in df.columns]
-    df = df.sort_values("Participants", ascending=False).T
-    df.columns = df.loc["Team"]
-    df.drop("Team", inplace=True)
-    df.fillna(0, inplace=True)
-    df.reset_index(inplace=True)
-    df.rename(columns={"index": "Indicator", None: "None"}, inplace=True)
+    df = comparison_cache.get_or_compute(tuple(params), comparison_df, params)
+    if (df == "N/A").any().any():
+        comparison_cache.discard(tuple(params))
+    df = df.copy()
 
     if return_df:
         return df
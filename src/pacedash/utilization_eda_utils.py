@@ -1,14 +1,21 @@
-import sqlite3
+from functools import partial
 import pandas as pd
-import plotly.graph_objs as go
 from .helper_functions import (
     sql_return_df,
-    db_filepath,
     create_center_sql,
     create_join_sql,
     build_bar_layout,
     build_scatter_layout)
-from .settings import color_palette
+from .settings import (
+    color_palette,
+    utl_frame_cache_size,
+    utl_frame_cache_ttl,
+    use_utilization_cube,
+)
+from .cache_utils import DataCache
+from .db_utils import db_pool, table_column_names
+from .figure_utils import figure_trace
+from .cube_utils import cube_tables, cube_dims
 
 from .enrollment_eda_utils import census_count_df
 import textwrap
@@ -90,13 +97,49 @@ additonal_filter_cols = {
 }
 
 
-def create_filter_sql(cols, filter_col_index, filter_val, additional_filter, params):
+def filter_value_mask(series, value):
     """
-    Creates SQL statements to filter a table based on
-    filters selected by the user.
+    Returns a mask of the rows in series equal to a filter value.
+    Filter values arrive as strings, so they are compared as numbers
+    for numeric columns and as strings otherwise, the same way SQLite
+    compares a text parameter with a column.
 
     Args:
-        cols: List of column names to be included in the SQL query
+        series: column of the utilization dataframe
+
+        value: value selected by the user
+
+    Returns:
+        series: boolean mask of matching rows
+    """
+    if pd.api.types.is_numeric_dtype(series):
+        return series == pd.to_numeric(value, errors="coerce")
+    return series.notnull() & (series.astype(str) == str(value))
+
+
+def additional_filter_col(additional_filter):
+    """
+    Returns the column used by an additional filter
+
+    Args:
+        additional_filter: additional filter select by the user, can be None
+
+    Returns:
+        str: column name from additonal_filter_cols, None if there is no filter
+    """
+    return additonal_filter_cols[additional_filter]
+
+
+def filter_frame(df, cols, filter_col_index, filter_val, additional_filter, measure_cols=()):
+    """
+    Filters a utilization dataframe based on filters selected by the user.
+    As with the SQL filters this replaces, the column used by the additional
+    filter is added to cols.
+
+    Args:
+        df: dataframe returned by VisitPlanner.frame
+
+        cols: List of column names to be included in the result
 
         filter_col_index: col list index corresponding to the column
             to be used to filter the table
@@ -106,31 +149,290 @@ def create_filter_sql(cols, filter_col_index, filter_val, additional_filter, par
         additional_filter: additional filter select by the user,
             corresponding column in table got using additional_filter_cols dict
 
-        params: list of parameters for the parameterized query
+        measure_cols: columns kept in the result that are not part of cols,
+            i.e. the counts of the utilization cube
 
     Returns:
-        filter_value_sql: string containing SQL statements that can be added
-        to a query to filter the results using the user input filters
-
-        params: list of parameters for the parameterized query with necessary
-            filter parameters added
+        df: copy of the rows matching the filters
     """
+    mask = pd.Series(True, index=df.index)
     if filter_val is not None:
-        filter_value_sql = f"""AND {cols[filter_col_index]} = ?"""
-        params.extend([f"{filter_val}"])
-    else:
-        filter_value_sql = ""
+        mask &= filter_value_mask(df[cols[filter_col_index]], filter_val)
 
     if additional_filter is not None:
-        adtl_filter_col = additonal_filter_cols[additional_filter]
+        adtl_filter_col = additional_filter_col(additional_filter)
         cols.extend([adtl_filter_col])
-        filter_value_sql += f""" AND {adtl_filter_col} = ?"""
 
         if additional_filter in ["6_mo", "oc", "ss", "visit"]:
-            params.extend([f"{1.0}"])
+            mask &= filter_value_mask(df[adtl_filter_col], f"{1.0}")
         else:
-            params.extend([f"{additional_filter}"])
-    return filter_value_sql, params
+            mask &= filter_value_mask(df[adtl_filter_col], f"{additional_filter}")
+
+    select_cols = list(dict.fromkeys([col for col in cols if col != None] + list(measure_cols)))
+    return df.loc[mask, select_cols].copy()
+
+
+# columns any graph on the utilization EDA page can ask for
+utilization_frame_cols = list(
+    dict.fromkeys(
+        ["admission_date", "discharge_date"]
+        + [col["value"] for col in filter_cols + filter_cols_snf]
+        + [col for col in additonal_filter_cols.values() if col is not None]
+        + ["los", "days_since_last_admission"]
+    )
+)
+
+# rows of a utilization table for a center and date range, shared by
+# utl-graph-one and utl-graph-two which fire together on every change
+utl_frame_cache = DataCache(maxsize=utl_frame_cache_size, ttl=utl_frame_cache_ttl)
+table_columns_cache = DataCache(maxsize=32)
+
+
+def table_columns(table):
+    """
+    Returns the column names of a table in the database
+
+    Args:
+        table: name of the table
+
+    Returns:
+        list: column names in table order
+    """
+
+    def read_columns():
+        with db_pool.connection() as conn:
+            return table_column_names(conn, table)
+
+    return table_columns_cache.get_or_compute(table, read_columns)
+
+
+def utilization_frame_query(utl_type, center, start_date, end_date, columns=table_columns):
+    """
+    Creates the query utilization_frame runs, also explained by
+    index_utils to check its query plan
+
+    Args:
+        utl_type: utilization table, er returns ER visits from
+            er_only and acute
+
+        center: Name of PACE center
+
+        start_date: First date to include in resulting dataframe
+
+        end_date: Last date to include in resulting dataframe
+
+        columns: function that returns the column names of a table
+
+    Returns:
+        tuple: query, parameters and the date columns it selects
+    """
+    if utl_type == "er":
+        available = set(columns("er_only")) & set(columns("acute"))
+    else:
+        available = set(columns(utl_type))
+    cols = [col for col in utilization_frame_cols if col in available]
+    date_cols = [col for col in ["admission_date", "discharge_date"] if col in available]
+
+    params = []
+    for _ in date_cols:
+        params.extend([start_date, end_date])
+    center_sql, params = create_center_sql(center, params)
+
+    if utl_type == "er":
+        join_sql = create_join_sql(center, "U")
+        date_sql = " OR ".join(f"U.{col} BETWEEN ? AND ?" for col in date_cols)
+        query = f"""
+            SELECT {', '.join(f'U.{col}' for col in cols)}
+            FROM (SELECT member_id, {', '.join(cols)} FROM er_only
+            UNION ALL
+            SELECT member_id, {', '.join(cols)} FROM acute
+            WHERE acute.er = 1) AS U
+            {join_sql}
+            WHERE ({date_sql})
+            {center_sql};
+            """
+    else:
+        join_sql = create_join_sql(center, utl_type)
+        date_sql = " OR ".join(f"{utl_type}.{col} BETWEEN ? AND ?" for col in date_cols)
+        query = f"""
+            SELECT {', '.join(f'{utl_type}.{col}' for col in cols)}
+            FROM {utl_type}
+            {join_sql}
+            WHERE ({date_sql})
+            {center_sql};
+            """
+
+    return query, params, date_cols
+
+
+def utilization_frame(utl_type, center, start_date, end_date):
+    """
+    Returns every row of a utilization table admitted or discharged
+    in the date range with the columns used by the utilization EDA
+
+    Args:
+        utl_type: utilization table, er returns ER visits from
+            er_only and acute
+
+        center: Name of PACE center
+
+        start_date: First date to include in resulting dataframe
+
+        end_date: Last date to include in resulting dataframe
+
+    Returns:
+        df: dataframe with the available columns of utilization_frame_cols,
+            date columns parsed as dates
+    """
+    return sql_return_df(*utilization_frame_query(utl_type, center, start_date, end_date))
+
+
+def cube_frame_query(utl_type, date_type, center, start_date, end_date):
+    """
+    Creates the query cube_frame runs
+
+    Args:
+        utl_type: utilization table
+
+        date_type: admission_date or discharge_date
+
+        center: Name of PACE center
+
+        start_date: First date to include in resulting dataframe
+
+        end_date: Last date to include in resulting dataframe
+
+    Returns:
+        tuple: query, parameters and the date columns it selects
+    """
+    query = f"""
+        SELECT month AS {date_type}, {', '.join(cube_dims)},
+        visits, los_sum, los_n, readmits
+        FROM utilization_cube
+        WHERE utl_type = ?
+        AND date_type = ?
+        AND center = ?
+        AND month BETWEEN ? AND ?;
+        """
+    return query, [utl_type, date_type, center, start_date, end_date], [date_type]
+
+
+def cube_frame(utl_type, date_type, center, start_date, end_date):
+    """
+    Returns the rows of the utilization cube for a table, date type,
+    center and date range
+
+    Args:
+        utl_type: utilization table
+
+        date_type: admission_date or discharge_date, the date the
+            cube rows were counted by
+
+        center: Name of PACE center
+
+        start_date: First date to include in resulting dataframe
+
+        end_date: Last date to include in resulting dataframe
+
+    Returns:
+        df: one row per month and combination of the cube dimensions, the
+            month is in a column named after date_type. visits is the number
+            of visits, los_sum and los_n the sum and count of length of
+            stay and readmits the number of 30 day readmissions
+    """
+    return sql_return_df(*cube_frame_query(utl_type, date_type, center, start_date, end_date))
+
+
+class VisitPlanner:
+    """
+    Request scoped query planner for the utilization EDA.
+
+    The visit, total, length of stay, readmit and column order dataframes
+    used to build a graph are all cut from the same rows of a utilization
+    table. The planner gets those rows once per table from
+    utilization_frame, through a short lived cache so the two graphs on the
+    page share one query, and the builders derive each view in pandas.
+
+    Args:
+        center: Name of PACE center
+
+        start_date: First date to include in the dataframes
+
+        end_date: Last date to include in the dataframes
+    """
+
+    def __init__(self, center, start_date, end_date):
+        self.center = center
+        self.start_date = pd.to_datetime(start_date).date()
+        self.end_date = pd.to_datetime(end_date).date()
+        self._frames = {}
+
+    def frame(self, utl_type, date_col, cols):
+        """
+        Returns all rows of a utilization table with date_col in the date range
+
+        Args:
+            utl_type: utilization table, er returns ER visits from
+                er_only and acute
+
+            date_col: date column used to limit rows to the date range
+
+            cols: List of column names needed from the table
+
+        Returns:
+            df: dataframe with the requested columns, date_col parsed as dates
+        """
+        df = self._frames.get(utl_type)
+        if df is None:
+            df = utl_frame_cache.get_or_compute(
+                (utl_type, self.center, self.start_date, self.end_date),
+                utilization_frame,
+                utl_type,
+                self.center,
+                self.start_date,
+                self.end_date,
+            )
+            self._frames[utl_type] = df
+
+        cols = list(dict.fromkeys([date_col] + [col for col in cols if col != None]))
+        in_range = df[date_col].between(
+            pd.Timestamp(self.start_date), pd.Timestamp(self.end_date)
+        )
+        return df.loc[in_range, cols]
+
+    def cube(self, utl_type, date_type, cols):
+        """
+        Returns the utilization cube rows for a table and date type
+
+        Args:
+            utl_type: utilization table
+
+            date_type: admission_date or discharge_date
+
+            cols: List of column names needed from the table, including
+                the filter columns
+
+        Returns:
+            df: dataframe from cube_frame, None if the cube is turned off,
+                not built, does not cover the table or is missing one of
+                the columns, the raw rows are used instead
+        """
+        if not use_utilization_cube or utl_type not in cube_tables:
+            return None
+        if set(col for col in cols if col not in (None, date_type)) - set(cube_dims):
+            return None
+        if not table_columns("utilization_cube"):
+            return None
+
+        return utl_frame_cache.get_or_compute(
+            ("cube", utl_type, date_type, self.center, self.start_date, self.end_date),
+            cube_frame,
+            utl_type,
+            date_type,
+            self.center,
+            self.start_date,
+            self.end_date,
+        )
 
 
 def build_visit_query(
@@ -143,6 +445,7 @@ def build_visit_query(
     freq,
     col_filter,
     additional_filter,
+    planner=None,
 ):
     """
     Creates dataframe of specific utilization related visits.
@@ -178,50 +481,34 @@ def build_visit_query(
             second can be an additional filter corresponding to a different column.
             These value column pairs are in additonal_filter_cols
 
+        planner: VisitPlanner shared by the dataframes of one graph,
+            a new one is used if None
+
     Returns:
         df: dataframe of visit data to be used for plotting
     """
-    params = [pd.to_datetime(start_date).date(), pd.to_datetime(end_date).date()]
-
-    filter_value_sql, params = create_filter_sql(
-        cols, 1, col_filter, additional_filter, params
-    )
-
-    center_sql, params = create_center_sql(center, params)
-    join_sql = create_join_sql(center, utl_type)
-
-    if utl_type == "er":
-        query = f"""
-            SELECT *
-            FROM (SELECT {', '.join(col for col in cols if col!=None)} FROM er_only
-            UNION ALL
-            SELECT {', '.join(col for col in cols if col!=None)} FROM acute
-            WHERE acute.er = 1) AS U
-            {join_sql}
-            WHERE U.{date_type} BETWEEN ? AND ?
-            {filter_value_sql}
-            {center_sql};
-            """
+    if planner is None:
+        planner = VisitPlanner(center, start_date, end_date)
 
+    cube = planner.cube(utl_type, date_type, cols + [additional_filter_col(additional_filter)])
+    if cube is not None:
+        df = filter_frame(cube, cols, 1, col_filter, additional_filter, ["visits"])
+        counts = df.pop("visits")
     else:
-        query = f"""
-            SELECT {', '.join(col for col in cols if col!=None)}
-            FROM {utl_type}
-            {join_sql}
-            WHERE {date_type} BETWEEN ? AND ?
-            {filter_value_sql}
-            {center_sql};
-            """
+        frame = planner.frame(
+            utl_type, date_type, cols + [additional_filter_col(additional_filter)]
+        )
+        df = filter_frame(frame, cols, 1, col_filter, additional_filter)
+        counts = 1
 
-    df = sql_return_df(query, params, [date_type])
     df['date_bby'] = df[date_type].copy()
     df[date_type] = df[date_type].dt.to_period(freq[0])
-    df["count"] = 1
+    df["count"] = counts
     return df
 
 
 def build_los_query(
-    utl_type, cols, center, start_date, end_date, freq, col_filter, additional_filter
+    utl_type, cols, center, start_date, end_date, freq, col_filter, additional_filter, planner=None
 ):
     """
     Creates dataframe of specific utilization related length of stay data.
@@ -253,44 +540,43 @@ def build_los_query(
             be an additional filter corresponding to a different column. These value
             column pairs are in additonal_filter_cols
 
+        planner: VisitPlanner shared by the dataframes of one graph,
+            a new one is used if None
+
     Returns:
         df: dataframe of length of stay data to be used for plotting
     """
-
-    params = [pd.to_datetime(start_date).date(), pd.to_datetime(end_date).date()]
+    if planner is None:
+        planner = VisitPlanner(center, start_date, end_date)
 
     sql_cols = cols.copy()
     sql_cols.append("los")
 
+    # length of stay for ER visits comes from the acute table
     if (utl_type == "er_only"):
         utl_type = "acute"
-        admission_sql = "AND er = 1"
-    else:
-        admission_sql = ''
 
-    filter_value_sql, params = create_filter_sql(
-        sql_cols, 1, col_filter, additional_filter, params
+    cube = planner.cube(
+        utl_type, "discharge_date", cols + [additional_filter_col(additional_filter)]
     )
+    if cube is not None:
+        # the mean is taken from the sums and counts, see filter_col_df_mean
+        df = filter_frame(
+            cube, cols.copy(), 1, col_filter, additional_filter, ["los_sum", "los_n"]
+        )
+    else:
+        frame = planner.frame(
+            utl_type, "discharge_date", sql_cols + [additional_filter_col(additional_filter)]
+        )
+        df = filter_frame(frame, sql_cols, 1, col_filter, additional_filter)
 
-    center_sql, params = create_center_sql(center, params)
-    join_sql = create_join_sql(center, utl_type)
-
-    query = f"""
-            SELECT {', '.join(col for col in sql_cols if col!=None)}
-            FROM {utl_type}
-            {join_sql}
-            WHERE discharge_date BETWEEN ? AND ?
-            {filter_value_sql}
-            {center_sql};
-            """
-    df = sql_return_df(query, params, ["discharge_date"])
     df["discharge_date"] = df["discharge_date"].dt.to_period(freq[0])
 
     return df
 
 
 def build_readmit_query(
-    utl_type, cols, center, start_date, end_date, freq, col_filter, additional_filter
+    utl_type, cols, center, start_date, end_date, freq, col_filter, additional_filter, planner=None
 ):
     """
      Creates dataframe of specific utilization related 30 day readmission data.
@@ -322,39 +608,40 @@ def build_readmit_query(
              can be None or be a value from a column different from the filter column.
              These value column pairs are found in the additonal_filter_cols dictionary
 
+         planner: VisitPlanner shared by the dataframes of one graph,
+             a new one is used if None
+
      Returns:
          df: dataframe of 30 day readmission data to be used for plotting
      """
-
-    params = [pd.to_datetime(start_date).date(), pd.to_datetime(end_date).date()]
+    if planner is None:
+        planner = VisitPlanner(center, start_date, end_date)
 
     sql_cols = cols.copy()
     sql_cols.append("days_since_last_admission")
 
-    filter_value_sql, params = create_filter_sql(
-        sql_cols, 1, col_filter, additional_filter, params
+    cube = planner.cube(
+        utl_type, "admission_date", cols + [additional_filter_col(additional_filter)]
     )
+    if cube is not None:
+        df = filter_frame(cube, cols.copy(), 1, col_filter, additional_filter, ["readmits"])
+        df = df[df["readmits"] > 0].copy()
+        counts = df.pop("readmits")
+    else:
+        frame = planner.frame(
+            utl_type, "admission_date", sql_cols + [additional_filter_col(additional_filter)]
+        )
+        df = filter_frame(frame, sql_cols, 1, col_filter, additional_filter)
+        df = df[df["days_since_last_admission"] <= 30].copy()
+        counts = 1
 
-    center_sql, params = create_center_sql(center, params)
-    join_sql = create_join_sql(center, utl_type)
-
-    query = f"""
-        SELECT {', '.join(col for col in sql_cols if col!=None)}
-        FROM {utl_type}
-        {join_sql}
-        WHERE admission_date BETWEEN ? AND ?
-        AND days_since_last_admission <= 30
-        {filter_value_sql}
-        {center_sql};
-        """
-    df = sql_return_df(query, params, ["admission_date"])
     df["admission_date"] = df["admission_date"].dt.to_period(freq[0])
-    df["count"] = 1
+    df["count"] = counts
 
     return df
 
 
-def col_order(utl_type, cols, center, start_date, end_date, freq, additional_filters=[None, None]):
+def col_order(utl_type, cols, center, start_date, end_date, freq, additional_filters=[None, None], planner=None):
     """
     Creates list with column names in the order they should be plotted. Allows colors to match from one
     graph to another.
@@ -380,6 +667,9 @@ def col_order(utl_type, cols, center, start_date, end_date, freq, additional_fil
             be an additional filter corresponding to a different column. These value
             column pairs are in additonal_filter_cols
 
+        planner: VisitPlanner of the graph, lets the order come from
+            rows that were already fetched
+
     Returns:
         plot_cols: list of column names in order they were plotted in the visit graph
     """
@@ -397,8 +687,8 @@ def col_order(utl_type, cols, center, start_date, end_date, freq, additional_fil
         freq,
         additional_filters[0],
         additional_filters[1],
+        planner,
     )
-    df["count"] = 1
 
     plot_df = df.groupby(cols).sum()["count"].unstack(0).T.reset_index()
     plot_cols = (
@@ -471,13 +761,21 @@ def filter_col_df_mean(cols, filter_col, additional_filters, df, summary_col):
         plot_df: grouped dataframe for plotting
         plot_cols: column of the dataframe to be included in plot
     """
+    if f"{summary_col}_n" in df.columns:
+        # rows from the utilization cube hold a sum and a count
+        # for each group instead of one row per visit
+        sums = df.groupby(cols)[[f"{summary_col}_sum", f"{summary_col}_n"]].sum()
+        means = (sums[f"{summary_col}_sum"] / sums[f"{summary_col}_n"]).rename(summary_col)
+    else:
+        means = df.groupby(cols).mean()[summary_col]
+
     if ((filter_col != None) and (additional_filters[1] != None)) or (
         filter_col == None
     ):
-        plot_df = df.groupby(cols).mean()[summary_col].reset_index()
+        plot_df = means.reset_index()
 
     elif filter_col != None:
-        plot_df = df.groupby(cols).mean()[summary_col].unstack(0).T.reset_index()
+        plot_df = means.unstack(0).T.reset_index()
 
     return plot_df
 
@@ -621,9 +919,9 @@ def update_visit_graph(
     filtered_flag = filter_col != None
     bar_flag = graph_type == 'bar'
     if bar_flag:
-        chart_func = go.Bar
+        chart_func = partial(figure_trace, "bar")
     else:
-        chart_func = go.Scatter
+        chart_func = partial(figure_trace, "scatter")
 
     if (utl_type == "er_only") or (utl_type == "er"):
         date_type = "admission_date"
@@ -632,6 +930,8 @@ def update_visit_graph(
 
     if filtered_flag:
         cols.extend([filter_col])
+
+    planner = VisitPlanner(center, start_date, end_date)
     df = build_visit_query(
         utl_type,
         date_type,
@@ -642,6 +942,7 @@ def update_visit_graph(
         freq,
         additional_filters[0],
         additional_filters[1],
+        planner,
     )
 
     if df.empty:
@@ -653,7 +954,7 @@ def update_visit_graph(
 
     if filtered_flag:
         total_df = build_visit_query(
-            utl_type, date_type, cols, center, start_date, end_date, freq, None, None
+            utl_type, date_type, cols, center, start_date, end_date, freq, None, None, planner
         )
         plot_df = add_total_to_plotdf(total_df, plot_df, date_type, freq)
 
@@ -669,7 +970,7 @@ def update_visit_graph(
                     x=plot_df[date_type].astype(str),
                     y=round((plot_df[col] / plot_df["total_count"]) * 100, 2),
                     name='<br>'.join(textwrap.wrap(titlecase(str(name)), width=15)),
-                    text=[f"{p}%({v})" for p, v in zip(round((plot_df[col] / plot_df["total_count"]) * 100, 2), plot_df[col])],
+                    text=[f"{p}% ({v})" for p, v in zip(round((plot_df[col] / plot_df["total_count"]) * 100, 2), plot_df[col])],
                     hoverinfo="x+name+text",
                     marker=dict(color=color),
                 )
@@ -751,14 +1052,15 @@ def update_los_graph(
     filtered_flag = filter_col != None
     bar_flag = graph_type == 'bar'
     if bar_flag:
-        chart_func = go.Bar
+        chart_func = partial(figure_trace, "bar")
     else:
-        chart_func = go.Scatter
+        chart_func = partial(figure_trace, "scatter")
     cols = ["discharge_date"]
 
     if filtered_flag:
         cols.extend([filter_col])
 
+    planner = VisitPlanner(center, start_date, end_date)
     df = build_los_query(
         utl_type,
         cols,
@@ -768,6 +1070,7 @@ def update_los_graph(
         freq,
         additional_filters[0],
         additional_filters[1],
+        planner,
     )
     if df.empty:
         return dict(data=[], layout=build_bar_layout("Utilization Visits"))
@@ -781,6 +1084,7 @@ def update_los_graph(
             end_date,
             freq,
             additional_filters,
+            planner,
         )
         set_col_order = True
     else:
@@ -897,14 +1201,15 @@ def update_readmit_graph(
     filtered_flag = filter_col != None
     bar_flag = graph_type == 'bar'
     if bar_flag:
-        chart_func = go.Bar
+        chart_func = partial(figure_trace, "bar")
     else:
-        chart_func = go.Scatter
+        chart_func = partial(figure_trace, "scatter")
     cols = ["admission_date"]
 
     if filtered_flag:
         cols.extend([filter_col])
 
+    planner = VisitPlanner(center, start_date, end_date)
     df = build_readmit_query(
         utl_type,
         cols,
@@ -914,6 +1219,7 @@ def update_readmit_graph(
         freq,
         additional_filters[0],
         additional_filters[1],
+        planner,
     )
     if df.empty:
         return dict(data=[], layout=build_bar_layout("Utilization Visits"))
@@ -927,6 +1233,7 @@ def update_readmit_graph(
             end_date,
             freq,
             additional_filters,
+            planner,
         )
         set_col_order = True
     else:
@@ -0,0 +1,120 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+from .helper_functions import card_values, default_dates, graph_plot_df, time_range_dict
+from .team_utils import create_comparison_table
+from .settings import warmup_workers
+
+# Cache warmup
+# After a refresh every cache is empty and the first user to open a page
+# waits for all of its cards. Warmup walks the routes in index.urls and
+# fills the card, sparkline and team table caches for every time range
+# button, and the graph cache for the default graph each card and team
+# table row links to, in the background so the dashboard keeps serving
+# requests.
+
+
+def warmup_tasks():
+    """
+    Lists the cache filling work for every routed page and time range
+
+    Returns:
+        list: tuples of description, function and arguments
+    """
+    # index imports every page, it is imported here so this module
+    # can be used by app.py before the pages are loaded
+    from . import index
+
+    tasks = []
+    seen = set()
+    graphs = []
+    for route, name in index.urls:
+        if name in seen:
+            continue
+        seen.add(name)
+        module = index.pages[name]
+
+        for card in getattr(module, "cards", {}).values():
+            if isinstance(card, dict):
+                graphs.append(f"{card['agg_table']}-{card['agg_col']}")
+        graphs.extend(getattr(module, "indictors_to_url", {}).values())
+
+        for time_range in time_range_dict:
+            if hasattr(module, "cards"):
+                tasks.append(
+                    (f"{route or '/'} cards {time_range}", card_values, (time_range, module.cards))
+                )
+            if name == "teams":
+                tasks.append(
+                    (f"{route} table {time_range}", warm_team_table, (time_range,))
+                )
+
+    for graph in dict.fromkeys(graphs):
+        tasks.append((f"/{graph} graph", warm_default_graph, (graph,)))
+    return tasks
+
+
+def warm_team_table(time_range):
+    """
+    Fills the team comparison cache for a time range
+
+    Args:
+        time_range(str): key of time_range_dict
+    """
+    params = time_range_dict[time_range][0]()
+    create_comparison_table(params, return_df=True)
+
+
+def warm_default_graph(graph):
+    """
+    Fills the graph cache for an agg table and column with the dates and
+    monthly frequency the default graph page opens with
+
+    Args:
+        graph(str): agg table and column separated by a dash, the
+            pathname of the default graph page without the slash
+    """
+    table, col = graph.split("-")
+    params = tuple(pd.to_datetime(date).strftime("%Y-%m-%d") for date in default_dates())
+    graph_plot_df(table, col, params)
+
+
+def warmup(workers=warmup_workers):
+    """
+    Runs every warmup task on a pool of threads and prints how long
+    warmup took, a task that fails is printed and skipped
+
+    Args:
+        workers(int): number of threads
+
+    Returns:
+        dict: seconds warmup took, number of tasks and failed task descriptions
+    """
+    start = time.perf_counter()
+    tasks = warmup_tasks()
+    failed = []
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="warmup") as pool:
+        futures = [(description, pool.submit(func, *args)) for description, func, args in tasks]
+        for description, future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                print(f"Warmup of {description} failed: {e}")
+                failed.append(description)
+
+    seconds = time.perf_counter() - start
+    print(f"Warmed {len(tasks) - len(failed)} of {len(tasks)} caches in {seconds:.1f}s")
+    return {"seconds": seconds, "tasks": len(tasks), "failed": failed}
+
+
+def warm_caches():
+    """
+    Starts warmup in a background thread
+
+    Returns:
+        Thread: the warmup thread
+    """
+    thread = threading.Thread(target=warmup, name="cache-warmup", daemon=True)
+    thread.start()
+    return thread
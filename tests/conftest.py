@@ -0,0 +1,47 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+repo_root = Path(__file__).resolve().parents[1]
+
+###small synthetic database shared by the tests, built once per session
+###with benchmarks/synthetic_db.py, the dashboard modules read their paths
+###from PACEDASH_DB and PACEDASH_AGG_DB when they are first imported
+fixture_dir = Path(os.environ.get("PACEDASH_TEST_DATA", repo_root / "tests" / ".data"))
+fixture_end_date = "2025-06-30"
+
+
+def build_fixture_db():
+    if not (fixture_dir / "PaceDashboard.db").exists():
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "benchmarks.synthetic_db",
+                "--participants",
+                "300",
+                "--years",
+                "2",
+                "--end-date",
+                fixture_end_date,
+                "--out-dir",
+                str(fixture_dir),
+                "--no-prepare",
+            ],
+            cwd=repo_root,
+            check=True,
+        )
+    os.environ["PACEDASH_DB"] = str(fixture_dir / "PaceDashboard.db")
+    os.environ["PACEDASH_AGG_DB"] = str(fixture_dir / "agg.db")
+
+
+build_fixture_db()
+sys.path.insert(0, str(repo_root))
+
+
+@pytest.fixture
+def fixture_db():
+    return os.environ["PACEDASH_DB"]
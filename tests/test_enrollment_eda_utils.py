@@ -0,0 +1,42 @@
+import sqlite3
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("paceutils")
+pytest.importorskip("plotly")
+
+from src.pacedash import enrollment_eda_utils  # noqa: E402
+
+# the date pickers send dates as MM/DD/YYYY
+start_date, end_date = "07/01/2024", "06/30/2025"
+
+
+def census_on(db, first, center):
+    query = """
+        SELECT COUNT(*) FROM enrollment
+        JOIN centers ON enrollment.member_id = centers.member_id
+        WHERE enrollment_date <= ?
+        AND (disenrollment_date >= ? OR disenrollment_date IS NULL)
+        AND (centers.center = ? OR ? = 'all')
+    """
+    with sqlite3.connect(db) as conn:
+        return conn.execute(query, [first, first, center, center]).fetchone()[0]
+
+
+@pytest.mark.parametrize("center", ["all", "Providence", "Westerly"])
+def test_census_count_df_is_filtered_by_center(fixture_db, center):
+    df = enrollment_eda_utils.census_count_df(center, start_date, end_date, "MS")
+    expected = [
+        census_on(fixture_db, first.strftime("%Y-%m-%d"), center) for first in df["Freq"]
+    ]
+    assert df["Census"].tolist() == expected
+
+
+def test_center_census_adds_up_to_all():
+    by_center = [
+        enrollment_eda_utils.census_count_df(center, start_date, end_date, "QS")["Census"]
+        for center in ["Providence", "Westerly", "Woonsocket"]
+    ]
+    total = enrollment_eda_utils.census_count_df("all", start_date, end_date, "QS")["Census"]
+    pd.testing.assert_series_equal(sum(by_center), total, check_names=False)
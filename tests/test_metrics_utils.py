@@ -0,0 +1,52 @@
+import json
+
+import pytest
+
+dash = pytest.importorskip("dash")
+html = pytest.importorskip("dash_html_components")
+from dash.dependencies import Input, Output  # noqa: E402
+
+from src.pacedash import metrics_utils  # noqa: E402
+
+
+@pytest.fixture
+def app():
+    app = dash.Dash(__name__)
+    app.layout = html.Div([html.Div(id="source", children="x"), html.Div(id="target")])
+    metrics_utils.instrument_callbacks(app)
+
+    @app.callback(Output("target", "children"), [Input("source", "children")])
+    def echo(value):
+        return value * 1000
+
+    yield app
+    metrics_utils.callback_metrics.pop("target.children", None)
+
+
+def test_callback_payload_is_measured(app):
+    payload = {
+        "output": {"id": "target", "property": "children"},
+        "inputs": [{"id": "source", "property": "children", "value": "x"}],
+        "changedPropIds": ["source.children"],
+    }
+    client = app.server.test_client()
+    response = client.post(
+        "/_dash-update-component",
+        data=json.dumps(payload),
+        content_type="application/json",
+    )
+    assert response.status_code == 200
+
+    metrics = metrics_utils.callback_metrics["target.children"]
+    assert metrics.wall.count == 1
+    assert metrics.payload.count == 1
+    assert metrics.payload.sum == len(response.get_data())
+
+
+def test_response_size():
+    from flask import Response
+
+    assert metrics_utils.response_size(Response("abc")) == 3
+    assert metrics_utils.response_size("é") == 2
+    assert metrics_utils.response_size(b"abcd") == 4
+    assert metrics_utils.response_size(None) is None
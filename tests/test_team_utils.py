@@ -0,0 +1,71 @@
+import pandas as pd
+import pytest
+
+paceutils = pytest.importorskip("paceutils")
+pytest.importorskip("dash_table")
+
+from src.pacedash import team_utils  # noqa: E402
+
+params = ("2025-01-01", "2025-03-31")
+
+# paceutils.Team function and args for each grouped query column, the
+# functions the comparison table was built from before the grouped queries
+paceutils_columns = {
+    "participants": ("ppts_on_team", None),
+    "acute admissions": ("admissions_by_team", ["acute"]),
+    "er_only": ("er_only_visits_by_team", None),
+    "psych admissions": ("admissions_by_team", ["psych"]),
+    "custodial days": ("days_by_team", ["custodial"]),
+    "respite days": ("days_by_team", ["respite"]),
+    "skilled days": ("days_by_team", ["skilled"]),
+    "acute discharges": ("discharges_by_team", ["acute"]),
+    "acute alos": ("alos_for_discharges_by_team", ["acute"]),
+    "acute 30 day readmits": ("readmits_by_team", ["acute", 30]),
+    "age": ("avg_age_by_team", None),
+    "percent non english": ("percent_primary_non_english_by_team", None),
+    "avg_years_enrolled": ("avg_years_enrolled_by_team", None),
+    "ppts in custodial": ("ppts_in_custodial_by_team", None),
+    "mortality rate": ("mortality_by_team", None),
+    "% of discharges with death within 30 days": (
+        "percent_of_discharges_with_mortality_in_30_by_team",
+        None,
+    ),
+    "death within 30 days of discharge date": (
+        "mortality_within_30days_of_discharge_rate_by_team",
+        None,
+    ),
+    "percent with no admissions since enrollment": (
+        "no_hosp_admission_since_enrollment_by_team",
+        None,
+    ),
+    "wound rate": ("pressure_ulcer_rate_by_team", None),
+}
+for incident in team_utils.team_incident_types:
+    paceutils_columns[incident] = ("total_incidents_by_team", [incident])
+    paceutils_columns[f"{incident} per 100 ppts"] = ("incidents_per_member_by_team", [incident])
+    paceutils_columns[f"individuals w/ {incident}"] = ("ppts_w_incident_by_team", [incident])
+
+
+@pytest.fixture(scope="module")
+def grouped_df():
+    return team_utils.team_metrics(params).set_index("team")
+
+
+def test_every_column_is_compared():
+    assert set(paceutils_columns) == set(team_utils.team_columns)
+
+
+@pytest.mark.parametrize("column", team_utils.team_columns)
+def test_column_matches_paceutils(fixture_db, grouped_df, column):
+    func_name, args = paceutils_columns[column]
+    func = getattr(paceutils.Team(fixture_db), func_name)
+    expected = func(params, *(args or [])).drop_duplicates("team").set_index("team")
+    expected = expected.iloc[:, 0].reindex(grouped_df.index).fillna(0)
+    actual = pd.to_numeric(grouped_df[column]).fillna(0)
+
+    pd.testing.assert_series_equal(
+        actual.astype(float),
+        expected.astype(float),
+        check_names=False,
+        atol=0.01,
+    )